@@ -1,31 +1,25 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import asyncio
+import atexit
 import logging
+import os
+import time
+import uuid
 from datetime import datetime
+from config import settings
 
 # Import scraper components
-from scraper.core.browser_manager import BrowserManager
+from scraper.core.browser_pool import BrowserPool
 from scraper.core.exporter import Exporter
-from scraper.categories.biography.wikipedia import WikipediaScraper
-from scraper.categories.politics.bbc import BBCScraper
-from scraper.categories.health.healthline import HealthlineScraper
-from scraper.categories.bollywood.filmibeat import FilmiBeatScraper
-# New Imports
-from scraper.categories.bollywood.bollywoodhungama import BollywoodHungamaScraper
-from scraper.categories.bollywood.imdb import IMDbScraper
-from scraper.categories.health.who import WHOScraper
-from scraper.categories.health.nih import NIHScraper
-from scraper.categories.fitness.healthline_fitness import HealthlineFitnessScraper
-from scraper.categories.fitness.menshealth import MensHealthScraper
-from scraper.categories.technology.gadgets360 import Gadgets360Scraper
-from scraper.categories.sports.espncricinfo import ESPNCricinfoScraper
-from scraper.categories.sports.sportskeeda import SportskeedaScraper
-from scraper.categories.travel.lonelyplanet import LonelyPlanetScraper
-from scraper.categories.fashion.fashionunited import FashionUnitedScraper
-from scraper.categories.business.business_insider import BusinessInsiderScraper
-from scraper.categories.entertainment.people import PeopleScraper
-from scraper.categories.real_estate import DubizzleScraper, BayutScraper, PropertyFinderScraper, EmaarScraper
+from scraper.core.http_client import close_session
+from scraper.core.jobs import JobManager, JobRejected, format_event
+from scraper.core import metrics
+from scraper.core.result_cache import ResultCache
+from scraper.core.result_store import get_result_store
+from scraper.core.snapshot import shutdown_parse_executor
+from scraper.core.politeness import politeness_stats
+from scraper.registry import SCRAPER_CLASSES, CATEGORY_WEBSITES
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -35,79 +29,29 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend communication
 
-# Scraper Class Mapping
-SCRAPER_CLASSES = {
-    "wikipedia": WikipediaScraper,
-    "bbc": BBCScraper,
-    "healthline": HealthlineScraper,
-    "filmibeat": FilmiBeatScraper,
-    "bollywoodhungama": BollywoodHungamaScraper,
-    "imdb": IMDbScraper,
-    "who": WHOScraper,
-    "nih": NIHScraper,
-    "healthline_fitness": HealthlineFitnessScraper,
-    "menshealth": MensHealthScraper,
-    "gadgets360": Gadgets360Scraper,
-    "espncricinfo": ESPNCricinfoScraper,
-    "sportskeeda": SportskeedaScraper,
-    "lonelyplanet": LonelyPlanetScraper,
-    "fashionunited": FashionUnitedScraper,
-    "business_insider": BusinessInsiderScraper,
-    "people": PeopleScraper,
-    "dubizzle": DubizzleScraper,
-    "bayut": BayutScraper,
-    "property_finder": PropertyFinderScraper,
-    "emaar": EmaarScraper
-}
-
-# Category to Website Mapping
-CATEGORY_WEBSITES = {
-    "biography": [
-        {"name": "Wikipedia", "url": "https://en.wikipedia.org/wiki/Main_Page", "scraper": "wikipedia"}
-    ],
-    "bollywood": [
-        {"name": "FilmiBeat", "url": "https://www.filmibeat.com/", "scraper": "filmibeat"},
-        {"name": "Bollywood Hungama", "url": "https://www.bollywoodhungama.com/", "scraper": "bollywoodhungama"},
-        {"name": "IMDb", "url": "https://www.imdb.com/", "scraper": "imdb"}
-    ],
-    "politics": [
-        {"name": "BBC", "url": "https://www.bbc.com/", "scraper": "bbc"}
-    ],
-    "health": [
-        {"name": "WHO", "url": "https://www.who.int/", "scraper": "who"},
-        {"name": "NIH", "url": "https://www.nih.gov/", "scraper": "nih"},
-        {"name": "Healthline", "url": "https://www.healthline.com/", "scraper": "healthline"}
-    ],
-    "fitness": [
-        {"name": "Healthline Fitness", "url": "https://www.healthline.com/fitness", "scraper": "healthline_fitness"},
-        {"name": "Men's Health", "url": "https://www.menshealth.com/", "scraper": "menshealth"}
-    ],
-    "technology": [
-        {"name": "Gadgets 360", "url": "https://www.gadgets360.com/", "scraper": "gadgets360"}
-    ],
-    "sports": [
-        {"name": "ESPN Cricinfo", "url": "https://www.espncricinfo.com/", "scraper": "espncricinfo"},
-        {"name": "Sportskeeda", "url": "https://www.sportskeeda.com/", "scraper": "sportskeeda"}
-    ],
-    "travel": [
-        {"name": "Lonely Planet", "url": "https://www.lonelyplanet.com/", "scraper": "lonelyplanet"}
-    ],
-    "fashion": [
-        {"name": "Fashion United", "url": "https://fashionunited.in/news/fashion", "scraper": "fashionunited"}
-    ],
-    "business": [
-        {"name": "Business Insider", "url": "https://www.businessinsider.com/", "scraper": "business_insider"}
-    ],
-    "entertainment": [
-        {"name": "People", "url": "https://people.com/", "scraper": "people"}
-    ],
-    "real_estate": [
-        {"name": "Dubizzle UAE", "url": "https://dubai.dubizzle.com/en/property-for-sale/residential/", "scraper": "dubizzle"},
-        {"name": "Bayut", "url": "https://www.bayut.com/for-sale/property/uae/", "scraper": "bayut"},
-        {"name": "Property Finder UAE", "url": "https://www.propertyfinder.ae/en/search?c=2&fu=0&rp=y&ob=mr", "scraper": "property_finder"},
-        {"name": "Emaar Properties", "url": "https://properties.emaar.com/en/our-communities/", "scraper": "emaar"}
-    ]
-}
+# Shared Chromium pool, leased per scrape request. Started at boot by __main__,
+# or on first use when the app runs under `flask run` or a WSGI server.
+browser_pool = BrowserPool(headless=False)
+
+# Scrape jobs run in the background on the browser pool's event loop
+job_manager = JobManager(browser_pool.submit)
+
+# Requests for the same site share one run, and its result for the scraper's RESULT_TTL
+result_cache = ResultCache()
+
+# Run last written to each output file, and a lock per file (see export_result)
+_exported = {}
+_export_locks = {}
+
+# Pool occupancy and queue depth, read when /metrics is scraped
+metrics.Gauge("scraper_browser_pool_browsers", "Chromium processes in the server's pool",
+              collect=lambda: len(browser_pool.browsers))
+metrics.Gauge("scraper_browser_pool_leased_pages", "Pages open in the server's pool (leases and detail pages)",
+              collect=lambda: browser_pool.open_pages)
+metrics.Gauge("scraper_browser_pool_capacity", "Pages the server's pool can have open at once",
+              collect=lambda: browser_pool.max_pages)
+metrics.Gauge("scraper_jobs", "Scrape jobs by state (queue depth)", ["state"],
+              collect=lambda: {(state,): count for state, count in job_manager.stats().items() if state in ("queued", "running")})
 
 @app.route('/api/categories', methods=['GET'])
 def get_categories():
@@ -141,45 +85,52 @@ def get_websites_by_category(category):
 @app.route('/api/scrape', methods=['POST'])
 def scrape():
     """
-    Main scraping endpoint
+    Main scraping endpoint: starts a background job and returns its id right away (202).
+    Poll GET /api/jobs/<job_id> for progress and results.
     Expected JSON payload:
     {
         "category": "biography",
         "websites": ["wikipedia"],
         "dataTypes": ["text", "images"],
-        "outputFormat": "csv"
+        "outputFormat": "csv",
+        "incremental": false,
+        "refresh": false,
+        "wait": false,
+        "stream": "sse" | "ndjson"
     }
+    "incremental" makes feed-style scrapers stop at content earlier runs already
+    returned (defaults to settings.INCREMENTAL_CRAWL).
+    "refresh" skips cached site results (an identical run already in progress is still shared).
+    "wait" blocks until the job finishes and responds with its results, as before.
+    "stream" responds with the job's events instead, as they happen (see stream_job).
+    Jobs beyond the admission limits (settings.JOB_MAX_RUNNING, JOB_QUEUE_SIZE,
+    JOB_MAX_PER_CLIENT) get a 429 with Retry-After; queued jobs report their
+    queue_position and estimated_wait_seconds.
     """
     try:
         data = request.json
-        
-        # Validate input
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-        
-        category = data.get('category')
-        websites = data.get('websites', [])
-        data_types = data.get('dataTypes', ['text'])
-        output_format = data.get('outputFormat', 'csv')
-        
-        if not category:
-            return jsonify({"success": False, "error": "Category is required"}), 400
-        
-        if not websites:
-            return jsonify({"success": False, "error": "At least one website must be selected"}), 400
-        
-        logger.info(f"Scraping request: category={category}, websites={websites}")
-        
-        # Run scraping in async context
-        results = asyncio.run(run_scraping(category, websites, data_types, output_format))
-        
+        params, error = parse_scrape_request(data)
+        if error:
+            return jsonify({"success": False, "error": error}), 400
+
+        stream_format = data.get('stream')
+        try:
+            job, events = start_scrape_job(params, subscribe=bool(stream_format), client=request.remote_addr or "")
+        except JobRejected as e:
+            return jsonify(rejection(e)), 429, {"Retry-After": str(e.retry_after)}
+
+        if stream_format:
+            return stream_job(job, events, stream_format)
+
+        if data.get('wait'):
+            job.future.result()
+            return jsonify({"success": job.status == "completed", **job.to_dict()})
+
         return jsonify({
             "success": True,
-            "category": category,
-            "websites": websites,
-            "results": results,
-            "timestamp": datetime.now().isoformat()
-        })
+            **job_manager.describe(job, include_results=False),
+            "status_url": f"/api/jobs/{job.id}"
+        }), 202
         
     except Exception as e:
         logger.error(f"Scraping error: {str(e)}")
@@ -188,70 +139,271 @@ def scrape():
             "error": str(e)
         }), 500
 
-async def run_scraping(category, websites, data_types, output_format):
+def parse_scrape_request(data):
+    """
+    Validates a POST /api/scrape payload.
+    Returns (params, None), or (None, error message) for a 400 response.
     """
-    Run the actual scraping logic
+    if not data:
+        return None, "No data provided"
+
+    params = {
+        "category": data.get('category'),
+        "websites": data.get('websites', []),
+        "dataTypes": data.get('dataTypes', ['text']),
+        "outputFormat": data.get('outputFormat', 'csv'),
+        "incremental": bool(data.get('incremental', settings.INCREMENTAL_CRAWL)),
+        "refresh": bool(data.get('refresh', False))
+    }
+
+    if not params["category"]:
+        return None, "Category is required"
+
+    if not params["websites"]:
+        return None, "At least one website must be selected"
+
+    return params, None
+
+def start_scrape_job(params, subscribe=False, client=""):
     """
-    all_results = []
+    Starts a background scrape job for validated request params.
+    Returns (job, events), events being a subscription to the job when `subscribe`
+    (taken before the job starts, so no item is missed) and None otherwise.
+    Raises JobRejected when admission control turns the job away.
+    """
+    logger.info(f"Scraping request: category={params['category']}, websites={params['websites']}, client={client}")
+
+    # Run scraping in the background on the browser pool's event loop
+    job = job_manager.create(params, len(params["websites"]), client)
+    events = job.subscribe() if subscribe else None
+    job_manager.start(job, lambda job: run_scraping(
+        params["category"], params["websites"], params["dataTypes"], params["outputFormat"],
+        params["incremental"], on_result=job.add_result, events=job.publish, refresh=params["refresh"]
+    ))
+    return job, events
+
+def rejection(error):
+    """Body of a 429 response to a job refused by admission control."""
+    logger.warning(f"Scrape request rejected: {error}")
+    return {
+        "success": False,
+        "error": f"{error}. Retry in about {error.retry_after}s.",
+        "retry_after": error.retry_after,
+        "jobs": job_manager.stats()
+    }
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    Status, progress and (so far) results of a scrape job
+    """
+    job = job_manager.get(job_id)
+    if not job:
+        return jsonify({"success": False, "error": "Unknown job"}), 404
+    return jsonify({"success": True, **job_manager.describe(job)})
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """
+    Streams a running job's events from now on (?format=sse, the default, or ndjson)
+    """
+    job = job_manager.get(job_id)
+    if not job:
+        return jsonify({"success": False, "error": "Unknown job"}), 404
+    return stream_job(job, job.subscribe(), request.args.get('format', 'sse'))
+
+def stream_job(job, events, fmt):
+    """
+    Streaming response of a job's events, one at a time:
+    "status" first, then "item" for each scraped item, "progress" (stage, done, total),
+    "error" and "site" (a site finished), and finally "done" with the job's results.
+    Nothing is buffered beyond settings.JOB_STREAM_BUFFER events per client.
+    """
+    fmt = "ndjson" if fmt == "ndjson" else "sse"
+
+    def generate():
+        yield format_event({"event": "status", **job_manager.describe(job, include_results=False)}, fmt)
+        for event in job.stream(events):
+            yield format_event(event, fmt)
+
+    mimetype = "application/x-ndjson" if fmt == "ndjson" else "text/event-stream"
+    return Response(generate(), mimetype=mimetype, headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """
+    Recent scrape jobs, newest first (without their results)
+    """
+    return jsonify({
+        "success": True,
+        "jobs": [job_manager.describe(job, include_results=False) for job in job_manager.list()]
+    })
+
+async def run_scraping(category, websites, data_types, output_format, incremental=False,
+                       on_result=None, events=None, refresh=False):
+    """
+    Run the actual scraping logic.
+    Each website gets its own leased page and runs in parallel; the pages open at
+    once across all requests are bounded by the browser pool (settings.MAX_CONCURRENT_PAGES).
+    Results keep the request order;
+    `on_result` is also called with each site's result as soon as it finishes,
+    and `events(kind, **payload)` with the scrapers' item/progress events.
+    A site already being scraped for an equivalent request (same category and
+    incremental mode) is not scraped again, and a result younger than the scraper's
+    RESULT_TTL is reused unless `refresh`; each request then gets the shared run
+    exported in its own output format.
+    """
+    async def shared(website_key):
+        scraper_class = SCRAPER_CLASSES.get(website_key)
+        ttl = scraper_class.RESULT_TTL if scraper_class else 0
+        # Everything that changes what run() returns is in the key: the category decides
+        # where the output is saved, an incremental run returns only the new items.
+        # Data types and output format do not (each request exports in its own format).
+        key = (category, website_key, bool(scraper_class and scraper_class.INCREMENTAL and incremental))
+        result = await result_cache.get_or_run(key, ttl, lambda: scrape_website(category, website_key, incremental, events), refresh)
+        await export_result(category, result, output_format)
+        if result is not None and on_result:
+            on_result(result)
+        return result
+
+    results = await asyncio.gather(*(shared(w) for w in websites))
+    return [r for r in results if r is not None]
+
+async def scrape_website(category, website_key, incremental=False, events=None):
+    """
+    Scrapes a single website on its own page and stores its items (see export_result
+    for the output files). Returns the per-site result entry, or None if no scraper
+    exists for it.
+    """
+    # Map website to scraper class
+    scraper_class = SCRAPER_CLASSES.get(website_key)
     
-    async with BrowserManager(headless=False) as bm:
-        page = await bm.get_page()
-        
-        for website_key in websites:
-            try:
-                # Map website to scraper class
-                scraper_class = SCRAPER_CLASSES.get(website_key)
-                
-                if not scraper_class:
-                    logger.warning(f"No scraper implementation for: {website_key}")
-                    continue
-                
-                # Instantiate scraper
-                scraper = scraper_class(page)
-                
+    if not scraper_class:
+        logger.warning(f"No scraper implementation for: {website_key}")
+        return None
+
+    try:
+        started = time.monotonic()
+        run_id = uuid.uuid4().hex
+        # Instantiate scraper
+        scraper = scraper_class(None)
+        scraper.incremental = scraper.INCREMENTAL and incremental
+        scraper.run_id = run_id
+        if events:
+            scraper.events = lambda kind, payload: events(kind, website=website_key, **payload)
+        logger.info(f"Starting scraper for: {website_key}")
+
+        # Server-rendered sites try plain HTTP first and never lease a tab if it works
+        data = None
+        if scraper.FETCH_MODE == "static":
+            data = await scraper.scrape_static()
+
+        if data is None:
+            snapshot = None
+            async with browser_pool.lease(scraper_class.BLOCK_PROFILE) as page:
                 # Run scraper
-                logger.info(f"Starting scraper for: {website_key}")
-                data = await scraper.scrape()
-                
-                logger.info(f"DEBUG: Scraper returned {len(data)} items")
-                
-                # Save data to disk
-                import os
-                
-                output_dir = f"data/{category}"
-                logger.info(f"DEBUG: Creating directory: {output_dir}")
-                os.makedirs(output_dir, exist_ok=True)
-                
-                file_path_csv = f"{output_dir}/{website_key}_data.csv"
-                file_path_json = f"{output_dir}/{website_key}_data.json"
-                
-                if output_format == 'csv':
-                    Exporter.to_csv(data, file_path_csv)
-                    logger.info(f"Saved CSV to: {os.path.abspath(file_path_csv)}")
-                elif output_format == 'json':
-                    Exporter.to_json(data, file_path_json)
-                    logger.info(f"Saved JSON to: {os.path.abspath(file_path_json)}")
+                scraper.page = page
+                if scraper.FETCH_MODE == "snapshot":
+                    snapshot = await scraper.capture_snapshot()
                 else:
-                    # Save both by default context or specific requirement
-                    Exporter.to_csv(data, file_path_csv)
-                    Exporter.to_json(data, file_path_json)
-                    logger.info(f"Saved data to: {os.path.abspath(output_dir)}")
-
-                all_results.append({
-                    "website": website_key,
-                    "items_scraped": len(data),
-                    "saved_at": os.path.abspath(output_dir),
-                    "data": data[:10]  # Return first 10 items for preview
-                })
-                
+                    data = await scraper.scrape()
+
+            if snapshot is not None:
+                # The tab is already back in the pool; parse in the worker pool
+                data = await scraper.parse_snapshot(snapshot)
+        
+        logger.info(f"DEBUG: Scraper returned {len(data)} items")
+        
+        # Store the items (off the event loop so other sites keep running)
+        output_dir = f"data/{category}"
+        await asyncio.to_thread(get_result_store().add, data, category, website_key, run_id)
+        metrics.SITE_ITEMS.observe(len(data), website=website_key)
+        metrics.SITE_SECONDS.observe(time.monotonic() - started, website=website_key)
+
+        return {
+            "website": website_key,
+            "items_scraped": len(data),
+            "saved_at": os.path.abspath(output_dir),
+            "incremental": scraper.incremental,
+            "run_id": run_id,
+            "results_url": f"/api/results?run_id={run_id}"  # Page through the items there
+        }
+        
+    except Exception as e:
+        logger.error(f"Error scraping {website_key}: {str(e)}")
+        return {
+            "website": website_key,
+            "error": str(e)
+        }
+
+async def export_result(category, result, output_format):
+    """
+    Writes the items of a site result's run to data/<category>/<site>_data.csv|json.
+    Requests sharing a run (or its cached result) each get their format written, but a
+    file already holding that run is left alone and writes to one file are serialized.
+    Incremental runs returned only new items, so they are appended to the existing export.
+    """
+    if not result or result.get("error") or not result.get("run_id"):
+        return
+    output_dir = f"data/{category}"
+    website_key = result["website"]
+    items = None
+    for fmt in ([output_format] if output_format in ("csv", "json") else ["csv", "json"]):
+        path = f"{output_dir}/{website_key}_data.{fmt}"
+        async with _export_locks.setdefault(path, asyncio.Lock()):
+            if _exported.get(path) == result["run_id"]:
+                continue
+            try:
+                if items is None:
+                    items = await asyncio.to_thread(get_result_store().run_items, result["run_id"])
+                await asyncio.to_thread(Exporter.save_results, items, output_dir, website_key, fmt,
+                                        result.get("incremental", False))
+                _exported[path] = result["run_id"]
             except Exception as e:
-                logger.error(f"Error scraping {website_key}: {str(e)}")
-                all_results.append({
-                    "website": website_key,
-                    "error": str(e)
-                })
-    
-    return all_results
+                logger.error(f"Error exporting {website_key} to {path}: {str(e)}")
+
+@app.route('/api/results', methods=['GET'])
+def get_results():
+    """
+    Pages through stored scraped items, newest first (see query_results)
+    """
+    try:
+        return jsonify(query_results(request.args))
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+def query_results(args):
+    """
+    One page of GET /api/results for the query arguments:
+    category, website, run_id: filters
+    since, until: ISO timestamps (UTC unless offset) or epoch seconds bounding when items were stored
+    fields: comma-separated item keys to return (all by default)
+    limit: page size (settings.RESULTS_PAGE_SIZE, at most RESULTS_PAGE_MAX)
+    cursor: the previous page's next_cursor
+    order: "desc" (newest first, the default) or "asc"
+    Raises ValueError for invalid arguments.
+    """
+    limit = args.get('limit', str(settings.RESULTS_PAGE_SIZE))
+    if not limit.isdigit():
+        raise ValueError("limit must be a positive integer")
+    fields = [field.strip() for field in args.get('fields', '').split(',') if field.strip()]
+    items, next_cursor = get_result_store().query(
+        category=args.get('category'),
+        website=args.get('website'),
+        run_id=args.get('run_id'),
+        since=args.get('since'),
+        until=args.get('until'),
+        cursor=args.get('cursor'),
+        limit=int(limit),
+        fields=fields or None,
+        newest_first=args.get('order', 'desc') != 'asc'
+    )
+    return {
+        "success": True,
+        "count": len(items),
+        "items": items,
+        "next_cursor": next_cursor
+    }
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -260,9 +412,38 @@ def health_check():
     """
     return jsonify({
         "status": "healthy",
+        "browser_pool": browser_pool.run(browser_pool.health_check(), timeout=10),
+        "jobs": job_manager.stats(),
+        "result_cache": result_cache.stats(),
+        "politeness": politeness_stats(),
         "timestamp": datetime.now().isoformat()
     })
 
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Prometheus metrics: navigations, latencies, items, exports, downloads,
+    browser pool occupancy, block/CAPTCHA events and job queue depth
+    """
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
+def shutdown():
+    """
+    Releases loop-owned resources (HTTP session, browsers) on exit
+    """
+    if not browser_pool.background_running:
+        return
+    try:
+        browser_pool.run(close_session(), timeout=10)
+    finally:
+        browser_pool.stop_background()
+        shutdown_parse_executor()
+
+# Also covers servers that import the app without running __main__
+atexit.register(shutdown)
+
 if __name__ == '__main__':
     logger.info("Starting Flask API Server...")
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    browser_pool.start_background()
+    # Reloader disabled: it would fork a second process with its own browser pool
+    app.run(host=settings.API_HOST, port=settings.API_PORT, debug=settings.API_DEBUG, use_reloader=False)
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import logging
+from datetime import datetime
+from functools import partial
+from aiohttp import web
+from config import settings
+
+# Routes share the Flask server's job manager, browser pool and request handling
+from api_server import (browser_pool, job_manager, result_cache, parse_scrape_request, start_scrape_job, rejection,
+                        query_results)
+from scraper.core import metrics
+from scraper.core.http_client import close_session
+from scraper.core.jobs import JobRejected, format_event
+from scraper.core.snapshot import shutdown_parse_executor
+from scraper.core.politeness import politeness_stats
+from scraper.registry import CATEGORY_WEBSITES
+
+logger = logging.getLogger(__name__)
+
+routes = web.RouteTableDef()
+
+# Same serialization as Flask's jsonify for values JSON has no type for
+json_response = partial(web.json_response, dumps=partial(json.dumps, default=str))
+
+@routes.get('/api/categories')
+async def get_categories(request):
+    """
+    Returns all available categories
+    """
+    return json_response({
+        "success": True,
+        "categories": list(CATEGORY_WEBSITES.keys())
+    })
+
+@routes.get('/api/websites/{category}')
+async def get_websites_by_category(request):
+    """
+    Returns websites for a specific category
+    """
+    category = request.match_info['category']
+    if category not in CATEGORY_WEBSITES:
+        return json_response({"success": False, "error": "Invalid category"}, status=400)
+    return json_response({
+        "success": True,
+        "category": category,
+        "websites": CATEGORY_WEBSITES[category]
+    })
+
+@routes.post('/api/scrape')
+async def scrape(request):
+    """
+    Main scraping endpoint, same payload and responses as api_server.scrape.
+    A "wait" request awaits its job instead of holding a thread.
+    """
+    try:
+        try:
+            data = await request.json()
+        except ValueError:
+            data = None
+        params, error = parse_scrape_request(data)
+        if error:
+            return json_response({"success": False, "error": error}, status=400)
+
+        stream_format = data.get('stream')
+        try:
+            job, events = start_scrape_job(params, subscribe=bool(stream_format), client=request.remote or "")
+        except JobRejected as e:
+            return json_response(rejection(e), status=429, headers={"Retry-After": str(e.retry_after)})
+
+        if stream_format:
+            return await stream_job(request, job, events, stream_format)
+
+        if data.get('wait'):
+            await asyncio.wrap_future(job.future)
+            return json_response({"success": job.status == "completed", **job.to_dict()})
+
+        return json_response({
+            "success": True,
+            **job_manager.describe(job, include_results=False),
+            "status_url": f"/api/jobs/{job.id}"
+        }, status=202)
+
+    except Exception as e:
+        logger.error(f"Scraping error: {str(e)}")
+        return json_response({"success": False, "error": str(e)}, status=500)
+
+@routes.get('/api/jobs/{job_id}')
+async def get_job(request):
+    """
+    Status, progress and (so far) results of a scrape job
+    """
+    job = job_manager.get(request.match_info['job_id'])
+    if not job:
+        return json_response({"success": False, "error": "Unknown job"}, status=404)
+    return json_response({"success": True, **job_manager.describe(job)})
+
+@routes.get('/api/jobs/{job_id}/events')
+async def job_events(request):
+    """
+    Streams a running job's events from now on (?format=sse, the default, or ndjson)
+    """
+    job = job_manager.get(request.match_info['job_id'])
+    if not job:
+        return json_response({"success": False, "error": "Unknown job"}, status=404)
+    return await stream_job(request, job, job.subscribe(), request.query.get('format', 'sse'))
+
+async def stream_job(request, job, events, fmt):
+    """
+    Writes a job's events to the client as they happen (see api_server.stream_job).
+    A client that disconnects cancels this handler, which drops its subscription.
+    """
+    fmt = "ndjson" if fmt == "ndjson" else "sse"
+    response = web.StreamResponse(headers={
+        "Content-Type": "application/x-ndjson" if fmt == "ndjson" else "text/event-stream",
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+    await response.prepare(request)
+    await response.write(format_event({"event": "status", **job_manager.describe(job, include_results=False)}, fmt).encode())
+    async for event in job.astream(events):
+        await response.write(format_event(event, fmt).encode())
+    await response.write_eof()
+    return response
+
+@routes.get('/api/jobs')
+async def list_jobs(request):
+    """
+    Recent scrape jobs, newest first (without their results)
+    """
+    return json_response({
+        "success": True,
+        "jobs": [job_manager.describe(job, include_results=False) for job in job_manager.list()]
+    })
+
+@routes.get('/api/results')
+async def get_results(request):
+    """
+    Pages through stored scraped items (see api_server.query_results)
+    """
+    try:
+        return json_response(await asyncio.to_thread(query_results, request.query))
+    except ValueError as e:
+        return json_response({"success": False, "error": str(e)}, status=400)
+
+@routes.get('/health')
+async def health_check(request):
+    """
+    Health check endpoint
+    """
+    return json_response({
+        "status": "healthy",
+        "browser_pool": await asyncio.wait_for(browser_pool.health_check(), timeout=10),
+        "jobs": job_manager.stats(),
+        "result_cache": result_cache.stats(),
+        "politeness": politeness_stats(),
+        "timestamp": datetime.now().isoformat()
+    })
+
+@routes.get('/metrics')
+async def get_metrics(request):
+    """
+    Prometheus metrics (see api_server.get_metrics)
+    """
+    return web.Response(body=metrics.render().encode(), headers={"Content-Type": metrics.CONTENT_TYPE})
+
+async def preflight(request):
+    """CORS preflight for any route (the Flask server gets this from flask_cors)."""
+    return web.Response()
+
+async def add_cors_headers(request, response):
+    response.headers["Access-Control-Allow-Origin"] = "*"
+    if request.method == "OPTIONS":
+        response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
+        response.headers["Access-Control-Allow-Headers"] = request.headers.get("Access-Control-Request-Headers", "*")
+
+async def browser_pool_context(app):
+    """Starts the browser pool on the server's own loop and releases loop-owned resources on exit."""
+    await browser_pool.start()
+    yield
+    try:
+        await browser_pool.stop()
+        await close_session()
+    finally:
+        shutdown_parse_executor()
+
+def create_app() -> web.Application:
+    """
+    The API on a single long-lived asyncio loop: request handlers, scrape jobs and the
+    browser pool share it, so concurrent requests interleave on I/O instead of each
+    holding a server thread.
+    """
+    app = web.Application()
+    app.add_routes(routes)
+    app.router.add_route('OPTIONS', '/{tail:.*}', preflight)
+    app.on_response_prepare.append(add_cors_headers)
+    app.cleanup_ctx.append(browser_pool_context)
+    return app
+
+if __name__ == '__main__':
+    logger.info("Starting async API Server...")
+    web.run_app(create_app(), host=settings.API_HOST, port=settings.API_PORT)
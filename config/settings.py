@@ -14,7 +14,94 @@ VIEWPORT = {"width": 1920, "height": 1080}
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
 # Concurrency
-MAX_CONCURRENT_PAGES = 5
+MAX_CONCURRENT_PAGES = 5  # Pages open at once in the server's browser pool, detail pages included
+
+# Per-domain politeness (scraper/core/politeness.py): token bucket with AIMD rate
+POLITENESS_INITIAL_RATE = 0.5  # Requests/s per domain before any feedback
+POLITENESS_MIN_RATE = 0.05
+POLITENESS_MAX_RATE = 4.0
+POLITENESS_BURST = 2  # Requests a domain may receive back to back
+POLITENESS_INCREASE = 0.1  # Added to the rate per healthy response
+POLITENESS_DECREASE = 0.5  # Rate multiplier on 403/429/503 or block pages
+POLITENESS_SLOW_LATENCY = 8.0  # Seconds; slower responses shrink the rate
+POLITENESS_JITTER = 0.25  # Random extra fraction added to token waits
+
+# Real-estate detail fan-out (scraper/categories/real_estate/detail_pool.py)
+DETAIL_WORKERS = 3  # Pages visiting detail URLs concurrently per scraper
+
+# Listing -> article pipeline (scraper/core/article_pipeline.py)
+ARTICLE_WORKERS = 3  # Detail tabs consuming article URLs
+ARTICLE_QUEUE_SIZE = 20  # Discovered URLs buffered ahead of the detail tabs
+
+# Crawl frontier (scraper/core/frontier.py)
+FRONTIER_DB = BASE_DIR / "data" / "frontier.db"
+FRONTIER_LEASE_SECONDS = 300  # In-flight URLs are handed out again after this
+FRONTIER_MAX_RETRIES = 2  # Retries of a failing URL before it is marked failed
+FRONTIER_RESUME_MAX_AGE = 12 * 3600  # Seconds idle after which an unfinished crawl is abandoned, not resumed
+
+# Real-estate card fingerprints (scraper/categories/real_estate/fingerprints.py)
+FINGERPRINT_DB = BASE_DIR / "data" / "fingerprints.db"
+FINGERPRINT_MAX_AGE = 3 * 24 * 3600  # Seconds before an unchanged listing's details are refetched anyway
+
+# Queryable store of every scraped item (scraper/core/result_store.py, GET /api/results)
+RESULT_STORE_DB = BASE_DIR / "data" / "results.db"
+RESULT_STORE_MAX_AGE = 30 * 24 * 3600  # Seconds stored items are kept
+RESULTS_PAGE_SIZE = 100  # Default page size of /api/results
+RESULTS_PAGE_MAX = 1000  # Largest page a client may ask for
+
+# Seen-URL journals of the resumable article scrapers (scraper/core/seen_store.py)
+SEEN_SYNC_EVERY = 20  # Journaled URLs per fsync
+SEEN_COMPACT_THRESHOLD = 5000  # Journal lines before folding them into the state file
+SEEN_STATE_DIR = BASE_DIR / "data" / "state"  # Seen-URL state of scrapers without their own STATE_FILE
+
+# Incremental crawl mode: feed scrapers stop at content an earlier run already saw
+INCREMENTAL_CRAWL = False  # Default when the API request / CLI run does not choose
+INCREMENTAL_SEEN_STREAK = 10  # Consecutive already-seen links that mark the seen frontier
+
+# API server (api_server.py on Flask, async_server.py on one asyncio loop)
+API_HOST = "0.0.0.0"
+API_PORT = 5000
+API_DEBUG = False  # Flask debug mode: never on a reachable host (it exposes the debugger)
+
+# Browser Pool (api_server)
+BROWSER_POOL_SIZE = 2  # Max Chromium processes kept alive by the server
+BROWSER_POOL_CONTEXTS_PER_BROWSER = 4  # Leases per browser before a new one is launched
+BROWSER_POOL_HEALTH_INTERVAL = 30  # Seconds between health checks
+
+# Background scrape jobs (api_server /api/scrape, /api/jobs)
+JOB_HISTORY = 200  # Finished jobs kept for status polling
+JOB_STREAM_BUFFER = 1000  # Events buffered per streaming client before they are dropped
+# Admission control: beyond these limits /api/scrape answers 429 with a Retry-After
+JOB_MAX_RUNNING = 2  # Jobs scraping at once; later ones wait in the queue
+JOB_QUEUE_SIZE = 20  # Jobs allowed to wait for a slot
+JOB_MAX_PER_CLIENT = 3  # Queued + running jobs per client address
+JOB_ESTIMATED_DURATION = 120  # Seconds per job assumed for wait estimates until jobs have finished
+
+# Scrape result cache (scraper/core/result_cache.py): equivalent site requests share one run
+RESULT_TTL = 5 * 60  # Seconds a site's result is reused (news and other feeds; see BaseScraper.RESULT_TTL)
+RESULT_TTL_REAL_ESTATE = 60 * 60  # Listings change slowly
+RESULT_CACHE_SIZE = 256  # Cached site results kept at most
+
+# Worker processes (scraper/process_pool.py), each with its own Chromium
+PROCESS_WORKERS = max(1, min(4, os.cpu_count() or 1))
+PROCESS_WORKER_TASKS = 2  # Sites a worker process scrapes at once
+
+# Shared task queue for workers on several hosts (scraper/core/task_queue.py)
+TASK_QUEUE_URL = f"sqlite:///{BASE_DIR / 'data' / 'tasks.db'}"  # or redis://host:6379/0
+TASK_LEASE_SECONDS = 120  # A task whose worker stops heartbeating is reclaimed after this
+TASK_HEARTBEAT_INTERVAL = 30
+TASK_MAX_ATTEMPTS = 3
+TASK_POLL_INTERVAL = 5  # Seconds an idle worker waits before asking again
+
+# Snapshot parsing (HTML parsed off the event loop)
+PARSE_POOL_KIND = "process"  # "process" or "thread"
+PARSE_POOL_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# HTTP Cache (shared by the browser route handler, static fetches and the downloader)
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_DIR = BASE_DIR / ".http_cache"
+HTTP_CACHE_MAX_BYTES = 500 * 1024 * 1024  # LRU-evicted beyond this
+HTTP_CACHE_DEFAULT_TTL = 300  # Seconds to reuse scripts, stylesheets and downloads that send no Cache-Control/Expires
 
 # Create dirs if they don't exist
 DOWNLOADS_DIR.mkdir(exist_ok=True)
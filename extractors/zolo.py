@@ -1,18 +1,29 @@
 import logging
-import asyncio
 import re
 import hashlib
 from datetime import datetime
 from playwright.async_api import Page
 from bs4 import BeautifulSoup
+from scraper.core.snapshot import take_snapshot, parse_off_loop
+from scraper.core.politeness import polite_goto
+from scraper.categories.real_estate.detail_pool import DetailWorkerPool
+from scraper.categories.real_estate.fingerprints import get_fingerprint_index
+from scraper.core.frontier import open_crawl
+
+CARD_SELECTOR = "article.card-listing, div.card-listing, div[class*='listing-card']"
+
+logger = logging.getLogger("ZoloExtractor")
 
 class ZoloExtractor:
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, run_id: str = ""):
         self.page = page
+        # Keys the frontier crawl together with the search URL, as BaseScraper.run_id does
+        self.run_id = run_id
         self.logger = logging.getLogger("ZoloExtractor")
 
     # --- Helpers Ported from Reference ---
-    def generate_hash_id(self, title, address, price):
+    @staticmethod
+    def generate_hash_id(title, address, price):
         """Generate robust hash ID using normalized address and price."""
         norm_addr = address.lower()
         norm_addr = re.sub(r'[^\w\s]', '', norm_addr)
@@ -20,7 +31,8 @@ class ZoloExtractor:
         raw = f"{norm_addr}_{str(price)}".encode('utf-8')
         return hashlib.md5(raw).hexdigest()
 
-    def extract_location(self, address):
+    @staticmethod
+    def extract_location(address):
         """Dynamically extract City, State, Country from address string."""
         city, state, country = "Unknown", "Unknown", "Unknown"
         if not address or address == "N/A":
@@ -53,13 +65,21 @@ class ZoloExtractor:
             # In a real infinite scroll, we'd check if height changed, but for Zolo paginated map/list
             # sometimes it handles both. We'll just scroll a bit to trigger lazy loads.
 
+    async def fetch_detail(self, url):
+        """Loads a listing page, snapshots it and parses the snapshot in the parse pool
+        (run on a detail worker page)."""
+        await polite_goto(self.page, url, timeout=30000)
+        await self.page.wait_for_load_state("domcontentloaded")
+        snapshot = await take_snapshot(self.page)
+        return await parse_off_loop(parse_detail, snapshot.html)
+
     # --- Extraction ---
     async def extract(self):
         self.logger.info("Starting Zolo extraction (Robust Version)...")
         
         # 1. Wait for listings
         try:
-            await self.page.wait_for_selector("article.card-listing, div.card-listing, div[class*='listing-card']", timeout=30000)
+            await self.page.wait_for_selector(CARD_SELECTOR, timeout=30000)
             self.logger.info("Listings loaded.")
         except Exception as e:
             self.logger.warning(f"Timeout waiting for listings: {e}")
@@ -67,121 +87,37 @@ class ZoloExtractor:
         # 2. Smart Scroll to load lazy images/content
         await self.smart_scroll(max_scrolls=3)
 
-        # 3. Parse Content
-        content = await self.page.content()
-        soup = BeautifulSoup(content, 'html.parser')
-        cards = soup.select("article.card-listing, div.card-listing, div[class*='listing-card']")
-        self.logger.info(f"Found {len(cards)} listing cards.")
-        
-        extracted_data = []
-        
-        for i, card in enumerate(cards):
-            try:
-                # Basic Extraction (Ported Logic)
-                
-                # Source URL
-                link_tag = card.find('a', href=True)
-                source_url = "https://www.zolo.ca" + link_tag['href'] if link_tag and not link_tag['href'].startswith('http') else (link_tag['href'] if link_tag else self.page.url)
-
-                # Address
-                address = "N/A"
-                addr_tag = card.select_one(".address, span[itemprop='streetAddress'], h3")
-                if addr_tag:
-                    address = addr_tag.get_text(strip=True)
-                
-                # Price
-                price_text = "0"
-                price_tag = card.select_one("span[itemprop='price'], .price")
-                if price_tag:
-                    price_text = price_tag.get_text(strip=True)
-                price_clean = re.sub(r'[^\d.]', '', price_text)
-                price_val = float(price_clean) if price_clean else 0.0
-
-                # Location
-                city, state, country = self.extract_location(address)
-                
-                # Attributes
-                amenities = []
-                info_tags = card.select("ul.card-listing--values li, .features li")
-                for tag in info_tags:
-                    amenities.append(tag.get_text(strip=True))
-
-                # Images (Card)
-                images = []
-                img_tag = card.find('img')
-                if img_tag:
-                    src = img_tag.get('src') or img_tag.get('data-src') or img_tag.get('data-srcset')
-                    if src and "http" in src:
-                         images.append(src.split()[0]) # handle srcset 'url 480w' format
-                
-                # Title & Hash
-                title = address if address != "N/A" else f"Zolo Listing #{i}"
-                hash_id = self.generate_hash_id(title, address, price_val)
-                serial_no = f"ZO-{hash_id[:6]}"
-                
-                # Prepare Item (Matching Reference Schema logic)
-                item = {
-                    "serial": serial_no,
-                    "title": title,
-                    "property_type": "Residential", # Default
-                    "amenities": amenities,     # List, will join later
-                    "price": price_text,        # Keep original text format for CSV
-                    "address": address,
-                    "images": images,           # List
-                    "description": f"Zolo listing in {city}", # Placeholder until detail
-                    "summary": f"For sale: {price_text}",     # AI Summary placeholder
-                    "source": "Zolo.ca",
-                    
-                    # Internal/Extra
-                    "source_url": source_url,
-                    "city": city,
-                    "extra": {
-                        "hash_id": hash_id,
-                        "scraped_at": str(datetime.now())
-                    }
-                }
-                
-                extracted_data.append(item)
-                
-            except Exception as e:
-                self.logger.error(f"Error parsing card {i}: {e}")
+        # 3. Snapshot once, parse in the worker pool
+        snapshot = await take_snapshot(self.page)
+        extracted_data = await parse_off_loop(parse_listing_cards, snapshot.html, snapshot.url)
+        self.logger.info(f"Parsed {len(extracted_data)} listing cards.")
+
+        # 4. Detail Page Extraction: a bounded pool of pages (sharing this page's context)
+        # works through the listings via the crawl frontier; each snapshot is parsed in the parse pool
+        targets = {item['source_url']: item for item in extracted_data
+                   if item.get('source_url') and "zolo.ca" in item['source_url']}
+        self.logger.info(f"Visiting {len(targets)} listing pages for details...")
+        # One crawl per search URL (and run): other searches neither share nor resume it
+        crawl = await open_crawl(f"{type(self).__name__}:{snapshot.url}", self.run_id)
+        index = get_fingerprint_index(type(self).__name__)
+        # Listings whose card is unchanged reuse their stored details
+        await index.enqueue_changed(crawl, targets, targets)
+        await crawl.mark_discovered()
+
+        for result in await DetailWorkerPool(self).run(crawl, "fetch_detail"):
+            item = targets.get(result.url)
+            if result.error:
+                self.logger.error(f"Detail extract error {result.url}: {result.error}")
                 continue
-
-        # 4. Detail Page Extraction (Resurrected from previous step, integrated)
-        self.logger.info(f"Visiting {len(extracted_data)} listing pages for details...")
-        for item in extracted_data:
-            url = item.get('source_url')
-            if not url or "zolo.ca" not in url: continue
-            
-            try:
-                await self.page.goto(url, timeout=30000)
-                await self.page.wait_for_load_state("domcontentloaded")
-                
-                # Description
-                desc_el = await self.page.query_selector(".description, [itemprop='description'], section.listing-description")
-                if desc_el:
-                    item['description'] = await desc_el.inner_text()
-                
-                # Amenities (Detailed)
-                # Using robust check from recent analysis
-                am_els = await self.page.query_selector_all(".amenities li, .listing-amenities li, ul.list-columns li")
-                detailed_amenities = []
-                for am in am_els:
-                    detailed_amenities.append(await am.inner_text())
-                if detailed_amenities:
-                    item['amenities'] = list(set(item['amenities'] + detailed_amenities))
-
-                # Images (Gallery)
-                img_els = await self.page.query_selector_all("img.photo, .gallery-image img")
-                for img in img_els:
-                    src = await img.get_attribute('src')
-                    if src and "http" in src: item['images'].append(src)
-                item['images'] = list(set(item['images']))
-
-                await asyncio.sleep(1) # Polite pause
-
-            except Exception as e:
-                 self.logger.error(f"Detail extract error {url}: {e}")
+            if item is None or not result.data:
+                continue
+            details = result.data
+            await index.record_fetched(result.url, item, details)
+            if details['description']:
+                item['description'] = details['description']
+            if details['amenities']:
+                item['amenities'] = list(set(item['amenities'] + details['amenities']))
+            item['images'] = list(set(item['images'] + details['images']))
 
         # Post-Processing for CSV Compatibility
         # Reference CSV: Serial, Title, Type, Amenities, Price, Address, Images, Description, Summary, Source
@@ -201,8 +137,113 @@ class ZoloExtractor:
                 "source": item['source']
             })
 
+        await crawl.finish()
         return {
             "type": "text",
             "data": final_data,
             "count": len(final_data)
         }
+
+# --- Parse-pool entry points (module level so they pickle) ---
+
+def parse_listing_cards(html, page_url):
+    """Parses the listing cards of a search results snapshot."""
+    soup = BeautifulSoup(html, 'lxml')
+    cards = soup.select(CARD_SELECTOR)
+    logger.info(f"Found {len(cards)} listing cards.")
+
+    extracted_data = []
+
+    for i, card in enumerate(cards):
+        try:
+            # Basic Extraction (Ported Logic)
+            
+            # Source URL
+            link_tag = card.find('a', href=True)
+            source_url = "https://www.zolo.ca" + link_tag['href'] if link_tag and not link_tag['href'].startswith('http') else (link_tag['href'] if link_tag else page_url)
+
+            # Address
+            address = "N/A"
+            addr_tag = card.select_one(".address, span[itemprop='streetAddress'], h3")
+            if addr_tag:
+                address = addr_tag.get_text(strip=True)
+            
+            # Price
+            price_text = "0"
+            price_tag = card.select_one("span[itemprop='price'], .price")
+            if price_tag:
+                price_text = price_tag.get_text(strip=True)
+            price_clean = re.sub(r'[^\d.]', '', price_text)
+            price_val = float(price_clean) if price_clean else 0.0
+
+            # Location
+            city, state, country = ZoloExtractor.extract_location(address)
+            
+            # Attributes
+            amenities = []
+            info_tags = card.select("ul.card-listing--values li, .features li")
+            for tag in info_tags:
+                amenities.append(tag.get_text(strip=True))
+
+            # Images (Card)
+            images = []
+            img_tag = card.find('img')
+            if img_tag:
+                src = img_tag.get('src') or img_tag.get('data-src') or img_tag.get('data-srcset')
+                if src and "http" in src:
+                     images.append(src.split()[0]) # handle srcset 'url 480w' format
+            
+            # Title & Hash
+            title = address if address != "N/A" else f"Zolo Listing #{i}"
+            hash_id = ZoloExtractor.generate_hash_id(title, address, price_val)
+            serial_no = f"ZO-{hash_id[:6]}"
+            
+            # Prepare Item (Matching Reference Schema logic)
+            item = {
+                "serial": serial_no,
+                "title": title,
+                "property_type": "Residential", # Default
+                "amenities": amenities,     # List, will join later
+                "price": price_text,        # Keep original text format for CSV
+                "address": address,
+                "images": images,           # List
+                "description": f"Zolo listing in {city}", # Placeholder until detail
+                "summary": f"For sale: {price_text}",     # AI Summary placeholder
+                "source": "Zolo.ca",
+                
+                # Internal/Extra
+                "source_url": source_url,
+                "city": city,
+                "extra": {
+                    "hash_id": hash_id,
+                    "scraped_at": str(datetime.now())
+                }
+            }
+            
+            extracted_data.append(item)
+            
+        except Exception as e:
+            logger.error(f"Error parsing card {i}: {e}")
+            continue
+
+    return extracted_data
+
+def parse_detail(html):
+    """Parses description, amenities and gallery images from a listing page snapshot."""
+    soup = BeautifulSoup(html, 'lxml')
+
+    # Description
+    desc_el = soup.select_one(".description, [itemprop='description'], section.listing-description")
+    description = desc_el.get_text("\n", strip=True) if desc_el else ""
+
+    # Amenities (Detailed)
+    # Using robust check from recent analysis
+    amenities = [am.get_text(strip=True) for am in soup.select(".amenities li, .listing-amenities li, ul.list-columns li")]
+
+    # Images (Gallery)
+    images = []
+    for img in soup.select("img.photo, .gallery-image img"):
+        src = img.get('src')
+        if src and "http" in src: images.append(src)
+
+    return {"description": description, "amenities": amenities, "images": images}
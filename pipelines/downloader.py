@@ -3,6 +3,8 @@ import asyncio
 import logging
 from pathlib import Path
 from config import settings
+from scraper.core.http_client import fetch_cached
+from scraper.core.metrics import DOWNLOAD_BYTES, DOWNLOADS
 import aiofiles
 
 class Downloader:
@@ -13,33 +15,37 @@ class Downloader:
         """Downloads a single file to the specified folder."""
         async with aiohttp.ClientSession() as session:
             try:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        # Determine filename
+                status, body, _ = await fetch_cached(session, url, heuristic=True)
+                if status == 200:
+                    # Determine filename
+                    if not filename:
+                        filename = url.split("/")[-1].split("?")[0]
                         if not filename:
-                            filename = url.split("/")[-1].split("?")[0]
-                            if not filename:
-                                filename = "downloaded_file"
+                            filename = "downloaded_file"
                         
-                        # Clean filename
-                        filename = "".join([c for c in filename if c.isalpha() or c.isdigit() or c in "._- "])
+                    # Clean filename
+                    filename = "".join([c for c in filename if c.isalpha() or c.isdigit() or c in "._- "])
                         
-                        save_dir = settings.DOWNLOADS_DIR / folder
-                        save_dir.mkdir(parents=True, exist_ok=True)
-                        save_path = save_dir / filename
+                    save_dir = settings.DOWNLOADS_DIR / folder
+                    save_dir.mkdir(parents=True, exist_ok=True)
+                    save_path = save_dir / filename
                         
-                        self.logger.info(f"Downloading {url} to {save_path}")
+                    self.logger.info(f"Downloading {url} to {save_path}")
                         
-                        f = await aiofiles.open(save_path, mode='wb')
-                        await f.write(await response.read())
-                        await f.close()
+                    f = await aiofiles.open(save_path, mode='wb')
+                    await f.write(body)
+                    await f.close()
+                    DOWNLOADS.inc(outcome="saved")
+                    DOWNLOAD_BYTES.inc(len(body), folder=folder)
                         
-                        return save_path
-                    else:
-                        self.logger.error(f"Failed to download {url}, status: {response.status}")
-                        return None
+                    return save_path
+                else:
+                    self.logger.error(f"Failed to download {url}, status: {status}")
+                    DOWNLOADS.inc(outcome=f"http_{status}")
+                    return None
             except Exception as e:
                 self.logger.error(f"Error downloading {url}: {e}")
+                DOWNLOADS.inc(outcome="error")
                 return None
 
     async def download_batch(self, urls: list, folder: str):
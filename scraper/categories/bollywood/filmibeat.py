@@ -1,5 +1,6 @@
 from scraper.core.base_scraper import BaseScraper
 from typing import List, Dict
+from parsel import Selector
 import logging
 
 logger = logging.getLogger(__name__)
@@ -7,87 +8,77 @@ logger = logging.getLogger(__name__)
 class FilmiBeatScraper(BaseScraper):
     CATEGORY = "Bollywood"
     BASE_URL = "https://www.filmibeat.com/"
+    # ~50 candidate links with heuristic filtering: one snapshot, parsed in the worker pool
+    FETCH_MODE = "snapshot"
+    INCREMENTAL = True
 
-    async def extract_items(self) -> List[Dict]:
-        items = []
-        
+    async def prepare_snapshot(self):
+        # Ads/trackers are blocked by the BLOCK_PROFILE route handler, so networkidle settles now
         try:
-            # Wait for basic page load (don't wait for networkidle - it times out due to ads/tracking)
-            await self.page.wait_for_load_state('domcontentloaded', timeout=10000)
-            
-            # Give it a moment for initial content to render
-            import asyncio
-            await asyncio.sleep(3)
-            
-            # FilmiBeat structure: Try broader selectors
-            # Look for any links that might be articles
-            article_links = await self.page.locator('a[href*="/bollywood/"], a[href*="/news/"], a[href*="/celeb/"], a[href*="/features/"]').all()
-            
-            # If specific selectors don't work, get all links in common article containers
-            if len(article_links) == 0:
-                article_links = await self.page.locator('article a, .news-card a, .story a, div[class*="card"] a').all()
-            
-            # Fallback: get all links with meaningful titles
-            if len(article_links) == 0:
-                article_links = await self.page.locator('a').all()
-            
-            seen_urls = set()
-            
-            for link_elem in article_links[:50]:  # Check up to 50 links
-                try:
-                    href = await link_elem.get_attribute('href')
-                    if not href or href in seen_urls:
-                        continue
-                    
-                    # Skip non-article links
-                    if any(skip in href for skip in ['javascript:', '#', 'mailto:', 'tel:']):
-                        continue
-                    
-                    # Make absolute URL
-                    if href.startswith('/'):
-                        href = f"{self.BASE_URL.rstrip('/')}{href}"
-                    elif not href.startswith('http'):
-                        continue
-                    
-                    # Only keep filmibeat.com URLs
-                    if 'filmibeat.com' not in href:
-                        continue
-                    
-                    seen_urls.add(href)
-                    
-                    # Get title
-                    title = await link_elem.inner_text()
-                    title = title.strip()
-                    
-                    # Filter out navigation links, social media, etc.
-                    if not title or len(title) < 10 or len(title) > 200:
-                        continue
-                    
-                    if any(skip in title.lower() for skip in ['home', 'login', 'sign up', 'subscribe', 'follow us']):
-                        continue
-                    
-                    items.append({
-                        "title": title,
-                        "short_description": "",
-                        "sub_category": "Entertainment",
-                        "source_url": href,
-                        "author": "FilmiBeat",
-                        "published_date": ""
-                    })
-                    
-                    # Stop once we have enough
-                    if len(items) >= 20:
-                        break
-                    
-                except Exception as e:
-                    logger.debug(f"Error extracting article: {e}")
-                    continue
-            
-            logger.info(f"FilmiBeat: Found {len(items)} articles")
-            
-        except Exception as e:
-            logger.error(f"Error in FilmiBeat scraper: {e}")
-            import traceback
-            traceback.print_exc()
-        
+            await self.page.wait_for_load_state('networkidle', timeout=10000)
+        except Exception:
+            logger.debug("FilmiBeat: networkidle not reached, continuing with DOM content")
+
+    def extract_static_items(self, selector: Selector) -> List[Dict]:
+        items = []
+
+        # FilmiBeat structure: Try broader selectors
+        # Look for any links that might be articles
+        article_links = selector.css('a[href*="/bollywood/"], a[href*="/news/"], a[href*="/celeb/"], a[href*="/features/"]')
+
+        # If specific selectors don't work, get all links in common article containers
+        if len(article_links) == 0:
+            article_links = selector.css('article a, .news-card a, .story a, div[class*="card"] a')
+
+        # Fallback: get all links with meaningful titles
+        if len(article_links) == 0:
+            article_links = selector.css('a')
+
+        seen_urls = set()
+
+        for link_elem in article_links[:50]:  # Check up to 50 links
+            href = link_elem.attrib.get('href')
+            if not href or href in seen_urls:
+                continue
+
+            # Skip non-article links
+            if any(skip in href for skip in ['javascript:', '#', 'mailto:', 'tel:']):
+                continue
+
+            # Make absolute URL
+            if href.startswith('/'):
+                href = f"{self.BASE_URL.rstrip('/')}{href}"
+            elif not href.startswith('http'):
+                continue
+
+            # Only keep filmibeat.com URLs
+            if 'filmibeat.com' not in href:
+                continue
+
+            seen_urls.add(href)
+
+            # Get title
+            title = self.static_text(link_elem).strip()
+
+            # Filter out navigation links, social media, etc.
+            if not title or len(title) < 10 or len(title) > 200:
+                continue
+
+            if any(skip in title.lower() for skip in ['home', 'login', 'sign up', 'subscribe', 'follow us']):
+                continue
+
+            items.append({
+                "title": title,
+                "short_description": "",
+                "sub_category": "Entertainment",
+                "source_url": href,
+                "author": "FilmiBeat",
+                "published_date": ""
+            })
+
+            # Stop once we have enough
+            if len(items) >= 20:
+                break
+
+        logger.info(f"FilmiBeat: Found {len(items)} articles")
         return items
@@ -1,45 +1,37 @@
 from scraper.core.base_scraper import BaseScraper
+from scraper.core.article_pipeline import ArticlePipeline
+from scraper.core.politeness import polite_goto, polite_click
+from scraper.core.seen_store import SeenStore, open_seen_store
 import asyncio
 import logging
-import random
 import re
 import csv
-import os
 from datetime import datetime
 from typing import List, Dict, Optional
 from playwright.async_api import Page
 
 logger = logging.getLogger(__name__)
 
-import json
 import hashlib
 
 class BusinessInsiderScraper(BaseScraper):
     CATEGORY = "business"
     BASE_URL = "https://www.businessinsider.com/latest"
     STATE_FILE = "data/business/state_bi123.json"
+    INCREMENTAL = True
 
     def __init__(self, page: Page):
         super().__init__(page)
         self.scraped_urls = self.resume_state_manager()
         self.all_data = []
 
-    def resume_state_manager(self) -> set:
+    def resume_state_manager(self) -> SeenStore:
         """Loads previously scraped URLs to avoid duplication."""
-        if os.path.exists(self.STATE_FILE):
-            try:
-                with open(self.STATE_FILE, 'r') as f:
-                    state = json.load(f)
-                    return set(state.get("scraped_urls", []))
-            except Exception as e:
-                logger.error(f"Error loading state: {e}")
-        return set()
+        return open_seen_store(self.STATE_FILE)
 
-    def persist_state(self):
-        """Saves current state to file."""
-        os.makedirs(os.path.dirname(self.STATE_FILE), exist_ok=True)
-        with open(self.STATE_FILE, 'w') as f:
-            json.dump({"scraped_urls": list(self.scraped_urls)}, f)
+    async def persist_state(self):
+        """Makes the journaled state durable."""
+        await self.scraped_urls.flush()
 
     async def fetch_listing_links(self) -> List[str]:
         """Identifies all article links on the current page."""
@@ -49,6 +41,10 @@ class BusinessInsiderScraper(BaseScraper):
         # Increased to 100 scrolls to try and catch 100+ items if infinite scroll
         current_height = 0
         for _ in range(10):
+            # Incremental mode: no need to load older articles once known ones are visible
+            if self.incremental and self.at_seen_frontier(await self._visible_article_links()):
+                logger.info("BusinessInsider: Reached already-scraped articles, not scrolling further.")
+                break
             await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             await asyncio.sleep(2)
             new_height = await self.page.evaluate("document.body.scrollHeight")
@@ -57,12 +53,14 @@ class BusinessInsiderScraper(BaseScraper):
                 load_more = self.page.locator("button:has-text('Load More'), .load-more-button")
                 if await load_more.count() > 0:
                     try:
-                        await load_more.first.click()
-                        await asyncio.sleep(3)
+                        await polite_click(self.page, load_more.first, settle=3)
                     except:
                         pass
             current_height = new_height
-            
+
+        return await self._visible_article_links()
+
+    async def _visible_article_links(self) -> List[str]:
         # Main story links often in h2/h3 or river-item
         article_locators = await self.page.locator("h2 a, h3 a, .river-item__title a, a[data-analytics-module='river_item'], .news-stream-item a, .tout-title-link").all()
         urls = []
@@ -87,18 +85,17 @@ class BusinessInsiderScraper(BaseScraper):
         """Scrapes full details for a single article into the 28-field schema."""
         logger.info(f"BusinessInsider: Scraping details for {url}")
         try:
-            print(f"DEBUG: Scraping {url}")
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            print("DEBUG: Page loaded")
-            await asyncio.sleep(random.uniform(2, 4))
+            logger.debug(f"BusinessInsider: Scraping {url}")
+            await polite_goto(self.page, url, wait_until="domcontentloaded", timeout=60000)
+            logger.debug("BusinessInsider: Page loaded")
             
             # Extract basic data
             h1_count = await self.page.locator("h1").count()
-            print(f"DEBUG: h1_count: {h1_count}")
+            logger.debug(f"BusinessInsider: h1_count: {h1_count}")
             title = "N/A"
             if h1_count > 0:
                 title = await self.page.locator("h1").first.inner_text()
-            print(f"DEBUG: title: {title}")
+            logger.debug(f"BusinessInsider: title: {title}")
             
             # Try broad set of selectors for content
             content_selectors = [
@@ -117,13 +114,13 @@ class BusinessInsiderScraper(BaseScraper):
                 nodes = await self.page.locator(selector).all()
                 if nodes:
                     content_nodes = nodes
-                    print(f"DEBUG: Found {len(nodes)} nodes using selector: {selector}")
+                    logger.debug(f"BusinessInsider: Found {len(nodes)} nodes using selector: {selector}")
                     break
             
             if not content_nodes:
                 # Last resort: all paragraphs in main article
                 content_nodes = await self.page.locator("p").all()
-                print(f"DEBUG: Fallback to all p tags: {len(content_nodes)}")
+                logger.debug(f"BusinessInsider: Fallback to all p tags: {len(content_nodes)}")
             
             content_list = []
             for n in content_nodes:
@@ -132,7 +129,7 @@ class BusinessInsiderScraper(BaseScraper):
                     if len(text) > 30:
                         content_list.append(text)
                 except Exception as node_e:
-                    print(f"DEBUG: node error: {node_e}")
+                    logger.debug(f"BusinessInsider: node error: {node_e}")
             content_text = "\n".join(content_list)
             
             # Meta fields
@@ -201,7 +198,6 @@ class BusinessInsiderScraper(BaseScraper):
             }
             return item
         except Exception as e:
-            print(f"DEBUG: Error in scrape_article_details: {e}")
             logger.error(f"Failed to scrape {url}: {e}")
             return None
 
@@ -222,8 +218,7 @@ class BusinessInsiderScraper(BaseScraper):
             if await btn.count() > 0:
                 logger.info(f"BusinessInsider: Found pagination button: {sel}")
                 try:
-                    await btn.first.click()
-                    await asyncio.sleep(4)
+                    await polite_click(self.page, btn.first, settle=4)
                     return True
                 except:
                     continue
@@ -236,27 +231,23 @@ class BusinessInsiderScraper(BaseScraper):
         output_file = "data/business/business_insider_data.csv"
         Exporter.to_csv(data, output_file)
 
+    def record_article(self, url: str, detail: Dict):
+        """Adds a scraped article (numbered in completion order) to the data and the seen-URL journal."""
+        detail["row_id"] = len(self.all_data) + 1
+        self.all_data.append(detail)
+        self.scraped_urls.add(url)  # Journaled; fsynced in batches off the event loop
+        self.emit("item", item=detail)
+
     async def scrape(self) -> List[Dict]:
         """Orchestrates the modular scraping process."""
-        await self.page.goto(self.BASE_URL, wait_until="domcontentloaded")
-        page_count = 1
-        
-        # Target 200+ items or max 50 pages to ensure we get >100
-        while len(self.all_data) < 200 and page_count <= 50:
-            links = await self.fetch_listing_links()
-            new_links = self.deduplicate_records(links)
-            
-            for url in new_links:
-                detail = await self.scrape_article_details(url)
-                if detail:
-                    self.all_data.append(detail)
-                    self.scraped_urls.add(url)
-                    self.persist_state()
-                
-            if not await self.handle_pagination():
-                break
-            page_count += 1
-            
+        await polite_goto(self.page, self.BASE_URL, wait_until="domcontentloaded")
+
+        # Listing tab stays on the listing; detail tabs consume the discovered URLs
+        try:
+            await ArticlePipeline(self, target=200, max_pages=50).run()
+        finally:
+            await self.persist_state()
+
         self.save_to_csv(self.all_data)
         logger.info(f"BusinessInsider: Total scraped: {len(self.all_data)}")
         return self.all_data
@@ -1,11 +1,11 @@
 from scraper.core.base_scraper import BaseScraper
+from scraper.core.article_pipeline import ArticlePipeline
+from scraper.core.politeness import polite_goto, polite_click
+from scraper.core.seen_store import SeenStore, open_seen_store
 import asyncio
 import logging
-import random
 import re
 import csv
-import os
-import json
 import hashlib
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -17,28 +17,20 @@ class PeopleScraper(BaseScraper):
     CATEGORY = "entertainment"
     BASE_URL = "https://people.com/"
     STATE_FILE = "data/entertainment/state_people.json"
+    INCREMENTAL = True
 
     def __init__(self, page: Page):
         super().__init__(page)
         self.scraped_urls = self.resume_state_manager()
         self.all_data = []
 
-    def resume_state_manager(self) -> set:
+    def resume_state_manager(self) -> SeenStore:
         """Loads previously scraped URLs to avoid duplication."""
-        if os.path.exists(self.STATE_FILE):
-            try:
-                with open(self.STATE_FILE, 'r') as f:
-                    state = json.load(f)
-                    return set(state.get("scraped_urls", []))
-            except Exception as e:
-                logger.error(f"Error loading state: {e}")
-        return set()
-
-    def persist_state(self):
-        """Saves current state to file."""
-        os.makedirs(os.path.dirname(self.STATE_FILE), exist_ok=True)
-        with open(self.STATE_FILE, 'w') as f:
-            json.dump({"scraped_urls": list(self.scraped_urls)}, f)
+        return open_seen_store(self.STATE_FILE)
+
+    async def persist_state(self):
+        """Makes the journaled state durable."""
+        await self.scraped_urls.flush()
 
     async def fetch_listing_links(self) -> List[str]:
         """Identifies article links on the People.com homepage/listing page."""
@@ -67,8 +59,7 @@ class PeopleScraper(BaseScraper):
         """Scrapes full details for a single People.com article into the 28-field schema."""
         logger.info(f"People: Scraping details for {url}")
         try:
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            await asyncio.sleep(random.uniform(2, 5))
+            await polite_goto(self.page, url, wait_until="domcontentloaded", timeout=60000)
             
             # Extract basic data
             title_node = self.page.locator("h1").first
@@ -191,8 +182,7 @@ class PeopleScraper(BaseScraper):
         if await load_more.count() > 0 and await load_more.first.is_visible():
             logger.info("People: Clicking 'Load More'...")
             try:
-                await load_more.first.click(force=True)
-                await asyncio.sleep(5)
+                await polite_click(self.page, load_more.first, settle=5, force=True)
                 return True
             except:
                 pass
@@ -202,8 +192,7 @@ class PeopleScraper(BaseScraper):
         if await next_button.count() > 0:
             logger.info("People: Moving to next page...")
             try:
-                await next_button.first.click()
-                await asyncio.sleep(4)
+                await polite_click(self.page, next_button.first, settle=4)
                 return True
             except:
                 pass
@@ -224,26 +213,23 @@ class PeopleScraper(BaseScraper):
         output_file = "data/entertainment/people_data.csv"
         Exporter.to_csv(data, output_file)
 
+    def record_article(self, url: str, detail: Dict):
+        """Adds a scraped article (numbered in completion order) to the data and the seen-URL journal."""
+        detail["row_id"] = len(self.all_data) + 1
+        self.all_data.append(detail)
+        self.scraped_urls.add(url)  # Journaled; fsynced in batches off the event loop
+        self.emit("item", item=detail)
+
     async def scrape(self) -> List[Dict]:
         """Main entry point for the modular scraping flow."""
-        await self.page.goto(self.BASE_URL, wait_until="domcontentloaded")
-        page_count = 1
-        
-        while len(self.all_data) < 200 and page_count <= 50:
-            links = await self.fetch_listing_links()
-            new_links = self.deduplicate_records(links)
-            
-            for url in new_links:
-                detail = await self.scrape_article_details(url)
-                if detail:
-                    self.all_data.append(detail)
-                    self.scraped_urls.add(url)
-                    self.persist_state()
-                
-            if not await self.handle_pagination():
-                break
-            page_count += 1
-            
+        await polite_goto(self.page, self.BASE_URL, wait_until="domcontentloaded")
+
+        # Listing tab stays on the listing; detail tabs consume the discovered URLs
+        try:
+            await ArticlePipeline(self, target=200, max_pages=50).run()
+        finally:
+            await self.persist_state()
+
         self.save_to_csv(self.all_data)
         logger.info(f"People: Total articles scraped: {len(self.all_data)}")
         return self.all_data
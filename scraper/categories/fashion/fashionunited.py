@@ -2,12 +2,65 @@ from scraper.core.base_scraper import BaseScraper
 import json
 import logging
 from typing import List, Dict
+from parsel import Selector
 
 logger = logging.getLogger(__name__)
 
 class FashionUnitedScraper(BaseScraper):
     CATEGORY = "Fashion"
     BASE_URL = "https://fashionunited.in/news/fashion"
+    BLOCK_PROFILE = "text-only"  # Reads __NEXT_DATA__ JSON
+    FETCH_MODE = "static"
+    READY_SELECTOR = "script#__NEXT_DATA__"
+    INCREMENTAL = True
+
+    def parse_next_data(self, json_text: str) -> List[Dict]:
+        """
+        Extracts articles from the Next.js __NEXT_DATA__ payload (apolloState).
+        """
+        items = []
+        data = json.loads(json_text)
+        
+        # Traverse to find articles in apolloState
+        apollo_state = data.get('props', {}).get('pageProps', {}).get('apolloState', {})
+        
+        for key, node in apollo_state.items():
+            if key.startswith('LocalNewsArticle:') and isinstance(node, dict):
+                title = node.get('title', '')
+                summary = node.get('summary') or node.get('description', '')
+                # Construct URL
+                path = node.get('path', '')
+                url = f"https://fashionunited.in{path}" if path else ""
+                
+                # Get image
+                image_url = ""
+                images = node.get('imageUrls')
+                if images and isinstance(images, list) and len(images) > 0:
+                    image_url = images[0]
+                    
+                if title and url:
+                    items.append({
+                        "title": title.strip(),
+                        "short_description": summary.strip(),
+                        "sub_category": "Fashion News",
+                        "source_url": url,
+                        "author": "Fashion United",
+                        "image_url": image_url,
+                        "published_date": node.get('insertedAt', '')
+                    })
+        return items
+
+    def extract_static_items(self, selector: Selector) -> List[Dict]:
+        json_text = selector.css("script#__NEXT_DATA__::text").get()
+        if not json_text:
+            return []
+        try:
+            items = self.parse_next_data(json_text)
+        except Exception as e:
+            logger.warning(f"FashionUnited: static JSON extraction failed: {e}")
+            return []
+        logger.info(f"FashionUnited: Extracted {len(items)} items from static JSON.")
+        return items
 
     async def extract_items(self) -> List[Dict]:
         items = []
@@ -22,36 +75,7 @@ class FashionUnitedScraper(BaseScraper):
                 next_data_script = self.page.locator("script#__NEXT_DATA__")
                 if await next_data_script.count() > 0:
                     json_text = await next_data_script.inner_text()
-                    data = json.loads(json_text)
-                    
-                    # Traverse to find articles in apolloState
-                    apollo_state = data.get('props', {}).get('pageProps', {}).get('apolloState', {})
-                    
-                    for key, node in apollo_state.items():
-                        if key.startswith('LocalNewsArticle:') and isinstance(node, dict):
-                            title = node.get('title', '')
-                            summary = node.get('summary') or node.get('description', '')
-                            slug = node.get('slug', '')
-                            # Construct URL
-                            path = node.get('path', '')
-                            url = f"https://fashionunited.in{path}" if path else ""
-                            
-                            # Get image
-                            image_url = ""
-                            images = node.get('imageUrls')
-                            if images and isinstance(images, list) and len(images) > 0:
-                                image_url = images[0]
-                                
-                            if title and url:
-                                items.append({
-                                    "title": title.strip(),
-                                    "short_description": summary.strip(),
-                                    "sub_category": "Fashion News",
-                                    "source_url": url,
-                                    "author": "Fashion United",
-                                    "image_url": image_url,
-                                    "published_date": node.get('insertedAt', '')
-                                })
+                    items = self.parse_next_data(json_text)
                     
                     if items:
                         logger.info(f"FashionUnited: Extracted {len(items)} items from JSON.")
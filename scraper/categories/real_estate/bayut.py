@@ -1,8 +1,14 @@
 
-import asyncio
 import logging
 from typing import List, Dict
+from config import settings
 from scraper.core.base_scraper import BaseScraper
+from scraper.core.response_capture import CapturedResponse, iter_dicts
+from scraper.categories.real_estate.common import merge_listing_record, join_values
+from scraper.categories.real_estate.detail_pool import DetailWorkerPool
+from scraper.categories.real_estate.fingerprints import get_fingerprint_index
+from scraper.core.frontier import open_crawl
+from scraper.core.politeness import polite_click
 from scraper.utils.text_cleaner import TextCleaner
 from datetime import datetime
 
@@ -10,31 +16,42 @@ logger = logging.getLogger(__name__)
 
 class BayutScraper(BaseScraper):
     CATEGORY = "Real Estate"
+    RESULT_TTL = settings.RESULT_TTL_REAL_ESTATE
     BASE_URL = "https://www.bayut.com/for-sale/property/uae/"
+    BLOCK_PROFILE = "allow-all"  # Manual CAPTCHA solving needs every asset
+    # Search results come from Algolia multi-queries ("hits")
+    CAPTURE_PATTERNS = [r"algolia(net)?\.(net|com)/1/indexes/"]
 
     async def scrape(self) -> List[Dict]:
         self.data = []
+        self.listing_records = {}
         try:
-            await self.navigate(self.BASE_URL)
-            
-            # Bayut also has Cloudflare/Anti-bot. 
-            # We'll try to iterate listings on the main page.
-            
-            # Collect listing URLs
-            listing_urls = await self._collect_listing_urls(max_pages=3)
-            logger.info(f"[{self.CATEGORY}] Found {len(listing_urls)} listings.")
+            crawl = await open_crawl(type(self).__name__, self.run_id)
+            index = get_fingerprint_index(type(self).__name__)
+            if not crawl.discovered:
+                self.start_capture()
+                await self.navigate(self.BASE_URL)
+
+                # Bayut also has Cloudflare/Anti-bot.
+                # We'll try to iterate listings on the main page.
+
+                # Collect listing URLs
+                listing_urls = await self._collect_listing_urls(max_pages=3)
+                # Listings whose card is unchanged reuse their stored details
+                await index.enqueue_changed(crawl, listing_urls, self.listing_records)
+                await crawl.mark_discovered()
+                logger.info(f"[{self.CATEGORY}] Found {len(listing_urls)} listings.")
             
-            for url in listing_urls:
-                try:
-                    # In a real scenario, we might want to just extract from the listing card to be faster/safer
-                    # But requirement says "From the listing detail page".
-                    item = await self._scrape_detail(url)
-                    if item:
-                        self.data.append(item)
-                    await asyncio.sleep(2)
-                except Exception as e:
-                    logger.error(f"Error scraping {url}: {e}")
+            # Requirement says "From the listing detail page", so every URL is visited,
+            # spread over the detail worker pool
+            for result in await DetailWorkerPool(self).run(crawl, "_scrape_detail"):
+                if result.error:
+                    logger.error(f"Error scraping {result.url}: {result.error}")
+                elif result.data:
+                    await index.record_fetched(result.url, self.listing_records.get(result.url), result.data)
+                    self.data.append(merge_listing_record(result.data, self.listing_records.get(result.url)))
                     
+            await crawl.finish()
             return self.data
             
         except Exception as e:
@@ -50,27 +67,59 @@ class BayutScraper(BaseScraper):
             except:
                 break
                 
-            # Extract links
-            # Bayut listing cards often have a link to the details
-            links = await self.page.evaluate("""
-                () => {
-                    return Array.from(document.querySelectorAll("article a")).map(a => a.href)
-                        .filter(h => h.includes('/property/details'));
-                }
-            """)
+            # Prefer listings from the captured search API payloads
+            records = self.parse_listing_payloads(await self.capture.wait(timeout=5))
+            self.listing_records.update(records)
+            links = list(records.keys())
+            
+            if not links:
+                # Fallback: Bayut listing cards often have a link to the details
+                links = await self.page.evaluate("""
+                    () => {
+                        return Array.from(document.querySelectorAll("article a")).map(a => a.href)
+                            .filter(h => h.includes('/property/details'));
+                    }
+                """)
             urls.update(links)
             
             # Next page
             # Bayut simplified pagination
             next_btn = self.page.locator("a[title='Next'], button[title='Next']").first
             if await next_btn.count() > 0 and await next_btn.is_visible():
-                await next_btn.click()
-                await asyncio.sleep(3)
+                await polite_click(self.page, next_btn, settle=3)
             else:
                 break
                 
         return list(urls)
 
+    def parse_listing_payloads(self, payloads: List[CapturedResponse]) -> Dict[str, Dict]:
+        """
+        Maps Algolia hits to listing records keyed by detail URL.
+        """
+        records = {}
+        for payload in payloads:
+            for hit in iter_dicts(payload.data, "hits"):
+                external_id = hit.get("externalID")
+                if not external_id:
+                    continue
+                url = f"https://www.bayut.com/property/details-{external_id}.html"
+                
+                locations = [loc.get("name") for loc in hit.get("location", []) if isinstance(loc, dict)]
+                cover = hit.get("coverPhoto") or {}
+                records[url] = {
+                    "source_url": url,
+                    "title": TextCleaner.clean(str(hit.get("title") or "")),
+                    "price": str(hit.get("price") or ""),
+                    "address": join_values(*reversed(locations)),
+                    "amenities": join_values(
+                        f"{hit['rooms']} Beds" if hit.get("rooms") else "",
+                        f"{hit['baths']} Baths" if hit.get("baths") else "",
+                        f"Area: {hit['area']}" if hit.get("area") else ""
+                    ),
+                    "images": cover.get("url", "") if isinstance(cover, dict) else ""
+                }
+        return records
+
     async def _scrape_detail(self, url):
         await self.navigate(url)
         
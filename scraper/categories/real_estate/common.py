@@ -0,0 +1,21 @@
+from typing import Dict, Optional
+
+# Values the detail scrapers emit when a field could not be read from the DOM
+MISSING_VALUES = ("", "N/A", "0", None)
+
+def merge_listing_record(details: Dict, record: Optional[Dict]) -> Dict:
+    """
+    Fills fields the detail page could not provide with the values captured
+    from the listing API payload for the same URL.
+    """
+    if not record:
+        return details
+    for key, val in record.items():
+        if details.get(key) in MISSING_VALUES and val not in MISSING_VALUES:
+            details[key] = val
+    return details
+
+def join_values(*parts) -> str:
+    """Joins the non-empty parts with ', ' (or 'N/A' if none)."""
+    values = [str(p) for p in parts if p not in MISSING_VALUES]
+    return ", ".join(values) if values else "N/A"
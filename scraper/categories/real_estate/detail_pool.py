@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from config import settings
+from scraper.core.browser_pool import page_slot
+from scraper.core.frontier import Crawl, DONE, FAILED
+from scraper.categories.real_estate.common import merge_listing_record
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class DetailResult:
+    url: str
+    data: Optional[Dict] = None
+    error: str = ""
+
+class DetailWorkerPool:
+    """
+    Visits the detail URLs of a frontier crawl on several pages of the scraper's browser
+    context at once. The first worker reuses the listing page, so cookies and any solved
+    CAPTCHA carry over; the rest are opened on the same context and closed afterwards.
+    Each extra page holds a slot of the server's browser pool while open (see page_slot),
+    so detail workers count against the process-wide page limit. The first worker does not
+    wait for them, and the ones still waiting when it runs out of URLs are dropped: with
+    every slot leased to a scraper, the run goes on with the listing page alone.
+    Each worker drives its own scraper instance bound to its page and leases URLs from the
+    crawl, so an interrupted run resumes with only the unfinished URLs. Pacing comes from
+    the per-domain politeness controller every navigation goes through. Failing URLs are
+    retried by the frontier, then reported in their DetailResult instead of aborting the run.
+    """
+    def __init__(self, scraper, workers: int = settings.DETAIL_WORKERS):
+        self.scraper = scraper
+        self.workers = max(1, workers)
+
+    async def run(self, crawl: Crawl, method: str) -> List[DetailResult]:
+        """
+        Calls `method(url)` on a worker scraper for every pending URL of `crawl`.
+        Returns one result per finished URL of the crawl (including ones finished by an
+        earlier, interrupted run) in enqueue order. Results must be JSON-serializable.
+        """
+        pending = await crawl.pending()
+        if pending:
+            waiting = set()
+            extras = [asyncio.create_task(self._extra_worker(crawl, method, waiting))
+                      for _ in range(min(self.workers, pending) - 1)]
+            waiting.update(extras)
+            try:
+                await self._work(self.scraper.page, crawl, method)
+            except BaseException:
+                waiting.update(extras)
+                raise
+            finally:
+                for task in waiting:
+                    task.cancel()
+                results = await asyncio.gather(*extras, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return [DetailResult(entry.url, entry.result, entry.error if entry.state == FAILED else "")
+                for entry in await crawl.entries()]
+
+    async def _extra_worker(self, crawl: Crawl, method: str, waiting: set):
+        async with page_slot():
+            waiting.discard(asyncio.current_task())
+            # The other workers may have finished the crawl while this one waited for a slot
+            if not await crawl.pending():
+                return
+            page = await self.scraper.page.context.new_page()
+            try:
+                await self._work(page, crawl, method)
+            finally:
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.debug(f"Error closing detail worker page: {e}")
+
+    async def _work(self, page, crawl: Crawl, method: str):
+        worker = type(self.scraper)(page)
+        while True:
+            leased = await crawl.lease()
+            if not leased:
+                return
+            url = leased[0].url
+            counts = await crawl.counts()
+            logger.info(f"[{type(worker).__name__}] Scraping details for ({counts[DONE] + counts[FAILED] + 1}/"
+                        f"{sum(counts.values())}): {url}")
+            try:
+                data = await getattr(worker, method)(url)
+                await crawl.complete(url, data)
+                if data:
+                    records = getattr(self.scraper, "listing_records", {})
+                    self._emit("item", item=merge_listing_record(dict(data), records.get(url)))
+            except Exception as e:
+                if await crawl.fail(url, str(e)):
+                    logger.warning(f"[{type(worker).__name__}] {url} failed ({e}), will retry")
+                else:
+                    self._emit("error", url=url, error=str(e))
+            counts = await crawl.counts()
+            self._emit("progress", stage="details", done=counts[DONE] + counts[FAILED], total=sum(counts.values()))
+
+    def _emit(self, kind: str, **payload):
+        # Scrapers outside BaseScraper (e.g. ZoloExtractor) have no event listener
+        emit = getattr(self.scraper, "emit", None)
+        if emit:
+            emit(kind, **payload)
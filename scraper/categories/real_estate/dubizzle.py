@@ -2,14 +2,25 @@
 import asyncio
 import logging
 from typing import List, Dict
+from config import settings
 from scraper.core.base_scraper import BaseScraper
+from scraper.core.response_capture import CapturedResponse, iter_dicts, localized
+from scraper.categories.real_estate.common import merge_listing_record, join_values
+from scraper.categories.real_estate.detail_pool import DetailWorkerPool
+from scraper.categories.real_estate.fingerprints import get_fingerprint_index
+from scraper.core.frontier import open_crawl
+from scraper.core.politeness import polite_click
 from scraper.utils.text_cleaner import TextCleaner
 
 logger = logging.getLogger(__name__)
 
 class DubizzleScraper(BaseScraper):
     CATEGORY = "Real Estate"
+    RESULT_TTL = settings.RESULT_TTL_REAL_ESTATE
     BASE_URL = "https://dubai.dubizzle.com/en/property-for-sale/residential/"
+    BLOCK_PROFILE = "allow-all"  # Manual CAPTCHA solving needs every asset
+    # Listing search results are served as JSON (Algolia "hits")
+    CAPTURE_PATTERNS = [r"algolia(net)?\.(net|com)/1/indexes/", r"dubizzle\.com/.*/api/.*search"]
 
     async def extract_items(self) -> List[Dict]:
         """
@@ -27,30 +38,32 @@ class DubizzleScraper(BaseScraper):
         3. Visit each listing URL to extract detailed data.
         """
         self.data = []
+        self.listing_records = {}
         try:
-            # 1. Navigate to Homepage / Listing Page
-            await self.navigate(self.BASE_URL)
-            
-            # 2. Collect Listing URLs (Pagination Handling)
-            listing_urls = await self._collect_listing_urls(max_pages=3) # Limit pages for safety
-            logger.info(f"[{self.CATEGORY}] Found {len(listing_urls)} unique listings to scrape.")
+            # An interrupted run resumes its crawl; discovery is skipped if it had finished
+            crawl = await open_crawl(type(self).__name__, self.run_id)
+            index = get_fingerprint_index(type(self).__name__)
+            if not crawl.discovered:
+                # 1. Navigate to Homepage / Listing Page (capturing the search API responses)
+                self.start_capture()
+                await self.navigate(self.BASE_URL)
+
+                # 2. Collect Listing URLs (Pagination Handling)
+                listing_urls = await self._collect_listing_urls(max_pages=3) # Limit pages for safety
+                # Listings whose card is unchanged reuse their stored details
+                await index.enqueue_changed(crawl, listing_urls, self.listing_records)
+                await crawl.mark_discovered()
+                logger.info(f"[{self.CATEGORY}] Found {len(listing_urls)} unique listings to scrape.")
             
-            # 3. Visit each listing
-            for i, url in enumerate(listing_urls):
-                try:
-                    logger.info(f"[{self.CATEGORY}] Scraping details for ({i+1}/{len(listing_urls)}): {url}")
-                    details = await self._scrape_detail_page(url)
-                    if details:
-                        self.data.append(details)
-                    
-                    # Random delay between requests
-                    import random
-                    await asyncio.sleep(random.uniform(2, 5))
-                    
-                except Exception as e:
-                    logger.error(f"Failed to scrape listing {url}: {e}")
-                    continue
+            # 3. Visit the listings concurrently, leasing them from the crawl frontier
+            for result in await DetailWorkerPool(self).run(crawl, "_scrape_detail_page"):
+                if result.error:
+                    logger.error(f"Failed to scrape listing {result.url}: {result.error}")
+                elif result.data:
+                    await index.record_fetched(result.url, self.listing_records.get(result.url), result.data)
+                    self.data.append(merge_listing_record(result.data, self.listing_records.get(result.url)))
 
+            await crawl.finish()
             return self.data
 
         except Exception as e:
@@ -97,13 +110,19 @@ class DubizzleScraper(BaseScraper):
                 logger.error(f"[{self.CATEGORY}] Failed to load listings on page {current_page} after waiting.")
                 break
 
-            # Extract URLs from current page
-            links = await self.page.evaluate("""
-                () => {
-                    const anchors = Array.from(document.querySelectorAll("[data-testid='listing-card'] a, article a"));
-                    return anchors.map(a => a.href).filter(href => href.includes('/property-for-sale/') || href.includes('/property-for-rent/'));
-                }
-            """)
+            # Prefer listings from the captured search API payloads
+            records = self.parse_listing_payloads(await self.capture.wait(timeout=5))
+            self.listing_records.update(records)
+            links = list(records.keys())
+            
+            if not links:
+                # Fallback: Extract URLs from current page DOM
+                links = await self.page.evaluate("""
+                    () => {
+                        const anchors = Array.from(document.querySelectorAll("[data-testid='listing-card'] a, article a"));
+                        return anchors.map(a => a.href).filter(href => href.includes('/property-for-sale/') || href.includes('/property-for-rent/'));
+                    }
+                """)
             
             new_urls = set(links) - collected_urls
             logger.info(f"Found {len(new_urls)} new listings on page {current_page}.")
@@ -115,9 +134,7 @@ class DubizzleScraper(BaseScraper):
             
             if await next_button.count() > 0 and await next_button.is_visible():
                 try:
-                    await next_button.click()
-                    await self.page.wait_for_load_state('networkidle')
-                    await asyncio.sleep(3)
+                    await polite_click(self.page, next_button, wait_until='networkidle', settle=3)
                     current_page += 1
                 except Exception as e:
                     logger.warning(f"Failed to click next page: {e}")
@@ -128,6 +145,39 @@ class DubizzleScraper(BaseScraper):
                 
         return list(collected_urls)
 
+    def parse_listing_payloads(self, payloads: List[CapturedResponse]) -> Dict[str, Dict]:
+        """
+        Maps search API hits to listing records keyed by detail URL.
+        Field names follow the search index; missing ones are left for the detail page.
+        """
+        records = {}
+        for payload in payloads:
+            for hit in iter_dicts(payload.data, "hits"):
+                url = localized(hit.get("absolute_url")) or hit.get("url")
+                if not isinstance(url, str) or not url:
+                    continue
+                if url.startswith("/"):
+                    url = f"https://dubai.dubizzle.com{url}"
+                if '/property-for-sale/' not in url and '/property-for-rent/' not in url:
+                    continue
+
+                neighborhoods = localized(hit.get("neighborhoods")) or []
+                photos = hit.get("photos") or hit.get("photo_thumbnails") or []
+                records[url] = {
+                    "source_url": url,
+                    "title": TextCleaner.clean(str(localized(hit.get("name")) or localized(hit.get("title")) or "")),
+                    "price": str(hit.get("price") or ""),
+                    "address": join_values(*neighborhoods) if isinstance(neighborhoods, list) else str(neighborhoods),
+                    "amenities": join_values(
+                        f"{hit['bedrooms']} Beds" if hit.get("bedrooms") else "",
+                        f"{hit['bathrooms']} Baths" if hit.get("bathrooms") else "",
+                        f"{hit['size']} sqft" if hit.get("size") else ""
+                    ),
+                    "images": ", ".join(p for p in photos if isinstance(p, str)),
+                    "id": str(hit.get("objectID") or hit.get("id") or "")
+                }
+        return records
+
     async def _scrape_detail_page(self, url: str) -> Dict:
         """
         Navigates to a specific listing URL and extracts detailed data.
@@ -1,8 +1,10 @@
 
-import asyncio
 import logging
 from typing import List, Dict
+from config import settings
 from scraper.core.base_scraper import BaseScraper
+from scraper.categories.real_estate.detail_pool import DetailWorkerPool
+from scraper.core.frontier import open_crawl
 from scraper.utils.text_cleaner import TextCleaner
 from datetime import datetime
 
@@ -10,31 +12,34 @@ logger = logging.getLogger(__name__)
 
 class EmaarScraper(BaseScraper):
     CATEGORY = "Real Estate"
+    RESULT_TTL = settings.RESULT_TTL_REAL_ESTATE
     BASE_URL = "https://properties.emaar.com/en/our-communities/"
 
     async def scrape(self) -> List[Dict]:
         self.data = []
         try:
-            await self.navigate(self.BASE_URL)
-            
-            # Emaar "Our Communities" page lists projects/communities.
-            # We will treat each community card as a listing, or find a search endpoint.
-            # The structure usually has cards with "Starting Price", "Location", "Title".
-            
-            # 1. Collect Listing URLs (Project Links)
-            project_links = await self._collect_project_links()
-            logger.info(f"[{self.CATEGORY}] Found {len(project_links)} projects.")
+            crawl = await open_crawl(type(self).__name__, self.run_id)
+            if not crawl.discovered:
+                await self.navigate(self.BASE_URL)
+
+                # Emaar "Our Communities" page lists projects/communities.
+                # We will treat each community card as a listing, or find a search endpoint.
+                # The structure usually has cards with "Starting Price", "Location", "Title".
+
+                # 1. Collect Listing URLs (Project Links)
+                project_links = await self._collect_project_links()
+                await crawl.enqueue(project_links)
+                await crawl.mark_discovered()
+                logger.info(f"[{self.CATEGORY}] Found {len(project_links)} projects.")
             
             # 2. Visit details
-            for url in project_links:
-                try:
-                    item = await self._scrape_project(url)
-                    if item:
-                        self.data.append(item)
-                    await asyncio.sleep(1)
-                except Exception as e:
-                    logger.error(f"Error scraping Emaar project {url}: {e}")
+            for result in await DetailWorkerPool(self).run(crawl, "_scrape_project"):
+                if result.error:
+                    logger.error(f"Error scraping Emaar project {result.url}: {result.error}")
+                elif result.data:
+                    self.data.append(result.data)
                     
+            await crawl.finish()
             return self.data
         except Exception as e:
             logger.error(f"Emaar scrape failed: {e}")
@@ -0,0 +1,121 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from config import settings
+from scraper.core.frontier import Crawl
+from scraper.core.http_cache import HttpCache
+
+logger = logging.getLogger(__name__)
+
+# Card fields whose change means the detail page must be fetched again
+CARD_FIELDS = ("title", "price", "address", "amenities")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    scope TEXT NOT NULL,
+    listing_key TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (scope, listing_key)
+);
+"""
+
+def card_fingerprint(card: Optional[Dict]) -> str:
+    """
+    Hash of what a listing card shows: price, title, key facts and thumbnail.
+    Empty when no card was captured, which never matches a stored fingerprint.
+    """
+    if not card:
+        return ""
+    images = card.get("images") or ""
+    if isinstance(images, str):
+        images = images.split(",")
+    values = [card.get(field, "") for field in CARD_FIELDS]
+    values.append(str(images[0]).strip() if images else "")
+    return hashlib.sha1(json.dumps(values, sort_keys=True, default=str).encode()).hexdigest()
+
+class FingerprintIndex:
+    """
+    Persistent index of the real-estate listings of one scraper, keyed by canonical
+    listing URL (the listing id on these sites). Stores the card fingerprint seen when
+    the detail page was last fetched, and that detail payload, so a later run only
+    revisits listings whose card changed or whose payload is older than
+    FINGERPRINT_MAX_AGE. Listings without a captured card are neither looked up nor
+    recorded. The async methods run their SQLite work in a thread, off the event loop.
+    """
+    def __init__(self, scope: str, path: Path = settings.FINGERPRINT_DB,
+                 max_age: float = settings.FINGERPRINT_MAX_AGE):
+        self.scope = scope
+        self.max_age = max_age
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def lookup(self, url: str, fingerprint: str) -> Optional[Dict]:
+        """The stored detail payload of `url`, if its card is unchanged and the payload is fresh."""
+        if not fingerprint:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, payload, fetched_at FROM listings WHERE scope = ? AND listing_key = ?",
+                (self.scope, HttpCache.canonical_url(url))
+            ).fetchone()
+        if not row or row[0] != fingerprint or time.time() - row[2] > self.max_age:
+            return None
+        return json.loads(row[1])
+
+    def record(self, url: str, fingerprint: str, payload: Dict):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listings (scope, listing_key, fingerprint, payload, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.scope, HttpCache.canonical_url(url), fingerprint, json.dumps(payload), time.time())
+            )
+
+    def _record_fetched(self, url: str, fingerprint: str, payload: Dict):
+        if self.lookup(url, fingerprint) is None:
+            self.record(url, fingerprint, payload)
+
+    async def record_fetched(self, url: str, card: Optional[Dict], payload: Dict):
+        """
+        Stores a fetched detail payload; a reused one keeps its original fetch time.
+        Without a card there is nothing to compare a later run against, so nothing is stored.
+        """
+        fingerprint = card_fingerprint(card)
+        if fingerprint:
+            await asyncio.to_thread(self._record_fetched, url, fingerprint, payload)
+
+    async def enqueue_changed(self, crawl: Crawl, urls: Iterable[str], cards: Dict[str, Dict]) -> List[str]:
+        """
+        Enqueues `urls` in the crawl. Listings whose card is unchanged are completed right
+        away with their stored payload, so the detail pool never visits them.
+        Returns the URLs left to fetch.
+        """
+        changed, reused = [], 0
+        for url in await crawl.enqueue(urls):
+            fingerprint = card_fingerprint(cards.get(url))
+            payload = await asyncio.to_thread(self.lookup, url, fingerprint) if fingerprint else None
+            if payload is None:
+                changed.append(url)
+            else:
+                await crawl.complete(url, payload)
+                reused += 1
+        logger.info(f"[{self.scope}] {len(changed)} listings changed or stale, {reused} unchanged reused.")
+        return changed
+
+_indexes: Dict[str, FingerprintIndex] = {}
+
+def get_fingerprint_index(scope: str) -> FingerprintIndex:
+    if scope not in _indexes:
+        _indexes[scope] = FingerprintIndex(scope)
+    return _indexes[scope]
@@ -1,8 +1,14 @@
 
-import asyncio
 import logging
 from typing import List, Dict
+from config import settings
 from scraper.core.base_scraper import BaseScraper
+from scraper.core.response_capture import CapturedResponse, iter_dicts
+from scraper.categories.real_estate.common import merge_listing_record, join_values
+from scraper.categories.real_estate.detail_pool import DetailWorkerPool
+from scraper.categories.real_estate.fingerprints import get_fingerprint_index
+from scraper.core.frontier import open_crawl
+from scraper.core.politeness import polite_click
 from scraper.utils.text_cleaner import TextCleaner
 from datetime import datetime
 
@@ -10,28 +16,39 @@ logger = logging.getLogger(__name__)
 
 class PropertyFinderScraper(BaseScraper):
     CATEGORY = "Real Estate"
+    RESULT_TTL = settings.RESULT_TTL_REAL_ESTATE
     BASE_URL = "https://www.propertyfinder.ae/en/search?c=2&fu=0&rp=y&ob=mr"
+    BLOCK_PROFILE = "allow-all"  # Manual CAPTCHA solving needs every asset
+    # Next.js data requests made when paginating client-side
+    CAPTURE_PATTERNS = [r"/_next/data/.+/search\.json", r"propertyfinder\.ae/api/.*search"]
 
     async def scrape(self) -> List[Dict]:
         self.data = []
+        self.listing_records = {}
         try:
-            await self.navigate(self.BASE_URL)
-            
-            # Property Finder also uses Anti-bot (Cloudflare/human check).
-            # Similar strategy: Collect entries on search page.
-            
-            urls = await self._collect_urls(max_pages=2)
-            logger.info(f"[{self.CATEGORY}] Found {len(urls)} listings.")
+            crawl = await open_crawl(type(self).__name__, self.run_id)
+            index = get_fingerprint_index(type(self).__name__)
+            if not crawl.discovered:
+                self.start_capture()
+                await self.navigate(self.BASE_URL)
+
+                # Property Finder also uses Anti-bot (Cloudflare/human check).
+                # Similar strategy: Collect entries on search page.
+
+                urls = await self._collect_urls(max_pages=2)
+                # Listings whose card is unchanged reuse their stored details
+                await index.enqueue_changed(crawl, urls, self.listing_records)
+                await crawl.mark_discovered()
+                logger.info(f"[{self.CATEGORY}] Found {len(urls)} listings.")
             
-            for url in urls:
-                try:
-                    item = await self._scrape_details(url)
-                    if item:
-                        self.data.append(item)
-                    await asyncio.sleep(2)
-                except Exception as e:
-                    logger.error(f"Error details {url}: {e}")
+            for result in await DetailWorkerPool(self).run(crawl, "_scrape_details"):
+                if result.error:
+                    logger.error(f"Error details {result.url}: {result.error}")
+                elif result.data:
+                    await index.record_fetched(result.url, self.listing_records.get(result.url), result.data)
+                    self.data.append(merge_listing_record(result.data, self.listing_records.get(result.url)))
             
+            await crawl.finish()
             return self.data
         except Exception as e:
             logger.error(f"Property Finder scrape failed: {e}")
@@ -46,21 +63,29 @@ class PropertyFinderScraper(BaseScraper):
             except:
                 break
                 
-            # Extract
-            links = await self.page.evaluate("""
-                () => {
-                    return Array.from(document.querySelectorAll("a[href*='/en/plp/buy/'], a[href*='/en/plp/rent/']")).map(a => a.href);
-                }
-            """)
-            # Fix: Property Finder search results connect to property details. 
-            # The links usually look like /en/plp/buy/... or /en/rent/... NO, those might be searches.
-            # Actual detail links usually contain /property/
+            # Prefer the wire format: the first page ships its results in __NEXT_DATA__,
+            # later pages arrive as captured /_next/data/ JSON responses
+            payloads = await self.capture.wait(timeout=5) if i > 0 else self.capture.drain()
+            if i == 0:
+                next_data = await self.page.evaluate("""
+                    () => {
+                        const el = document.querySelector("script#__NEXT_DATA__");
+                        return el ? JSON.parse(el.textContent) : null;
+                    }
+                """)
+                if next_data:
+                    payloads.append(CapturedResponse(self.page.url, 200, next_data))
+            records = self.parse_listing_payloads(payloads)
+            self.listing_records.update(records)
+            links = list(records.keys())
             
-            links = await self.page.evaluate("""
-                () => {
-                   return Array.from(document.querySelectorAll("a[href*='/property/']")).map(a => a.href);
-                }
-            """)
+            if not links:
+                # Fallback: detail links in the DOM usually contain /property/
+                links = await self.page.evaluate("""
+                    () => {
+                       return Array.from(document.querySelectorAll("a[href*='/property/']")).map(a => a.href);
+                    }
+                """)
             
             collected.update(links)
             
@@ -68,14 +93,45 @@ class PropertyFinderScraper(BaseScraper):
             try:
                 next_btn = self.page.locator("a[aria-label='Next'], a[data-testid='pagination-next']").first
                 if await next_btn.count() > 0 and await next_btn.is_visible():
-                    await next_btn.click()
-                    await asyncio.sleep(3)
+                    await polite_click(self.page, next_btn, settle=3)
                 else: 
                     break
             except: break
             
         return list(collected)
 
+    def parse_listing_payloads(self, payloads: List[CapturedResponse]) -> Dict[str, Dict]:
+        """
+        Maps search result listings ({"property": {...}}) to records keyed by detail URL.
+        """
+        records = {}
+        for payload in payloads:
+            for listing in iter_dicts(payload.data, "listings"):
+                prop = listing.get("property") if isinstance(listing.get("property"), dict) else listing
+                url = prop.get("share_url") or prop.get("details_path")
+                if not isinstance(url, str) or not url:
+                    continue
+                if url.startswith("/"):
+                    url = f"https://www.propertyfinder.ae{url}"
+                
+                price = prop.get("price") or {}
+                location = prop.get("location") or {}
+                size = prop.get("size") or {}
+                images = [img.get("medium") or img.get("small") for img in prop.get("images", []) if isinstance(img, dict)]
+                records[url] = {
+                    "source_url": url,
+                    "title": TextCleaner.clean(str(prop.get("title") or "")),
+                    "price": join_values(price.get("value"), price.get("currency")) if isinstance(price, dict) else str(price),
+                    "address": location.get("full_name", "") if isinstance(location, dict) else str(location),
+                    "amenities": join_values(
+                        f"{prop['bedrooms']} Beds" if prop.get("bedrooms") else "",
+                        f"{prop['bathrooms']} Baths" if prop.get("bathrooms") else "",
+                        join_values(size.get("value"), size.get("unit")) if isinstance(size, dict) and size.get("value") else ""
+                    ),
+                    "images": ", ".join(i for i in images if i)
+                }
+        return records
+
     async def _scrape_details(self, url):
         await self.navigate(url)
         
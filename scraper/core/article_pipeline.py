@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from typing import List, Dict
+from config import settings
+from scraper.core.frontier import open_crawl, DONE
+
+logger = logging.getLogger(__name__)
+
+# How often idle detail tabs and a throttled discovery re-check the frontier (seconds)
+POLL_INTERVAL = 0.5
+
+class ArticlePipeline:
+    """
+    Two-stage crawl for listing -> article scrapers.
+    Discovery keeps the scraper's own tab on the listing (links, dedup, pagination) and
+    enqueues new article URLs in a crawl of the frontier; `workers` detail tabs on the same
+    context lease from it, each driving a scraper instance bound to its tab. Discovery
+    pauses while `queue_size` URLs are pending, so it does not run far ahead of the tabs.
+    An interrupted run resumes its crawl: finished articles are restored from the frontier
+    and only the pending URLs are visited (discovery is skipped if it had completed).
+    In the scraper's incremental mode, discovery stops at the first listing page that
+    reaches the seen frontier instead of paginating on.
+
+    The scraper provides fetch_listing_links, deduplicate_records, handle_pagination,
+    scrape_article_details(url) and record_article(url, detail), plus an `all_data` list.
+    """
+    def __init__(self, scraper, target: int = 200, max_pages: int = 50,
+                 workers: int = settings.ARTICLE_WORKERS,
+                 queue_size: int = settings.ARTICLE_QUEUE_SIZE):
+        self.scraper = scraper
+        self.target = target
+        self.max_pages = max_pages
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.crawl = None
+        self.discovering = False
+
+    @property
+    def done(self) -> bool:
+        return len(self.scraper.all_data) >= self.target
+
+    async def run(self) -> List[Dict]:
+        self.crawl = await open_crawl(type(self.scraper).__name__, self.scraper.run_id)
+        for entry in await self.crawl.entries((DONE,)):
+            if entry.result and not self.done:
+                self.scraper.record_article(entry.url, entry.result)
+
+        context = self.scraper.page.context
+        pages = []
+        self.discovering = not self.crawl.discovered
+        discovery = asyncio.create_task(self._discover()) if self.discovering else None
+        try:
+            for _ in range(self.workers):
+                pages.append(await context.new_page())
+            await asyncio.gather(*(self._work(page) for page in pages))
+        finally:
+            if discovery:
+                discovery.cancel()
+                try:
+                    await discovery
+                except asyncio.CancelledError:
+                    pass
+            for page in pages:
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.debug(f"Error closing article worker page: {e}")
+        await self.crawl.finish()
+        return self.scraper.all_data
+
+    async def _discover(self):
+        page_count = 1
+        try:
+            while not self.done and page_count <= self.max_pages:
+                links = await self.scraper.fetch_listing_links()
+                self.scraper.emit("progress", stage="listing", done=page_count, total=self.max_pages,
+                                  items=len(self.scraper.all_data))
+                await self.crawl.enqueue(self.scraper.deduplicate_records(links))
+                if self.scraper.incremental and self.scraper.at_seen_frontier(links):
+                    logger.info(f"{type(self.scraper).__name__}: reached already-scraped articles, stopping discovery.")
+                    break
+                # Wait while the detail tabs catch up
+                while not self.done and await self.crawl.pending() >= self.queue_size:
+                    await asyncio.sleep(POLL_INTERVAL)
+                if self.done or not await self.scraper.handle_pagination():
+                    break
+                page_count += 1
+            await self.crawl.mark_discovered()
+        except Exception as e:
+            logger.error(f"{type(self.scraper).__name__}: listing discovery failed: {e}")
+        finally:
+            self.discovering = False
+
+    async def _work(self, page):
+        worker = type(self.scraper)(page)
+        while not self.done:
+            leased = await self.crawl.lease()
+            if not leased:
+                if not self.discovering:
+                    break
+                await asyncio.sleep(POLL_INTERVAL)
+                continue
+            url = leased[0].url
+            detail = await worker.scrape_article_details(url)
+            if not detail:
+                await self.crawl.fail(url, "no article details")
+            elif not self.done:
+                await self.crawl.complete(url, detail)
+                self.scraper.record_article(url, detail)
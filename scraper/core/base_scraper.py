@@ -1,8 +1,18 @@
 import logging
 import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
+from urllib.parse import urlparse
 from playwright.async_api import Page
+from parsel import Selector
+from config import settings
+from scraper.core.extraction import ItemSpec, extract_specs, extract_specs_static
+from scraper.core.http_client import fetch_text
+from scraper.core.metrics import ITEMS_EXTRACTED, BLOCK_EVENTS
+from scraper.core.politeness import polite_goto
+from scraper.core.response_capture import ResponseCapture
+from scraper.core.seen_store import SeenStore, open_seen_store
+from scraper.core.snapshot import Snapshot, take_snapshot, parse_off_loop
 from scraper.utils.text_cleaner import TextCleaner
 from datetime import datetime
 
@@ -14,10 +24,65 @@ class BaseScraper(ABC):
     """
     CATEGORY = "General"
     BASE_URL = ""
+    # Resource blocking profile applied to this scraper's browser context
+    # (see scraper.core.resource_blocker.BLOCK_PROFILES)
+    BLOCK_PROFILE = "image-urls"
+    # "browser": always drive a Playwright page.
+    # "static": try a plain HTTP GET + parsel parse first (extract_static_items),
+    # and only escalate to the browser when READY_SELECTOR is missing or nothing is extracted.
+    # "snapshot": render in the browser, take one HTML snapshot and parse it with
+    # extract_static_items in the parse pool, so the tab is free while parsing runs.
+    FETCH_MODE = "browser"
+    READY_SELECTOR = ""
+    # Regex URL patterns of JSON/XHR responses to capture (see start_capture)
+    CAPTURE_PATTERNS: List[str] = []
+    # Declarative listing extraction (see scraper.core.extraction): item groups read
+    # in a single page.evaluate by the default extract_items, in declaration order,
+    # and from parsed HTML by the default extract_static_items.
+    ITEMS: Dict[str, ItemSpec] = {}
+    # Feed-style sites listing newest content first. Their returned URLs are remembered,
+    # and in incremental mode they stop at the seen frontier and only return new items.
+    INCREMENTAL = False
+    # Seen-URL state (defaults to settings.SEEN_STATE_DIR/<class name>.json)
+    STATE_FILE = ""
+    # Seconds the API server reuses this site's scrape result for later requests
+    RESULT_TTL = settings.RESULT_TTL
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Optional[Page]):
         self.page = page
         self.data = []
+        self._static_tried = False
+        self.capture: Optional[ResponseCapture] = None
+        self.incremental = self.INCREMENTAL and settings.INCREMENTAL_CRAWL
+        # Keys this run's frontier crawl; a run given the same id (e.g. a retried queue task) resumes it
+        self.run_id = ""
+        # Optional listener for streamed events, called as events(kind, payload) (see emit)
+        self.events: Optional[Callable[[str, Dict], None]] = None
+
+    def emit(self, kind: str, **payload):
+        """
+        Reports an event to the listener, if any: "item" (item=...) as soon as an item
+        is extracted, "progress" (stage, done, total) during long crawls.
+        """
+        if kind == "item":
+            ITEMS_EXTRACTED.inc(scraper=type(self).__name__)
+        if not self.events:
+            return
+        try:
+            self.events(kind, payload)
+        except Exception as e:
+            logger.debug(f"[{self.CATEGORY}] Event listener failed: {e}")
+
+    def start_capture(self) -> ResponseCapture:
+        """
+        Starts collecting JSON payloads of responses matching CAPTURE_PATTERNS.
+        Call before navigating so the first page's API calls are captured too.
+        """
+        if self.capture:
+            self.capture.detach()
+        self.capture = ResponseCapture(self.CAPTURE_PATTERNS)
+        self.capture.attach(self.page)
+        return self.capture
 
     async def navigate(self, url: str = None):
         target_url = url or self.BASE_URL
@@ -26,8 +91,8 @@ class BaseScraper(ABC):
         
         logger.info(f"[{self.CATEGORY}] Navigating to {target_url}...")
         try:
-            await self.page.goto(target_url, wait_until="domcontentloaded", timeout=60000)
-            await asyncio.sleep(2) # Human-like pause
+            # Paced by the domain's politeness controller instead of a fixed pause
+            await polite_goto(self.page, target_url, wait_until="domcontentloaded", timeout=60000)
         except Exception as e:
             logger.error(f"Navigation failed: {e}")
 
@@ -35,34 +100,182 @@ class BaseScraper(ABC):
         """
         Main logic to identify and extract items from the listing page.
         Should return a list of dictionaries.
+        Defaults to the declarative ITEMS groups.
         """
-        return []
+        if not self.ITEMS:
+            return []
+        groups = await self.extract_declared(self.ITEMS)
+        return [item for name in self.ITEMS for item in groups[name]]
+
+    async def extract_declared(self, specs: Dict[str, ItemSpec]) -> Dict[str, List[Dict]]:
+        """
+        Reads every item of every group in one round trip to the page,
+        instead of one locator call per field per element.
+        """
+        return await extract_specs(self.page, specs)
+
+    async def fetch_static(self, url: str = None) -> Optional[Selector]:
+        """
+        Fetches `url` over plain HTTP and returns a parsel Selector,
+        or None if the request failed or the page fails the readiness check.
+        """
+        target_url = url or self.BASE_URL
+        try:
+            status, html = await fetch_text(target_url)
+        except Exception as e:
+            logger.info(f"[{self.CATEGORY}] Static fetch failed for {target_url}: {e}")
+            return None
+        if status != 200:
+            logger.info(f"[{self.CATEGORY}] Static fetch got HTTP {status} for {target_url}")
+            return None
+        selector = Selector(text=html, base_url=target_url)
+        if not self.is_static_ready(selector):
+            logger.info(f"[{self.CATEGORY}] Static HTML not ready (missing {self.READY_SELECTOR!r}), escalating to browser.")
+            return None
+        return selector
+
+    def is_static_ready(self, selector: Selector) -> bool:
+        """
+        Site-declared readiness check for server-rendered HTML.
+        Defaults to READY_SELECTOR matching at least one element.
+        """
+        if not self.READY_SELECTOR:
+            return True
+        return bool(selector.css(self.READY_SELECTOR))
+
+    def extract_static_items(self, selector: Selector) -> List[Dict]:
+        """
+        Static-mode counterpart of extract_items, working on parsed HTML.
+        Defaults to the declarative ITEMS groups, so both paths share one set of selectors.
+        """
+        if not self.ITEMS:
+            return []
+        groups = extract_specs_static(selector, self.ITEMS)
+        return [item for name in self.ITEMS for item in groups[name]]
+
+    @staticmethod
+    def static_text(selector: Selector) -> str:
+        """Text content of a parsel node (roughly inner_text before cleaning)."""
+        return selector.xpath("string()").get("") if selector else ""
+
+    async def prepare_snapshot(self):
+        """
+        Hook run between navigation and the snapshot (waits, scrolling, dismissing overlays).
+        Defaults to waiting for READY_SELECTOR.
+        """
+        if not self.READY_SELECTOR:
+            return
+        try:
+            await self.page.wait_for_selector(self.READY_SELECTOR, timeout=15000)
+        except Exception:
+            logger.info(f"[{self.CATEGORY}] {self.READY_SELECTOR!r} not found, snapshotting anyway.")
+
+    async def capture_snapshot(self) -> Snapshot:
+        """Navigates and grabs the rendered HTML. The page can be released right after."""
+        await self.navigate()
+        await self.prepare_snapshot()
+        return await take_snapshot(self.page)
+
+    async def parse_snapshot(self, snapshot: Snapshot) -> List[Dict]:
+        """Parses a snapshot with extract_static_items off the event loop and standardizes the result."""
+        items = await parse_off_loop(parse_static_items, type(self), snapshot.html, snapshot.url)
+        return self.standardize_items(items)
+
+    async def scrape_static(self) -> Optional[List[Dict]]:
+        """
+        Static fast path. Returns standardized items, or None when the browser is needed.
+        """
+        self._static_tried = True
+        selector = await self.fetch_static()
+        if selector is None:
+            return None
+        items = self.extract_static_items(selector)
+        if not items:
+            logger.info(f"[{self.CATEGORY}] Static extraction found nothing, escalating to browser.")
+            return None
+        logger.info(f"[{self.CATEGORY}] Static fast path succeeded.")
+        return self.standardize_items(items)
+
+    @property
+    def seen_urls(self) -> SeenStore:
+        return open_seen_store(self.STATE_FILE or str(settings.SEEN_STATE_DIR / f"{type(self).__name__}.json"))
+
+    def at_seen_frontier(self, urls: List[str]) -> bool:
+        """
+        True once a feed has reached content an earlier run already saw:
+        INCREMENTAL_SEEN_STREAK consecutive known URLs, or only known URLs on a shorter page.
+        Feeds list newest first, so everything past that point is older.
+        """
+        if not urls:
+            return False
+        seen = self.seen_urls
+        streak = 0
+        for url in urls:
+            streak = streak + 1 if url in seen else 0
+            if streak >= settings.INCREMENTAL_SEEN_STREAK:
+                return True
+        return streak == len(urls)
+
+    def keep_unseen(self, items: List[Dict]) -> List[Dict]:
+        """
+        Remembers the items' source URLs; in incremental mode, drops the ones
+        an earlier run already returned.
+        """
+        seen = self.seen_urls
+        if self.incremental:
+            fresh = [item for item in items if item.get('source_url') not in seen]
+            logger.info(f"[{self.CATEGORY}] Incremental: {len(fresh)} new of {len(items)} items.")
+            items = fresh
+        for item in items:
+            if item.get('source_url'):
+                seen.add(item['source_url'])
+        # Journal I/O runs in a worker thread, off the event loop
+        seen.schedule_sync()
+        return items
+
+    def standardize_items(self, items: List[Dict]) -> List[Dict]:
+        """
+        Post-processing / Standardization shared by the static and browser paths.
+        """
+        standardized_items = []
+        for item in items:
+            item['category'] = self.CATEGORY
+            item['website'] = self.BASE_URL
+            item['scraped_at'] = datetime.now().isoformat()
+            
+            # Clean text fields
+            for key, val in item.items():
+                if isinstance(val, str):
+                    item[key] = TextCleaner.clean(val)
+            
+            standardized_items.append(item)
+        
+        if self.INCREMENTAL:
+            standardized_items = self.keep_unseen(standardized_items)
+
+        for item in standardized_items:
+            self.emit("item", item=item)
+
+        self.data = standardized_items
+        logger.info(f"[{self.CATEGORY}] Scraped {len(self.data)} items.")
+        return self.data
 
     async def scrape(self) -> List[Dict]:
         """
-        Orchestrates the scraping process: Navigate -> Extract -> Return.
+        Orchestrates the scraping process: (Static fast path ->) Navigate -> Extract -> Return.
         """
         try:
+            if self.FETCH_MODE == "static" and not self._static_tried:
+                data = await self.scrape_static()
+                if data is not None:
+                    return data
+
+            if self.FETCH_MODE == "snapshot":
+                return await self.parse_snapshot(await self.capture_snapshot())
+
             await self.navigate()
             items = await self.extract_items()
-            
-            # Post-processing / Standardization
-            standardized_items = []
-            for item in items:
-                item['category'] = self.CATEGORY
-                item['website'] = self.BASE_URL
-                item['scraped_at'] = datetime.now().isoformat()
-                
-                # Clean text fields
-                for key, val in item.items():
-                    if isinstance(val, str):
-                        item[key] = TextCleaner.clean(val)
-                
-                standardized_items.append(item)
-            
-            self.data = standardized_items
-            logger.info(f"[{self.CATEGORY}] Scraped {len(self.data)} items.")
-            return self.data
+            return self.standardize_items(items)
             
         except Exception as e:
             logger.error(f"Error during scraping {self.CATEGORY}: {e}")
@@ -78,6 +291,14 @@ class BaseScraper(ABC):
         title = await self.page.title()
         if "captcha" in title.lower() or "challenge" in title.lower():
             logger.warning("CAPTCHA detected! Pausing for manual intervention...")
+            BLOCK_EVENTS.inc(domain=urlparse(self.page.url).hostname or "", kind="captcha")
             # In a real scenario, we might wait for user input or element disappearance
             # For now, we wait a bit
             await asyncio.sleep(10)
+
+def parse_static_items(scraper_class, html: str, url: str = "") -> List[Dict]:
+    """
+    Parse-pool entry point (module level so it pickles): runs the scraper's
+    extract_static_items on a snapshot without a page.
+    """
+    return scraper_class(None).extract_static_items(Selector(text=html, base_url=url or None))
@@ -1,9 +1,27 @@
 import asyncio
 import logging
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from scraper.core.metrics import BROWSER_LAUNCHES, BROWSER_LAUNCH_SECONDS, CONTEXTS_CREATED
 
 logger = logging.getLogger(__name__)
 
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+]
+
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 800},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+}
+
+# Init script to avoid detection
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+"""
+
 class BrowserManager:
     """
     Manages the Playwright Browser instance and Contexts.
@@ -24,23 +42,23 @@ class BrowserManager:
     async def start(self):
         logger.info("Starting Browser Manager...")
         self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-            ]
-        )
-        self.context = await self.browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
-        )
-        # Add init scripts to avoid detection
-        await self.context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        with BROWSER_LAUNCH_SECONDS.time(owner="manager"):
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=LAUNCH_ARGS
+            )
+        BROWSER_LAUNCHES.inc(owner="manager")
+        self.context = await self.new_context(self.browser)
+
+    @staticmethod
+    async def new_context(browser: Browser) -> BrowserContext:
+        """
+        Creates a context on `browser` with the standard viewport, user agent and stealth script.
+        """
+        context = await browser.new_context(**CONTEXT_OPTIONS)
+        CONTEXTS_CREATED.inc()
+        await context.add_init_script(STEALTH_SCRIPT)
+        return context
 
     async def get_page(self) -> Page:
         if not self.context:
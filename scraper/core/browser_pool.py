@@ -0,0 +1,301 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import List, Dict, Optional
+from playwright.async_api import async_playwright, Browser, Page
+from scraper.core.browser_manager import BrowserManager, LAUNCH_ARGS
+from scraper.core.resource_blocker import ResourceBlocker
+from scraper.core.http_cache import get_cache
+from scraper.core.metrics import BROWSER_LAUNCHES, BROWSER_LAUNCH_SECONDS
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# The pool running in this process, whose page limit page_slot() enforces
+_active_pool: Optional["BrowserPool"] = None
+
+class PooledBrowser:
+    """
+    A launched Chromium process and the number of contexts currently leased from it.
+    """
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.leases = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self.browser.is_connected()
+
+class BrowserPool:
+    """
+    Long-lived pool of Chromium processes owned by the server.
+    Each lease gets a fresh, isolated context (and page) on the least loaded browser.
+    Browsers are launched lazily up to `size` and replaced when they disconnect.
+    At most `max_pages` pages are open at once across all requests: every lease and every
+    extra page a scraper opens on its leased context (see page_slot) takes one.
+    """
+    def __init__(self, size: int = settings.BROWSER_POOL_SIZE, headless: bool = True,
+                 contexts_per_browser: int = settings.BROWSER_POOL_CONTEXTS_PER_BROWSER,
+                 health_interval: int = settings.BROWSER_POOL_HEALTH_INTERVAL,
+                 max_pages: int = settings.MAX_CONCURRENT_PAGES):
+        self.size = max(1, size)
+        self.headless = headless
+        self.contexts_per_browser = max(1, contexts_per_browser)
+        self.health_interval = health_interval
+        self.max_pages = max(1, max_pages)
+        self.open_pages = 0
+        self.playwright = None
+        self.browsers: List[PooledBrowser] = []
+        self._launching = 0  # Browser slots reserved by launches in progress
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._pages: Optional[asyncio.Semaphore] = None
+        self._health_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._background_lock = threading.Lock()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def start(self):
+        logger.info(f"Starting Browser Pool (size={self.size}, headless={self.headless})...")
+        global _active_pool
+        self._condition = asyncio.Condition()
+        self._pages = asyncio.Semaphore(self.max_pages)
+        try:
+            self.playwright = await async_playwright().start()
+            self.browsers.append(await self._launch())
+        except BaseException:
+            await self.stop()
+            raise
+        self._health_task = asyncio.create_task(self._health_loop())
+        # `submit` targets the loop the pool runs on: its own thread, or the async server's.
+        # Only set once started, so a failed start is retried by the next call.
+        self._loop = asyncio.get_running_loop()
+        _active_pool = self
+
+    async def stop(self):
+        global _active_pool
+        logger.info("Stopping Browser Pool...")
+        if _active_pool is self:
+            _active_pool = None
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        for pooled in self.browsers:
+            try:
+                await pooled.browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled browser: {e}")
+        self.browsers = []
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def _launch(self) -> PooledBrowser:
+        """
+        Launches a new browser. Called without the condition lock, so leases on the
+        running browsers are not held up by the launch; the caller adds it to the pool.
+        """
+        with BROWSER_LAUNCH_SECONDS.time(owner="pool"):
+            browser = await self.playwright.chromium.launch(headless=self.headless, args=LAUNCH_ARGS)
+        BROWSER_LAUNCHES.inc(owner="pool")
+        logger.info(f"Browser Pool: launched browser {len(self.browsers) + 1}/{self.size}")
+        return PooledBrowser(browser)
+
+    def _prune(self):
+        """Drops disconnected browsers. Caller must hold the condition lock."""
+        dead = [b for b in self.browsers if not b.healthy]
+        for pooled in dead:
+            logger.warning("Browser Pool: dropping disconnected browser.")
+            self.browsers.remove(pooled)
+
+    async def _acquire(self) -> PooledBrowser:
+        async with self._condition:
+            while True:
+                self._prune()
+                available = [b for b in self.browsers if b.leases < self.contexts_per_browser]
+                if available:
+                    pooled = min(available, key=lambda b: b.leases)
+                    pooled.leases += 1
+                    return pooled
+                if len(self.browsers) + self._launching < self.size:
+                    # Reserve the browser slot, then launch outside the lock
+                    self._launching += 1
+                    break
+                await self._condition.wait()
+        pooled = None
+        try:
+            pooled = await self._launch()
+            pooled.leases += 1
+            return pooled
+        finally:
+            async with self._condition:
+                self._launching -= 1
+                if pooled:
+                    self.browsers.append(pooled)
+                # Waiters get the new browser's spare leases, or the slot of a failed launch
+                self._condition.notify_all()
+
+    async def _release(self, pooled: PooledBrowser):
+        async with self._condition:
+            pooled.leases -= 1
+            self._condition.notify()
+
+    @asynccontextmanager
+    async def page_slot(self):
+        """Holds one of the pool's `max_pages` page slots for the duration of the block."""
+        async with self._pages:
+            self.open_pages += 1
+            try:
+                yield
+            finally:
+                self.open_pages -= 1
+
+    @asynccontextmanager
+    async def lease(self, block_profile: str = "allow-all"):
+        """
+        Leases a page in a fresh context with the given resource blocking profile.
+        The context is closed when the block exits.
+        Usage: async with pool.lease("text-only") as page: ...
+        """
+        async with self.page_slot():
+            async with self._lease(block_profile) as page:
+                yield page
+
+    @asynccontextmanager
+    async def _lease(self, block_profile: str):
+        blocker = ResourceBlocker(block_profile, cache=get_cache())
+        pooled = await self._acquire()
+        context = None
+        try:
+            context = await BrowserManager.new_context(pooled.browser)
+            await blocker.attach(context)
+            page = await context.new_page()
+            yield page
+        finally:
+            self.blocked_requests += blocker.blocked_requests
+            self.bytes_saved += blocker.bytes_saved
+            if blocker.blocked_requests:
+                logger.info(f"Browser Pool: lease blocked {blocker.blocked_requests} requests "
+                            f"(~{blocker.bytes_saved // 1024} KB saved, profile={block_profile})")
+            if context:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.debug(f"Error closing leased context: {e}")
+            await self._release(pooled)
+
+    async def health_check(self) -> Dict:
+        """Prunes dead browsers, keeps at least one warm, and reports pool occupancy."""
+        async with self._condition:
+            self._prune()
+            relaunch = not self.browsers and not self._launching
+            if relaunch:
+                self._launching += 1
+        if relaunch:
+            try:
+                pooled = await self._launch()
+            except Exception as e:
+                logger.error(f"Browser Pool: relaunch failed: {e}")
+                pooled = None
+            async with self._condition:
+                self._launching -= 1
+                if pooled:
+                    self.browsers.append(pooled)
+        async with self._condition:
+            self._condition.notify_all()
+            return {
+                "browsers": len(self.browsers),
+                "max_browsers": self.size,
+                "leased_contexts": sum(b.leases for b in self.browsers),
+                "leased_pages": self.open_pages,
+                "capacity": self.max_pages,
+                "blocked_requests": self.blocked_requests,
+                "estimated_bytes_saved": self.bytes_saved,
+                "http_cache": get_cache().stats() if get_cache() else None
+            }
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self.health_check()
+            except Exception as e:
+                logger.error(f"Browser Pool health check failed: {e}")
+
+    # --- Background loop for synchronous servers (Flask) ---
+    def start_background(self):
+        """
+        Starts the pool on a dedicated event loop thread so that synchronous
+        request handlers can submit coroutines to it via `run`.
+        Does nothing if the pool already runs on a loop.
+        """
+        with self._background_lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="BrowserPool", daemon=True)
+            thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(self.start(), loop).result()
+            except BaseException:
+                # Leave no half-started loop behind, so the next call tries again
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join(timeout=5)
+                if not thread.is_alive():
+                    loop.close()
+                self._loop = None
+                raise
+            self._thread = thread
+
+    @property
+    def background_running(self) -> bool:
+        return self._loop is not None and self._thread is not None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """The pool's loop, started in the background on first use (e.g. under `flask run` or WSGI)."""
+        if self._loop is None:
+            self.start_background()
+        return self._loop
+
+    def run(self, coro, timeout: float = None):
+        """Runs `coro` on the pool's loop and blocks until it completes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result(timeout)
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Schedules `coro` on the pool's loop without waiting for it."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def stop_background(self):
+        if not self.background_running:
+            return
+        try:
+            self.run(self.stop(), timeout=30)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop = None
+            self._thread = None
+
+@asynccontextmanager
+async def page_slot():
+    """
+    Holds a page slot of the pool running in this process while a scraper keeps an extra
+    page open next to its leased one (e.g. detail workers), so those count against the
+    process-wide page limit too. Without a running pool (CLI runs) it does not wait.
+    """
+    pool = _active_pool
+    if pool is None:
+        yield
+        return
+    async with pool.page_slot():
+        yield
@@ -4,15 +4,17 @@ import os
 import logging
 from datetime import datetime
 from typing import List, Dict
+from scraper.core.metrics import EXPORT_SECONDS
 
 logger = logging.getLogger(__name__)
 
 class Exporter:
     @staticmethod
-    def to_csv(data: List[Dict], filepath: str):
+    def to_csv(data: List[Dict], filepath: str, append: bool = False):
         """
         Exports a list of dictionaries to CSV. 
         Detects if property schema or DB schema should be used.
+        With `append`, the rows are added to an existing file instead of replacing it.
         """
         if not data:
             logger.warning("No data to export to CSV.")
@@ -68,6 +70,16 @@ class Exporter:
             if directory:
                 os.makedirs(directory, exist_ok=True)
             
+            if append and os.path.exists(filepath):
+                with open(filepath, encoding='utf-8') as f:
+                    header = f.readline().strip()
+                if header == ",".join(df.columns):
+                    df.to_csv(filepath, mode='a', header=False, index=False, encoding='utf-8', na_rep='NULL')
+                    logger.info(f"Successfully appended {len(data)} items to {filepath}")
+                    return
+                # Written with other columns: rewrite it merged
+                df = pd.concat([pd.read_csv(filepath, encoding='utf-8'), df], ignore_index=True)
+
             # Export with NULL for missing values
             df.to_csv(filepath, index=False, encoding='utf-8', na_rep='NULL')
             logger.info(f"Successfully exported {len(data)} items to {filepath}")
@@ -75,9 +87,10 @@ class Exporter:
             logger.error(f"Failed to export CSV: {e}")
 
     @staticmethod
-    def to_json(data: List[Dict], filepath: str):
+    def to_json(data: List[Dict], filepath: str, append: bool = False):
         """
         Exports a list of dictionaries to JSON.
+        With `append`, the items are added to the list already in the file.
         """
         if not data:
             logger.warning("No data to export to JSON.")
@@ -89,8 +102,39 @@ class Exporter:
             if directory:
                 os.makedirs(directory, exist_ok=True)
 
+            if append and os.path.exists(filepath):
+                with open(filepath, encoding='utf-8') as f:
+                    existing = json.load(f)
+                if isinstance(existing, list):
+                    data = existing + data
+
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=4)
             logger.info(f"Successfully exported {len(data)} items to {filepath}")
         except Exception as e:
             logger.error(f"Failed to export JSON: {e}")
+
+    @staticmethod
+    def save_results(data: List[Dict], output_dir: str, website_key: str, output_format: str,
+                     append: bool = False):
+        """
+        Writes a site's scraped data to data/<category>/<site>_data.csv|json
+        An incremental run passes `append`, so its new items extend the earlier export.
+        """
+        with EXPORT_SECONDS.time(format=output_format):
+            os.makedirs(output_dir, exist_ok=True)
+
+            file_path_csv = f"{output_dir}/{website_key}_data.csv"
+            file_path_json = f"{output_dir}/{website_key}_data.json"
+
+            if output_format == 'csv':
+                Exporter.to_csv(data, file_path_csv, append)
+                logger.info(f"Saved CSV to: {os.path.abspath(file_path_csv)}")
+            elif output_format == 'json':
+                Exporter.to_json(data, file_path_json, append)
+                logger.info(f"Saved JSON to: {os.path.abspath(file_path_json)}")
+            else:
+                # Save both by default context or specific requirement
+                Exporter.to_csv(data, file_path_csv, append)
+                Exporter.to_json(data, file_path_json, append)
+                logger.info(f"Saved data to: {os.path.abspath(output_dir)}")
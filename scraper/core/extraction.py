@@ -0,0 +1,183 @@
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
+from parsel import Selector
+from parsel.csstranslator import HTMLTranslator
+from playwright.async_api import Page
+
+@dataclass(frozen=True)
+class Field:
+    """
+    How to read one value from an item element.
+    - selector: CSS selector relative to the lookup root ("" = the root itself)
+    - attr: "text" (innerText), "html" (innerHTML) or an attribute name
+    - closest / parent: start the lookup at the nearest matching ancestor / the parent element
+    - absolute: resolve the value as a URL against the page URL
+    - transform: applied in Python to a found value (not to `default`)
+    """
+    selector: str = ""
+    attr: str = "text"
+    closest: str = ""
+    parent: bool = False
+    absolute: bool = False
+    default: Any = ""
+    transform: Optional[Callable[[str], Any]] = None
+
+    def to_js(self) -> Dict:
+        spec = asdict(self)
+        spec.pop("default")
+        spec.pop("transform")
+        return spec
+
+# A field is either one Field or a tuple of alternatives where the first non-empty value wins
+FieldSpec = Union[Field, Tuple[Field, ...]]
+
+@dataclass(frozen=True)
+class ItemSpec:
+    """
+    A repeated item on a listing page: the item selector, how to read each field,
+    an optional cap on items, the fields an item cannot do without, and constant fields.
+    """
+    selector: str
+    fields: Dict[str, FieldSpec]
+    limit: int = 0
+    required: Tuple[str, ...] = ()
+    constants: Dict[str, Any] = field(default_factory=dict)
+
+    def options(self, key: str) -> Tuple[Field, ...]:
+        spec = self.fields[key]
+        return spec if isinstance(spec, tuple) else (spec,)
+
+    def to_js(self) -> Dict:
+        return {
+            "selector": self.selector,
+            "limit": self.limit,
+            "fields": {key: [f.to_js() for f in self.options(key)] for key in self.fields}
+        }
+
+# Runs every spec against the live DOM in one call.
+# Each field comes back as [index of the matching alternative, value] or null.
+EXTRACT_JS = """
+(groups) => {
+    const read = (row, f) => {
+        let root = row;
+        if (f.parent) root = row.parentElement;
+        if (f.closest) root = root && root.closest(f.closest);
+        if (!root) return null;
+        const el = f.selector ? root.querySelector(f.selector) : root;
+        if (!el) return null;
+        let value;
+        if (f.attr === "text") value = el.innerText;
+        else if (f.attr === "html") value = el.innerHTML;
+        else value = el.getAttribute(f.attr);
+        if (value && f.absolute) {
+            try { value = new URL(value, document.baseURI).href; } catch (e) {}
+        }
+        return value;
+    };
+    const out = {};
+    for (const [name, spec] of Object.entries(groups)) {
+        let rows = Array.from(document.querySelectorAll(spec.selector));
+        if (spec.limit) rows = rows.slice(0, spec.limit);
+        out[name] = rows.map(row => {
+            const item = {};
+            for (const [key, options] of Object.entries(spec.fields)) {
+                item[key] = null;
+                for (let i = 0; i < options.length; i++) {
+                    const value = read(row, options[i]);
+                    if (value && value.trim()) { item[key] = [i, value]; break; }
+                }
+            }
+            return item;
+        });
+    }
+    return out;
+}
+"""
+
+def build_items(spec: ItemSpec, rows: List[Dict]) -> List[Dict]:
+    """Applies defaults, transforms, required fields and constants to raw evaluate rows."""
+    items = []
+    for row in rows:
+        item = {}
+        for key in spec.fields:
+            options = spec.options(key)
+            found = row.get(key)
+            if found is None:
+                item[key] = options[0].default
+            else:
+                index, value = found
+                transform = options[index].transform
+                item[key] = transform(value) if transform else value
+        if any(not item.get(key) for key in spec.required):
+            continue
+        item.update(spec.constants)
+        items.append(item)
+    return items
+
+async def extract_specs(page: Page, specs: Dict[str, ItemSpec]) -> Dict[str, List[Dict]]:
+    """Extracts several item groups from `page` in a single page.evaluate round trip."""
+    raw = await page.evaluate(EXTRACT_JS, {name: spec.to_js() for name, spec in specs.items()})
+    return {name: build_items(spec, raw.get(name, [])) for name, spec in specs.items()}
+
+# --- The same specs against parsed HTML (static fetches and snapshots) ---
+_translator = HTMLTranslator()
+
+@lru_cache(maxsize=None)
+def _xpath(css: str, prefix: str) -> str:
+    return _translator.css_to_xpath(css, prefix=prefix)
+
+def _read_static(row: Selector, f: Field) -> Optional[str]:
+    """Python port of EXTRACT_JS's read(): same lookup, text is the node's string value."""
+    root = row
+    if f.parent:
+        parents = root.xpath("..")
+        root = parents[0] if parents else None
+    if root is not None and f.closest:
+        # Nearest match among the node and its ancestors, like Element.closest
+        found = root.xpath(f"({_xpath(f.closest, 'ancestor-or-self::')})[last()]")
+        root = found[0] if found else None
+    if root is None:
+        return None
+    el = root
+    if f.selector:
+        # Descendants only, like querySelector
+        found = root.xpath(_xpath(f.selector, "descendant::"))
+        if not found:
+            return None
+        el = found[0]
+    if f.attr == "text":
+        value = el.xpath("string()").get("")
+    elif f.attr == "html":
+        value = "".join(el.xpath("node()").getall())
+    else:
+        value = el.attrib.get(f.attr)
+    if value and f.absolute:
+        value = urljoin(el.root.base or "", value)
+    return value
+
+def extract_specs_static(selector: Selector, specs: Dict[str, ItemSpec]) -> Dict[str, List[Dict]]:
+    """
+    Extracts item groups from parsed HTML with the same specs as extract_specs, so the
+    static and snapshot paths return what the browser path does. URLs are resolved
+    against the Selector's base_url.
+    """
+    out = {}
+    for name, spec in specs.items():
+        rows = selector.xpath(_xpath(spec.selector, "descendant-or-self::"))
+        if spec.limit:
+            rows = rows[:spec.limit]
+        raw = []
+        for row in rows:
+            item = {}
+            for key in spec.fields:
+                item[key] = None
+                for i, option in enumerate(spec.options(key)):
+                    value = _read_static(row, option)
+                    if value and value.strip():
+                        item[key] = (i, value)
+                        break
+            raw.append(item)
+        out[name] = build_items(spec, raw)
+    return out
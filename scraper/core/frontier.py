@@ -0,0 +1,244 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from config import settings
+from scraper.core.http_cache import HttpCache
+
+logger = logging.getLogger(__name__)
+
+# URL states
+QUEUED = "queued"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scope TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    discovered INTEGER NOT NULL DEFAULT 0,
+    finished INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS urls (
+    crawl_id INTEGER NOT NULL,
+    url_key TEXT NOT NULL,
+    url TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT NOT NULL DEFAULT '',
+    leased_until REAL NOT NULL DEFAULT 0,
+    result TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (crawl_id, url_key)
+);
+CREATE INDEX IF NOT EXISTS urls_lease ON urls (crawl_id, state, priority, seq);
+"""
+
+@dataclass
+class FrontierEntry:
+    url: str
+    priority: int
+    attempts: int
+    state: str = QUEUED
+    error: str = ""
+    result: Any = None
+
+class CrawlFrontier:
+    """
+    SQLite-backed URL frontier shared by all scrapers (and processes) on this machine.
+    URLs belong to a crawl of a scope (usually a scraper name) and move through
+    queued -> in_flight -> done / failed, deduplicated by canonical URL within the crawl.
+    Workers lease URLs (highest priority, then enqueue order); a lease that is not
+    completed before it expires is handed out again, so a crashed worker loses nothing.
+    An unfinished crawl is resumed by the next open() of its scope, unless it has been
+    idle for longer than FRONTIER_RESUME_MAX_AGE. Crawls are keyed by scope and run id,
+    so concurrent runs of one scraper never share (or finish) each other's crawl.
+    The Crawl methods run their SQLite work in a thread, off the event loop.
+    """
+    def __init__(self, path: Path = settings.FRONTIER_DB, resume_max_age: float = settings.FRONTIER_RESUME_MAX_AGE):
+        self.resume_max_age = resume_max_age
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def _write(self, sql: str, params: Iterable = ()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params))
+
+    def _transaction(self, fn):
+        """Runs fn(conn) inside BEGIN IMMEDIATE so concurrent processes serialize on writes."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self._conn)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    async def _run(self, fn):
+        """Runs fn(conn) in a transaction on a worker thread."""
+        return await asyncio.to_thread(self._transaction, fn)
+
+    async def _read(self, sql: str, params: Iterable = ()) -> List[tuple]:
+        def read():
+            with self._lock:
+                return self._conn.execute(sql, tuple(params)).fetchall()
+        return await asyncio.to_thread(read)
+
+    async def open(self, scope: str, run_id: str = "") -> "Crawl":
+        """
+        Resumes the latest unfinished crawl of `scope` and `run_id`, or starts a new one.
+        Unfinished crawls idle for longer than resume_max_age are abandoned (and their
+        URLs dropped, like those of old finished crawls) so a much later run rediscovers.
+        """
+        key = f"{scope}:{run_id}" if run_id else scope
+        def open_crawl(conn):
+            cutoff = time.time() - self.resume_max_age
+            # Last activity of a crawl: its latest URL update, else its start
+            active = ("COALESCE((SELECT MAX(updated_at) FROM urls WHERE urls.crawl_id = crawls.id), "
+                      "crawls.started_at)")
+            conn.execute(f"UPDATE crawls SET finished = 1 WHERE finished = 0 AND {active} < ?", (cutoff,))
+            conn.execute("DELETE FROM urls WHERE crawl_id IN "
+                         "(SELECT id FROM crawls WHERE finished = 1 AND started_at < ?)", (cutoff,))
+            row = conn.execute(
+                "SELECT id, discovered FROM crawls WHERE scope = ? AND finished = 0 ORDER BY id DESC LIMIT 1",
+                (key,)
+            ).fetchone()
+            if row:
+                return row[0], bool(row[1]), True
+            cursor = conn.execute("INSERT INTO crawls (scope, started_at) VALUES (?, ?)", (key, time.time()))
+            return cursor.lastrowid, False, False
+        crawl_id, discovered, resumed = await self._run(open_crawl)
+        crawl = Crawl(self, crawl_id, key, discovered)
+        if resumed:
+            logger.info(f"Frontier: resuming crawl {crawl_id} of {key} ({await crawl.counts()})")
+        return crawl
+
+class Crawl:
+    """One crawl of a scope in the frontier."""
+    def __init__(self, frontier: CrawlFrontier, crawl_id: int, scope: str, discovered: bool):
+        self.frontier = frontier
+        self.id = crawl_id
+        self.scope = scope
+        self.discovered = discovered
+
+    async def enqueue(self, urls: Iterable[str], priority: int = 0) -> List[str]:
+        """Adds URLs not yet in this crawl. Returns the newly queued ones."""
+        def insert(conn):
+            added = []
+            seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM urls WHERE crawl_id = ?", (self.id,)).fetchone()[0]
+            now = time.time()
+            for url in urls:
+                seq += 1
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO urls (crawl_id, url_key, url, seq, priority, state, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self.id, HttpCache.canonical_url(url), url, seq, priority, QUEUED, now)
+                )
+                if cursor.rowcount:
+                    added.append(url)
+            return added
+        return await self.frontier._run(insert)
+
+    async def lease(self, limit: int = 1, lease_seconds: float = settings.FRONTIER_LEASE_SECONDS) -> List[FrontierEntry]:
+        """Marks up to `limit` queued (or lease-expired) URLs in flight and returns them."""
+        def take(conn):
+            now = time.time()
+            rows = conn.execute(
+                "SELECT url_key, url, priority, attempts FROM urls WHERE crawl_id = ? "
+                "AND (state = ? OR (state = ? AND leased_until < ?)) "
+                "ORDER BY priority DESC, seq LIMIT ?",
+                (self.id, QUEUED, IN_FLIGHT, now, limit)
+            ).fetchall()
+            for url_key, *_ in rows:
+                conn.execute(
+                    "UPDATE urls SET state = ?, leased_until = ?, updated_at = ? WHERE crawl_id = ? AND url_key = ?",
+                    (IN_FLIGHT, now + lease_seconds, now, self.id, url_key)
+                )
+            return [FrontierEntry(url, priority, attempts, IN_FLIGHT) for _, url, priority, attempts in rows]
+        return await self.frontier._run(take)
+
+    async def complete(self, url: str, result: Any = None):
+        """Marks `url` done, storing its (JSON-serializable) result for resumed runs."""
+        await asyncio.to_thread(
+            self.frontier._write,
+            "UPDATE urls SET state = ?, result = ?, error = '', updated_at = ? WHERE crawl_id = ? AND url_key = ?",
+            (DONE, json.dumps(result) if result is not None else None, time.time(), self.id, HttpCache.canonical_url(url))
+        )
+
+    async def fail(self, url: str, error: str, max_retries: int = settings.FRONTIER_MAX_RETRIES) -> bool:
+        """
+        Records a failed attempt. The URL is queued again (at lower priority) until it has
+        failed `max_retries` + 1 times. Returns True if it will be retried.
+        """
+        def record(conn):
+            key = HttpCache.canonical_url(url)
+            row = conn.execute("SELECT attempts FROM urls WHERE crawl_id = ? AND url_key = ?", (self.id, key)).fetchone()
+            attempts = (row[0] if row else 0) + 1
+            retry = attempts <= max_retries
+            conn.execute(
+                "UPDATE urls SET state = ?, attempts = ?, error = ?, priority = priority - 1, leased_until = 0, "
+                "updated_at = ? WHERE crawl_id = ? AND url_key = ?",
+                (QUEUED if retry else FAILED, attempts, error, time.time(), self.id, key)
+            )
+            return retry
+        return await self.frontier._run(record)
+
+    async def mark_discovered(self):
+        """Records that discovery finished, so a resumed crawl only drains the frontier."""
+        await asyncio.to_thread(self.frontier._write, "UPDATE crawls SET discovered = 1 WHERE id = ?", (self.id,))
+        self.discovered = True
+
+    async def finish(self):
+        await asyncio.to_thread(self.frontier._write, "UPDATE crawls SET finished = 1 WHERE id = ?", (self.id,))
+
+    async def counts(self) -> Dict[str, int]:
+        rows = await self.frontier._read(
+            "SELECT state, COUNT(*) FROM urls WHERE crawl_id = ? GROUP BY state", (self.id,)
+        )
+        counts = {QUEUED: 0, IN_FLIGHT: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    async def pending(self) -> int:
+        """URLs still to be processed (queued or in flight)."""
+        counts = await self.counts()
+        return counts[QUEUED] + counts[IN_FLIGHT]
+
+    async def entries(self, states: Tuple[str, ...] = (DONE, FAILED)) -> List[FrontierEntry]:
+        """Entries in the given states, in enqueue order, with their decoded results."""
+        placeholders = ", ".join("?" for _ in states)
+        rows = await self.frontier._read(
+            f"SELECT url, priority, attempts, state, error, result FROM urls "
+            f"WHERE crawl_id = ? AND state IN ({placeholders}) ORDER BY seq",
+            (self.id, *states)
+        )
+        return [FrontierEntry(url, priority, attempts, state, error, json.loads(result) if result else None)
+                for url, priority, attempts, state, error, result in rows]
+
+_frontier: Optional[CrawlFrontier] = None
+
+def get_frontier() -> CrawlFrontier:
+    """Returns the process-wide frontier at settings.FRONTIER_DB."""
+    global _frontier
+    if _frontier is None:
+        _frontier = CrawlFrontier()
+    return _frontier
+
+async def open_crawl(scope: str, run_id: str = "") -> Crawl:
+    return await get_frontier().open(scope, run_id)
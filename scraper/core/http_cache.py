@@ -0,0 +1,296 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Headers that describe the original transfer rather than the stored body.
+# Bodies are stored decoded, so content-encoding/length must not be replayed.
+# Cookies are never replayed from disk.
+UNSTORED_HEADERS = {
+    "content-encoding", "content-length", "transfer-encoding", "connection",
+    "keep-alive", "set-cookie", "age", "date"
+}
+
+# Query parameters that do not change the content of a page
+TRACKING_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|mc_cid|mc_eid)$")
+
+@dataclass
+class CacheEntry:
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    stored_at: float
+    expires_at: float
+    etag: str = ""
+    last_modified: str = ""
+    size: int = field(default=0, repr=False)
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Validators to send when revalidating a stale entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+def freshness_lifetime(headers: Dict[str, str], heuristic_ttl: int = 0) -> Optional[float]:
+    """
+    Seconds a response may be served without revalidation, from Cache-Control / Expires.
+    Without either, `heuristic_ttl` (0 by default: revalidate every time).
+    Returns None when the response must not be stored (no-store).
+    """
+    cache_control = headers.get("cache-control", "").lower()
+    directives = {}
+    for part in cache_control.split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name] = value.strip('"')
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                return max(0, int(directives[name]))
+            except ValueError:
+                return 0
+    if "expires" in headers:
+        try:
+            return max(0, parsedate_to_datetime(headers["expires"]).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return 0
+    return heuristic_ttl
+
+class HttpCache:
+    """
+    On-disk response cache keyed by canonical URL.
+    Each entry is a body file plus a JSON metadata file (status, headers, validators, expiry).
+    Fresh entries are served directly; stale ones carry ETag/Last-Modified so callers can
+    revalidate with a conditional request. Responses without Cache-Control/Expires get
+    `default_ttl` of freshness only when stored as static assets (`heuristic`); pages and
+    API payloads are then kept only if they carry a validator, and revalidated on every
+    use. Total body size is bounded with LRU eviction, using file mtimes as the access
+    clock so the order survives restarts.
+    Safe to use from worker threads.
+    """
+    def __init__(self, directory: Path = settings.HTTP_CACHE_DIR,
+                 max_bytes: int = settings.HTTP_CACHE_MAX_BYTES,
+                 default_ttl: int = settings.HTTP_CACHE_DEFAULT_TTL):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> [body size, last access time]
+        self._index: Dict[str, list] = {}
+        self._load_index()
+
+    @staticmethod
+    def canonical_url(url: str) -> str:
+        """Lowercases scheme/host, drops fragments, default ports and tracking params, sorts the query."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+            host = f"{host}:{parts.port}"
+        query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if not TRACKING_PARAMS.match(k))
+        return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(self.canonical_url(url).encode()).hexdigest()
+
+    def _paths(self, key: str):
+        shard = self.directory / key[:2]
+        return shard / f"{key}.body", shard / f"{key}.json"
+
+    def _load_index(self):
+        for meta_path in self.directory.glob("*/*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                stat = body_path.stat()
+            except FileNotFoundError:
+                meta_path.unlink(missing_ok=True)
+                continue
+            self._index[meta_path.stem] = [stat.st_size, stat.st_mtime]
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes()
+
+    def _total_bytes(self) -> int:
+        """Caller must hold the lock (worker threads mutate the index)."""
+        return sum(size for size, _ in self._index.values())
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Returns the stored entry for `url` (fresh or stale), or None."""
+        key = self._key(url)
+        body_path, meta_path = self._paths(key)
+        with self._lock:
+            if key not in self._index:
+                self.misses += 1
+                return None
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                body = body_path.read_bytes()
+            except (OSError, ValueError) as e:
+                logger.debug(f"HttpCache: dropping unreadable entry for {url}: {e}")
+                self._remove(key)
+                self.misses += 1
+                return None
+            now = time.time()
+            self._index[key][1] = now
+            try:
+                os.utime(body_path, (now, now))
+            except OSError:
+                pass
+            entry = CacheEntry(body=body, size=len(body), **meta)
+            if entry.fresh:
+                self.hits += 1
+        return entry
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes,
+            heuristic: bool = False) -> Optional[CacheEntry]:
+        """
+        Stores a 200 response unless its headers forbid it (or make it useless to keep).
+        `heuristic` (scripts, stylesheets, downloaded files) applies default_ttl to a
+        response without Cache-Control/Expires. Returns the stored entry or None.
+        """
+        if status != 200:
+            return None
+        headers = {k.lower(): v for k, v in headers.items()}
+        lifetime = freshness_lifetime(headers, self.default_ttl if heuristic else 0)
+        if lifetime is None or len(body) > self.max_bytes:
+            return None
+        if not lifetime and not ("etag" in headers or "last-modified" in headers):
+            # Would never be served or revalidated
+            return None
+        now = time.time()
+        entry = CacheEntry(
+            url=url,
+            status=status,
+            headers={k: v for k, v in headers.items() if k not in UNSTORED_HEADERS},
+            body=body,
+            stored_at=now,
+            expires_at=now + lifetime,
+            etag=headers.get("etag", ""),
+            last_modified=headers.get("last-modified", ""),
+            size=len(body)
+        )
+        self._write(entry)
+        with self._lock:
+            self.stores += 1
+        return entry
+
+    def revalidate(self, entry: CacheEntry, headers: Dict[str, str], heuristic: bool = False) -> CacheEntry:
+        """
+        Applies a 304 Not Modified response to a stale entry: merges the new headers
+        and restarts its freshness lifetime (see put for `heuristic`).
+        """
+        headers = {k.lower(): v for k, v in headers.items()}
+        lifetime = freshness_lifetime(headers, self.default_ttl if heuristic else 0) or 0
+        now = time.time()
+        entry.headers.update({k: v for k, v in headers.items() if k not in UNSTORED_HEADERS})
+        entry.stored_at = now
+        entry.expires_at = now + lifetime
+        entry.etag = headers.get("etag", entry.etag)
+        entry.last_modified = headers.get("last-modified", entry.last_modified)
+        self._write(entry)
+        with self._lock:
+            self.revalidated += 1
+        return entry
+
+    def _write(self, entry: CacheEntry):
+        key = self._key(entry.url)
+        body_path, meta_path = self._paths(key)
+        meta = {
+            "url": entry.url,
+            "status": entry.status,
+            "headers": entry.headers,
+            "stored_at": entry.stored_at,
+            "expires_at": entry.expires_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified
+        }
+        with self._lock:
+            body_path.parent.mkdir(exist_ok=True)
+            # Write-then-rename so a crashed run never leaves a torn entry
+            tmp_body = body_path.with_suffix(".body.tmp")
+            tmp_body.write_bytes(entry.body)
+            os.replace(tmp_body, body_path)
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+            self._index[key] = [entry.size, time.time()]
+            self._evict()
+
+    def _evict(self):
+        """Drops least recently used entries until under max_bytes. Caller must hold the lock."""
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return
+        for key, (size, _) in sorted(self._index.items(), key=lambda kv: kv[1][1]):
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        for path in self._paths(key):
+            path.unlink(missing_ok=True)
+        self._index.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._index),
+                "bytes": self._total_bytes(),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions
+            }
+
+_cache: Optional[HttpCache] = None
+
+def get_cache() -> Optional[HttpCache]:
+    """
+    Returns the process-wide cache shared by the browser route handler and the
+    HTTP clients, or None when settings.HTTP_CACHE_ENABLED is off.
+    """
+    global _cache
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = HttpCache()
+    return _cache
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from typing import Tuple, Optional
+import aiohttp
+from scraper.core.browser_manager import CONTEXT_OPTIONS
+from scraper.core.http_cache import get_cache
+from scraper.core.politeness import get_controller
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": CONTEXT_OPTIONS["user_agent"],
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Connection pool limits for the shared session
+MAX_CONNECTIONS = 50
+MAX_CONNECTIONS_PER_HOST = 6
+REQUEST_TIMEOUT = 20  # seconds
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Returns the pooled aiohttp session for the running event loop,
+    creating it on first use (or after the previous loop went away).
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None and not _session.closed:
+            _discard_session(_session, _session_loop)
+        connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=MAX_CONNECTIONS_PER_HOST, ttl_dns_cache=300)
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        )
+        _session_loop = loop
+    return _session
+
+def _discard_session(session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]):
+    """
+    Closes a session left behind by another event loop: on that loop if it still runs,
+    otherwise by closing its connector in place so its sockets are not leaked.
+    """
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+    try:
+        if session.connector is not None:
+            session.connector.close()
+    except Exception as e:
+        logger.debug(f"Error closing a stale HTTP connector: {e}")
+    session.detach()
+
+async def close_session():
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+async def fetch_cached(session: aiohttp.ClientSession, url: str, heuristic: bool = False) -> Tuple[int, bytes, str]:
+    """
+    GETs `url` through the on-disk HTTP cache and returns (status, body, charset).
+    Fresh entries skip the network; stale ones are revalidated with a conditional GET.
+    `heuristic` marks static files that may be reused without freshness headers (see HttpCache.put).
+    Network requests are paced by the domain's politeness controller.
+    """
+    cache = get_cache()
+    entry = await asyncio.to_thread(cache.get, url) if cache else None
+    if entry and entry.fresh:
+        return entry.status, entry.body, _charset(entry.headers.get("content-type", ""))
+
+    headers = entry.conditional_headers() if entry else None
+    controller = get_controller(url)
+    await controller.acquire()
+    started = time.monotonic()
+    async with session.get(url, allow_redirects=True, headers=headers) as response:
+        controller.record(response.status, time.monotonic() - started,
+                          retry_after=response.headers.get("Retry-After"))
+        if entry and response.status == 304:
+            entry = await asyncio.to_thread(cache.revalidate, entry, dict(response.headers), heuristic)
+            return entry.status, entry.body, _charset(entry.headers.get("content-type", ""))
+        body = await response.read()
+        if cache:
+            await asyncio.to_thread(cache.put, url, response.status, dict(response.headers), body, heuristic)
+        return response.status, body, response.charset or ""
+
+def _charset(content_type: str) -> str:
+    _, _, charset = content_type.partition("charset=")
+    return charset.split(";")[0].strip().strip('"')
+
+async def fetch_text(url: str) -> Tuple[int, str]:
+    """GETs `url` over the shared session (via the HTTP cache) and returns (status, body text)."""
+    status, body, charset = await fetch_cached(get_session(), url)
+    try:
+        return status, body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return status, body.decode("utf-8", errors="replace")
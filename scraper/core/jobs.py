@@ -0,0 +1,293 @@
+import asyncio
+import json
+import logging
+import math
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+class Job:
+    """
+    One scrape request running in the background. Site results are appended as
+    each site finishes, so pollers see progress before the whole job is done.
+    """
+    def __init__(self, params: Dict, total: int, client: str = ""):
+        self.id = uuid.uuid4().hex
+        self.params = params
+        self.client = client
+        self.total = total
+        self.status = QUEUED
+        self.results: List[Dict] = []
+        self.error = ""
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.future: Optional[Future] = None
+        self.dropped_events = 0
+        self._subscribers: List[queue.Queue] = []
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (COMPLETED, FAILED)
+
+    def add_result(self, result: Dict):
+        with self._lock:
+            self.results.append(result)
+        summary = {k: v for k, v in result.items() if k != "data"}
+        self.publish("site", done=len(self.results), total=self.total, **summary)
+
+    # --- Streaming ---
+    def subscribe(self) -> queue.Queue:
+        """
+        Returns a queue receiving this job's events from now on: "item", "progress",
+        "error" and "site" while it runs, then a final "done" with the job status.
+        """
+        events = queue.Queue(maxsize=settings.JOB_STREAM_BUFFER)
+        with self._lock:
+            self._subscribers.append(events)
+        return events
+
+    def unsubscribe(self, events: queue.Queue):
+        with self._lock:
+            if events in self._subscribers:
+                self._subscribers.remove(events)
+
+    def publish(self, kind: str, **payload):
+        """Hands an event to every subscriber (thread-safe; called from the event loop)."""
+        event = {"event": kind, **payload}
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for events in subscribers:
+            try:
+                events.put_nowait(event)
+            except queue.Full:
+                # A client that stops reading must not hold items in memory or stall the crawl
+                self.dropped_events += 1
+
+    def stream(self, events: queue.Queue, keepalive: float = 15) -> Iterator[Dict]:
+        """Yields events from a subscription until the job is done; None as a keep-alive tick."""
+        try:
+            while True:
+                try:
+                    event = events.get(timeout=keepalive)
+                except queue.Empty:
+                    if self.finished and events.empty():
+                        return
+                    yield None
+                    continue
+                yield event
+                if event["event"] == "done":
+                    return
+        finally:
+            self.unsubscribe(events)
+
+    async def astream(self, events: queue.Queue, keepalive: float = 15,
+                      poll: float = 0.2) -> AsyncIterator[Optional[Dict]]:
+        """Like `stream`, for servers on the event loop: polls instead of blocking a thread."""
+        try:
+            idle = 0.0
+            while True:
+                try:
+                    event = events.get_nowait()
+                except queue.Empty:
+                    if self.finished and events.empty():
+                        return
+                    await asyncio.sleep(poll)
+                    idle += poll
+                    if idle >= keepalive:
+                        idle = 0.0
+                        yield None
+                    continue
+                idle = 0.0
+                yield event
+                if event["event"] == "done":
+                    return
+        finally:
+            self.unsubscribe(events)
+
+    def to_dict(self, include_results: bool = True) -> Dict:
+        with self._lock:
+            job = {
+                "job_id": self.id,
+                "status": self.status,
+                "category": self.params.get("category"),
+                "websites": self.params.get("websites"),
+                "progress": {"sites_done": len(self.results), "sites_total": self.total},
+                "items_scraped": sum(r.get("items_scraped", 0) for r in self.results),
+                "created_at": datetime.fromtimestamp(self.created_at).isoformat(),
+                "started_at": datetime.fromtimestamp(self.started_at).isoformat() if self.started_at else None,
+                "finished_at": datetime.fromtimestamp(self.finished_at).isoformat() if self.finished_at else None,
+                "timestamp": datetime.now().isoformat()
+            }
+            if self.error:
+                job["error"] = self.error
+            if include_results:
+                job["results"] = list(self.results)
+        return job
+
+class JobRejected(Exception):
+    """A job refused by admission control; the client may retry after `retry_after` seconds."""
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.retry_after = retry_after
+
+class JobManager:
+    """
+    Runs scrape jobs on the event loop reached through `submit` (e.g. BrowserPool.submit)
+    and keeps the most recent JOB_HISTORY of them for status polling.
+    At most `max_running` jobs scrape at once, the others wait in a queue of at most
+    `queue_size`, and a client may have `max_per_client` jobs queued or running;
+    beyond that `create` raises JobRejected instead of piling work onto the browsers.
+    """
+    def __init__(self, submit: Callable[[Awaitable], Future], history: int = settings.JOB_HISTORY,
+                 max_running: int = settings.JOB_MAX_RUNNING, queue_size: int = settings.JOB_QUEUE_SIZE,
+                 max_per_client: int = settings.JOB_MAX_PER_CLIENT):
+        self._submit = submit
+        self.history = history
+        self.max_running = max(1, max_running)
+        self.queue_size = queue_size
+        self.max_per_client = max_per_client
+        self.jobs: Dict[str, Job] = {}
+        # Moving average of job run times, for wait estimates
+        self.avg_duration = float(settings.JOB_ESTIMATED_DURATION)
+        self._slots: Optional[asyncio.Semaphore] = None  # Created on the jobs' event loop
+        self._lock = threading.Lock()
+
+    def submit(self, params: Dict, total: int, work: Callable[[Job], Awaitable[List[Dict]]]) -> Job:
+        """
+        Starts `work(job)` in the background and returns the job right away.
+        `work` reports each site through job.add_result and returns the ordered results.
+        """
+        return self.start(self.create(params, total), work)
+
+    def create(self, params: Dict, total: int, client: str = "") -> Job:
+        """
+        Registers a job without starting it (e.g. to subscribe to its events first).
+        Raises JobRejected when the queue or the client's share of it is full.
+        """
+        with self._lock:
+            self._admit(client)
+            job = Job(params, total, client)
+            self.jobs[job.id] = job
+            self._prune()
+        return job
+
+    def start(self, job: Job, work: Callable[[Job], Awaitable[List[Dict]]]) -> Job:
+        async def runner():
+            if self._slots is None:
+                self._slots = asyncio.Semaphore(self.max_running)
+            async with self._slots:
+                job.status = RUNNING
+                job.started_at = time.time()
+                job.publish("status", **job.to_dict(include_results=False))
+                try:
+                    results = await work(job)
+                    with job._lock:
+                        job.results = results
+                    job.status = COMPLETED
+                except Exception as e:
+                    logger.error(f"Job {job.id} failed: {e}")
+                    job.error = str(e)
+                    job.status = FAILED
+                finally:
+                    job.finished_at = time.time()
+                    self.avg_duration = 0.7 * self.avg_duration + 0.3 * (job.finished_at - job.started_at)
+                    job.publish("done", **job.to_dict())
+            return job
+
+        job.future = self._submit(runner())
+        logger.info(f"Job {job.id} queued: {job.params}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return sorted(self.jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def describe(self, job: Job, include_results: bool = True) -> Dict:
+        """The job's status (see Job.to_dict), with its queue position and estimated wait while queued."""
+        info = job.to_dict(include_results)
+        if job.status == QUEUED:
+            with self._lock:
+                position, wait = self._queue_estimate(job)
+            info["queue_position"] = position
+            info["estimated_wait_seconds"] = math.ceil(wait)
+        return info
+
+    def stats(self) -> Dict:
+        with self._lock:
+            active = [job for job in self.jobs.values() if not job.finished]
+        return {
+            "running": sum(1 for job in active if job.status == RUNNING),
+            "queued": sum(1 for job in active if job.status == QUEUED),
+            "max_running": self.max_running,
+            "queue_size": self.queue_size,
+            "avg_job_seconds": round(self.avg_duration, 1)
+        }
+
+    # --- Admission control (callers hold the lock) ---
+    def _admit(self, client: str):
+        active = [job for job in self.jobs.values() if not job.finished]
+        queued = [job for job in active if job.status == QUEUED]
+        running = [job for job in active if job.status == RUNNING]
+        if client:
+            mine = [job for job in active if job.client == client]
+            if len(mine) >= self.max_per_client:
+                # The client's oldest job is the first to make room
+                retry_after = min(self._remaining(job) for job in mine)
+                raise JobRejected(f"Too many active jobs for this client ({len(mine)}/{self.max_per_client})",
+                                  math.ceil(retry_after))
+        if len(queued) >= self.queue_size:
+            # The queue moves when a running job finishes
+            retry_after = min((self._remaining(job) for job in running), default=self.avg_duration)
+            raise JobRejected(f"The job queue is full ({len(queued)} jobs waiting)", math.ceil(retry_after))
+
+    def _remaining(self, job: Job) -> float:
+        """Estimated seconds until `job` finishes."""
+        if job.status == RUNNING:
+            return max(1.0, self.avg_duration - (time.time() - job.started_at))
+        return self._queue_estimate(job)[1] + self.avg_duration
+
+    def _queue_estimate(self, job: Job) -> Tuple[int, float]:
+        """Position of a queued job (1 = next) and estimated seconds until it starts."""
+        queued = sorted((j for j in self.jobs.values() if j.status == QUEUED), key=lambda j: j.created_at)
+        ahead = next((i for i, j in enumerate(queued) if j is job), len(queued))
+        # When each slot frees up: now for idle slots, else when its running job should finish
+        running = [self._remaining(j) for j in self.jobs.values() if j.status == RUNNING]
+        slots = sorted(running + [0.0] * (self.max_running - len(running)))[:self.max_running]
+        return ahead + 1, slots[ahead % self.max_running] + (ahead // self.max_running) * self.avg_duration
+
+    def _prune(self):
+        """Forgets the oldest finished jobs beyond `history`. Caller holds the lock."""
+        finished = sorted((job for job in self.jobs.values() if job.finished), key=lambda job: job.created_at)
+        for job in finished[:max(0, len(self.jobs) - self.history)]:
+            del self.jobs[job.id]
+
+def format_event(event: Optional[Dict], fmt: str = "sse") -> str:
+    """
+    Encodes a job event for a streaming response: a Server-Sent Event, or one line of
+    NDJSON. None (a keep-alive tick) becomes an SSE comment / heartbeat line.
+    """
+    if event is None:
+        return ": keep-alive\n\n" if fmt == "sse" else json.dumps({"event": "heartbeat"}) + "\n"
+    data = json.dumps(event, default=str)
+    if fmt == "sse":
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
@@ -0,0 +1,157 @@
+"""
+Process-wide metrics in the Prometheus text exposition format, served by the API
+servers at /metrics. Counters and histograms are updated by the instrumented code;
+gauges may read their value from a callback when scraped.
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Seconds: navigation, launches, exports
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+# Items returned by one site run
+ITEM_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+_registry: List["Metric"] = []
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Metric(ABC):
+    TYPE = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """The metric's sample lines in the text format."""
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.TYPE}"]
+        return "\n".join(lines + self.samples())
+
+class Counter(Metric):
+    TYPE = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return [f"{self.name}{_labels(self.labelnames, key)} {value}" for key, value in values.items()]
+
+class Gauge(Metric):
+    """
+    A value that goes up and down. With `collect`, the value is read when metrics are
+    rendered: a number, or a {label tuple: number} dict for labelled gauges.
+    """
+    TYPE = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 collect: Optional[Callable[[], object]] = None):
+        super().__init__(name, help, labelnames)
+        self.collect = collect
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def samples(self) -> List[str]:
+        if self.collect:
+            try:
+                collected = self.collect()
+            except Exception:
+                return []
+            values = collected if isinstance(collected, dict) else {(): collected}
+        else:
+            with self._lock:
+                values = dict(self._values)
+        return [f"{self.name}{_labels(self.labelnames, key)} {value}" for key, value in values.items()]
+
+class Histogram(Metric):
+    TYPE = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> (per-bucket counts, sum, count)
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observes the duration of the block, in seconds (also when it raises)."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - started, **labels)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = {key: (list(counts), total, count) for key, (counts, total, count) in self._values.items()}
+        lines = []
+        for key, (counts, total, count) in values.items():
+            for bound, bucket_count in zip(self.buckets, counts):
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {bucket_count}")
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {count}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {total}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+def render() -> str:
+    """All registered metrics in the Prometheus text format (version 0.0.4)."""
+    return "\n".join(metric.render() for metric in _registry) + "\n"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# --- Scraper metrics ---
+PAGES_NAVIGATED = Counter("scraper_pages_navigated_total", "Browser navigations, by domain and HTTP status",
+                          ["domain", "status"])
+NAVIGATION_SECONDS = Histogram("scraper_navigation_seconds", "Browser navigation latency", ["domain"])
+BLOCK_EVENTS = Counter("scraper_block_events_total",
+                       "Anti-bot pushback: block/CAPTCHA pages and throttling statuses", ["domain", "kind"])
+ITEMS_EXTRACTED = Counter("scraper_items_extracted_total", "Items extracted, by scraper", ["scraper"])
+SITE_ITEMS = Histogram("scraper_site_items", "Items returned by one site run", ["website"], buckets=ITEM_BUCKETS)
+SITE_SECONDS = Histogram("scraper_site_seconds", "Duration of one site run (scrape and export)", ["website"])
+EXPORT_SECONDS = Histogram("scraper_export_seconds", "Time spent writing a site's output", ["format"])
+DOWNLOAD_BYTES = Counter("scraper_download_bytes_total", "Bytes saved by the Downloader", ["folder"])
+DOWNLOADS = Counter("scraper_downloads_total", "Downloader requests, by outcome", ["outcome"])
+BROWSER_LAUNCHES = Counter("scraper_browser_launches_total", "Chromium processes launched", ["owner"])
+BROWSER_LAUNCH_SECONDS = Histogram("scraper_browser_launch_seconds", "Chromium launch latency", ["owner"])
+CONTEXTS_CREATED = Counter("scraper_browser_contexts_total", "Browser contexts created")
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from playwright.async_api import Locator, Page, Response
+from config import settings
+from scraper.core.metrics import PAGES_NAVIGATED, NAVIGATION_SECONDS, BLOCK_EVENTS
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses that mean "slow down"
+THROTTLE_STATUSES = {403, 429, 503}
+
+# Page title fragments of anti-bot interstitials
+BLOCK_MARKERS = ("captcha", "challenge", "access denied", "attention required", "just a moment", "incapsula")
+
+class DomainRateController:
+    """
+    Token bucket for one domain whose refill rate adapts AIMD-style:
+    healthy responses add POLITENESS_INCREASE requests/s, slow responses shrink it a little,
+    and 403/429/503 or block pages cut it by POLITENESS_DECREASE and pause the domain
+    (for Retry-After when the server sends one).
+    """
+    def __init__(self, domain: str,
+                 rate: float = settings.POLITENESS_INITIAL_RATE,
+                 min_rate: float = settings.POLITENESS_MIN_RATE,
+                 max_rate: float = settings.POLITENESS_MAX_RATE,
+                 burst: float = settings.POLITENESS_BURST):
+        self.domain = domain
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.tokens = burst
+        self.requests = 0
+        self.throttled = 0
+        self.latency = 0.0  # EWMA of response latency (seconds)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Waits until the domain may receive another request."""
+        async with self._lock:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                    continue
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.requests += 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+                await asyncio.sleep(wait * (1 + random.uniform(0, settings.POLITENESS_JITTER)))
+
+    def record(self, status: int, latency: float, blocked: bool = False, retry_after: Optional[str] = None):
+        """Feeds one response outcome back into the rate."""
+        self.latency = latency if not self.latency else 0.8 * self.latency + 0.2 * latency
+        if blocked or status in THROTTLE_STATUSES:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * settings.POLITENESS_DECREASE)
+            self.tokens = 0
+            pause = 1 / self.rate
+            if retry_after and retry_after.isdigit():
+                pause = max(pause, int(retry_after))
+            self._paused_until = time.monotonic() + pause
+            logger.warning(f"Politeness: {self.domain} pushed back (status={status}, blocked={blocked}); "
+                           f"rate -> {self.rate:.2f} req/s, pausing {pause:.0f}s")
+        elif latency > settings.POLITENESS_SLOW_LATENCY:
+            self.rate = max(self.min_rate, self.rate * 0.8)
+        elif 0 < status < 400:
+            self.rate = min(self.max_rate, self.rate + settings.POLITENESS_INCREASE)
+
+    def stats(self) -> Dict:
+        return {
+            "rate": round(self.rate, 3),
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "avg_latency": round(self.latency, 3)
+        }
+
+# One controller per domain, shared by every scraper in the process
+_controllers: Dict[str, DomainRateController] = {}
+
+def get_controller(url: str) -> DomainRateController:
+    domain = urlparse(url).hostname or ""
+    if domain not in _controllers:
+        _controllers[domain] = DomainRateController(domain)
+    return _controllers[domain]
+
+def politeness_stats() -> Dict[str, Dict]:
+    return {domain: controller.stats() for domain, controller in _controllers.items()}
+
+async def is_block_page(page: Page) -> bool:
+    try:
+        title = (await page.title()).lower()
+    except Exception:
+        return False
+    return any(marker in title for marker in BLOCK_MARKERS)
+
+async def polite_goto(page: Page, url: str, **kwargs) -> Optional[Response]:
+    """
+    page.goto through the domain's rate controller: waits for a token, then reports
+    status, latency and block-page detection back so the rate adapts.
+    """
+    controller = get_controller(url)
+    await controller.acquire()
+    started = time.monotonic()
+    try:
+        response = await page.goto(url, **kwargs)
+    except Exception:
+        # Timeouts and resets count as a slow response
+        controller.record(0, max(time.monotonic() - started, settings.POLITENESS_SLOW_LATENCY + 1))
+        PAGES_NAVIGATED.inc(domain=controller.domain, status="error")
+        raise
+    await _report(controller, page, response, time.monotonic() - started)
+    return response
+
+async def polite_click(page: Page, locator: Locator, wait_until: Optional[str] = None,
+                       settle: float = 0, **kwargs):
+    """
+    locator.click through the rate controller of the page's domain, for pagination driven
+    by "Next"/"Load more" buttons: waits for a token, clicks, waits for `wait_until` (a load
+    state) and `settle` seconds, then reports like polite_goto. The reported response is the
+    main-frame document the click loaded, else the worst XHR/fetch answer from the domain.
+    """
+    controller = get_controller(page.url)
+    await controller.acquire()
+    responses = []
+
+    def on_response(response: Response):
+        request = response.request
+        if request.frame == page.main_frame and request.resource_type == "document":
+            responses.append(response)
+        elif request.resource_type in ("xhr", "fetch") and urlparse(response.url).hostname == controller.domain:
+            responses.append(response)
+
+    page.on("response", on_response)
+    started = time.monotonic()
+    try:
+        await locator.click(**kwargs)
+        if wait_until:
+            await page.wait_for_load_state(wait_until)
+        latency = time.monotonic() - started
+        if settle:
+            await asyncio.sleep(settle)
+    except Exception:
+        controller.record(0, max(time.monotonic() - started, settings.POLITENESS_SLOW_LATENCY + 1))
+        PAGES_NAVIGATED.inc(domain=controller.domain, status="error")
+        raise
+    finally:
+        page.remove_listener("response", on_response)
+    documents = [r for r in responses if r.request.resource_type == "document"]
+    response = documents[-1] if documents else max(responses, key=lambda r: r.status, default=None)
+    await _report(controller, page, response, latency)
+
+async def _report(controller: DomainRateController, page: Page, response: Optional[Response], latency: float):
+    """Feeds a navigation's outcome to the controller and the metrics."""
+    status = response.status if response else 0
+    blocked = await is_block_page(page)
+    controller.record(
+        status,
+        latency,
+        blocked=blocked,
+        retry_after=response.headers.get("retry-after") if response else None
+    )
+    PAGES_NAVIGATED.inc(domain=controller.domain, status=str(status))
+    NAVIGATION_SECONDS.observe(latency, domain=controller.domain)
+    if blocked:
+        BLOCK_EVENTS.inc(domain=controller.domain, kind="block_page")
+    elif status in THROTTLE_STATUSES:
+        BLOCK_EVENTS.inc(domain=controller.domain, kind=f"http_{status}")
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from playwright.async_api import BrowserContext, Route
+from scraper.core.http_cache import HttpCache
+
+logger = logging.getLogger(__name__)
+
+# Ad / tracker hosts that never carry content we extract
+BLOCKED_DOMAINS = [
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com",
+    "google-analytics.com", "googletagmanager.com", "googletagservices.com",
+    "adservice.google.com", "amazon-adsystem.com", "adnxs.com", "criteo.com",
+    "criteo.net", "pubmatic.com", "rubiconproject.com", "openx.net", "moatads.com",
+    "taboola.com", "outbrain.com", "scorecardresearch.com", "quantserve.com",
+    "chartbeat.com", "chartbeat.net", "hotjar.com", "facebook.net", "connect.facebook.net",
+    "bat.bing.com", "clarity.ms", "newrelic.com", "nr-data.net", "segment.io"
+]
+
+# Blocking profiles: resource types to abort, whether to drop ad/tracker hosts and
+# whether surviving GETs may be served from / stored in the on-disk HTTP cache.
+# - allow-all: no interception at all (CAPTCHA-prone sites that need every asset
+#   and whose bot checks would notice requests replayed outside the browser)
+# - image-urls: keep the DOM (img src/srcset are still readable) but skip image/media/font bytes
+# - text-only: also skip stylesheets, for scrapers that only read text or embedded JSON
+BLOCK_PROFILES = {
+    "allow-all": {"resource_types": set(), "block_trackers": False, "cache": False},
+    "image-urls": {"resource_types": {"image", "media", "font"}, "block_trackers": True, "cache": True},
+    "text-only": {"resource_types": {"image", "media", "font", "stylesheet"}, "block_trackers": True, "cache": True},
+}
+
+# Resource types worth caching: pages, API payloads and the scripts/styles they pull in
+CACHEABLE_RESOURCE_TYPES = {"document", "xhr", "fetch", "script", "stylesheet"}
+# Static assets reused for HTTP_CACHE_DEFAULT_TTL when they send no freshness headers;
+# pages and API payloads are always revalidated then
+HEURISTIC_RESOURCE_TYPES = {"script", "stylesheet"}
+
+# Rough transfer sizes per resource type, used to estimate bytes saved by aborted requests
+ESTIMATED_BYTES = {
+    "image": 60_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 30_000,
+    "script": 50_000,
+}
+DEFAULT_ESTIMATED_BYTES = 10_000
+
+class ResourceBlocker:
+    """
+    Aborts unneeded requests at the context level according to a blocking profile
+    and keeps a counter of blocked requests and (estimated) bytes saved.
+    When given an HttpCache (and the profile allows it), the remaining GETs are served
+    from disk when fresh, revalidated when stale and stored after a network fetch.
+    """
+    def __init__(self, profile: str = "image-urls", cache: Optional[HttpCache] = None):
+        if profile not in BLOCK_PROFILES:
+            raise ValueError(f"Unknown block profile: {profile}")
+        self.profile = profile
+        self.resource_types = BLOCK_PROFILES[profile]["resource_types"]
+        self.block_trackers = BLOCK_PROFILES[profile]["block_trackers"]
+        self.cache = cache if BLOCK_PROFILES[profile]["cache"] else None
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+
+    @property
+    def active(self) -> bool:
+        return bool(self.resource_types) or self.block_trackers or self.cache is not None
+
+    async def attach(self, context: BrowserContext):
+        """Installs the route handler on `context`. No-op for allow-all."""
+        if self.active:
+            await context.route("**/*", self._handle)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        if resource_type in self.resource_types:
+            return True
+        if self.block_trackers:
+            host = urlparse(url).hostname or ""
+            return any(host == d or host.endswith("." + d) for d in BLOCKED_DOMAINS)
+        return False
+
+    async def _handle(self, route: Route):
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.blocked_requests += 1
+            self.bytes_saved += ESTIMATED_BYTES.get(request.resource_type, DEFAULT_ESTIMATED_BYTES)
+            await route.abort()
+        elif self.cache and request.method == "GET" and request.resource_type in CACHEABLE_RESOURCE_TYPES:
+            await self._handle_cached(route)
+        else:
+            await route.continue_()
+
+    async def _handle_cached(self, route: Route):
+        url = route.request.url
+        heuristic = route.request.resource_type in HEURISTIC_RESOURCE_TYPES
+        entry = await asyncio.to_thread(self.cache.get, url)
+        if entry and entry.fresh:
+            await route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+            return
+
+        headers = {**route.request.headers, **entry.conditional_headers()} if entry else None
+        try:
+            # No redirect following: the browser must see 3xx itself so relative URLs resolve
+            response = await route.fetch(headers=headers, max_redirects=0)
+        except Exception as e:
+            logger.debug(f"ResourceBlocker: cache fetch failed for {url}: {e}")
+            await route.continue_()
+            return
+
+        if entry and response.status == 304:
+            entry = await asyncio.to_thread(self.cache.revalidate, entry, response.headers, heuristic)
+            await route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+            return
+        body = await response.body()
+        await asyncio.to_thread(self.cache.put, url, response.status, response.headers, body, heuristic)
+        await route.fulfill(response=response, body=body)
+
+    def stats(self) -> Dict:
+        return {
+            "profile": self.profile,
+            "blocked_requests": self.blocked_requests,
+            "estimated_bytes_saved": self.bytes_saved
+        }
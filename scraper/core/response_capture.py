@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, List, Iterator, Optional
+from playwright.async_api import Page, Response
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CapturedResponse:
+    url: str
+    status: int
+    data: Any
+
+class ResponseCapture:
+    """
+    Listens to a page's network responses and collects the parsed JSON payloads
+    of those whose URL matches one of the declared regex patterns.
+    Payloads can be drained in batches or streamed as they arrive.
+    """
+    def __init__(self, patterns: List[str]):
+        self.patterns = [re.compile(p) for p in patterns]
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.captured = 0
+        self.page: Optional[Page] = None
+
+    def attach(self, page: Page):
+        self.page = page
+        page.on("response", self._on_response)
+
+    def detach(self):
+        if self.page:
+            self.page.remove_listener("response", self._on_response)
+            self.page = None
+
+    def matches(self, url: str) -> bool:
+        return any(p.search(url) for p in self.patterns)
+
+    async def _on_response(self, response: Response):
+        if not self.matches(response.url):
+            return
+        content_type = response.headers.get("content-type", "")
+        if "json" not in content_type:
+            return
+        try:
+            data = await response.json()
+        except Exception as e:
+            logger.debug(f"ResponseCapture: could not parse {response.url}: {e}")
+            return
+        self.captured += 1
+        await self.queue.put(CapturedResponse(response.url, response.status, data))
+
+    def drain(self) -> List[CapturedResponse]:
+        """Returns every payload captured so far without waiting."""
+        payloads = []
+        while not self.queue.empty():
+            payloads.append(self.queue.get_nowait())
+        return payloads
+
+    async def wait(self, timeout: float = 10) -> List[CapturedResponse]:
+        """
+        Waits up to `timeout` seconds for at least one payload, then returns everything queued.
+        """
+        if self.queue.empty():
+            try:
+                first = await asyncio.wait_for(self.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                return []
+            return [first] + self.drain()
+        return self.drain()
+
+    async def stream(self, idle_timeout: float = 10):
+        """
+        Async iterator yielding payloads as they arrive; stops after `idle_timeout`
+        seconds without a new matching response.
+        """
+        while True:
+            try:
+                yield await asyncio.wait_for(self.queue.get(), idle_timeout)
+            except asyncio.TimeoutError:
+                return
+
+def iter_dicts(data: Any, key: str) -> Iterator[dict]:
+    """
+    Yields every dict found under `key` (a list of dicts) anywhere in a JSON tree.
+    Useful when the list's exact nesting varies between API versions.
+    """
+    if isinstance(data, dict):
+        for k, v in data.items():
+            if k == key and isinstance(v, list):
+                for entry in v:
+                    if isinstance(entry, dict):
+                        yield entry
+            else:
+                yield from iter_dicts(v, key)
+    elif isinstance(data, list):
+        for v in data:
+            yield from iter_dicts(v, key)
+
+def localized(value: Any, lang: str = "en") -> Any:
+    """Unwraps {"en": ..., "ar": ...} style localized values."""
+    if isinstance(value, dict) and lang in value:
+        return value[lang]
+    return value
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class ResultCache:
+    """
+    Shares per-site scrape results between requests on the server's event loop.
+    While a site is being scraped, requests for the same key await that same run instead
+    of starting another; once it finishes, its result is served until its TTL expires.
+    Failed runs are not cached.
+    Requests joining a run get its result, not its streamed item events.
+    """
+    def __init__(self, max_entries: int = settings.RESULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        # key -> (expires_at, finished_at, result), oldest first
+        self._results: "OrderedDict[Hashable, Tuple[float, float, Dict]]" = OrderedDict()
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    async def get_or_run(self, key: Hashable, ttl: float, run: Callable[[], Awaitable[Optional[Dict]]],
+                         refresh: bool = False) -> Optional[Dict]:
+        """
+        The result for `key`: cached if fresh (unless `refresh`), else the in-flight run's,
+        else that of a new `run()`, cached for `ttl` seconds when it succeeds.
+        """
+        if not refresh:
+            cached = self._results.get(key)
+            if cached and cached[0] > time.time():
+                self.hits += 1
+                return {**cached[2], "cached": True, "cached_at": datetime.fromtimestamp(cached[1]).isoformat()}
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.info(f"ResultCache: joining in-flight run of {key}")
+            result = await asyncio.shield(task)
+            return {**result, "shared": True} if result else result
+
+        self.misses += 1
+        task = asyncio.ensure_future(run())
+        self._inflight[key] = task
+        task.add_done_callback(lambda task: self._finish(key, ttl, task))
+        # Shielded: a cancelled request must not cancel a run others are waiting on
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, ttl: float, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if not result or result.get("error") or ttl <= 0:
+            return
+        now = time.time()
+        self._results.pop(key, None)
+        self._results[key] = (now + ttl, now, result)
+        self._prune(now)
+
+    def _prune(self, now: float):
+        for key in [key for key, (expires_at, _, _) in self._results.items() if expires_at <= now]:
+            del self._results[key]
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def stats(self) -> Dict:
+        return {
+            "entries": len(self._results),
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses
+        }
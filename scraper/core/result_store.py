@@ -0,0 +1,158 @@
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    website TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    item TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_category ON results (category, website, id);
+CREATE INDEX IF NOT EXISTS results_website ON results (website, id);
+CREATE INDEX IF NOT EXISTS results_run ON results (run_id, id);
+CREATE INDEX IF NOT EXISTS results_stored_at ON results (stored_at);
+"""
+
+def parse_timestamp(value: str) -> float:
+    """
+    Epoch seconds of an ISO 8601 timestamp (UTC unless it has an offset) or of a
+    number of epoch seconds. Raises ValueError for anything else.
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        if not math.isfinite(seconds):
+            raise ValueError(f"Invalid timestamp: {value}")
+        return seconds
+    parsed = datetime.fromisoformat(value.strip())
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+class ResultStore:
+    """
+    Every item returned by a site run, in one indexed SQLite table, so results can be
+    paged and filtered (by category, website, run or store time) without reading the
+    exported CSV/JSON files. Items older than `max_age` are dropped as new runs arrive.
+    Time filters use the store's own clock (stored_at), since scrapers format their
+    items' scraped_at differently.
+    """
+    def __init__(self, path: Path = settings.RESULT_STORE_DB, max_age: float = settings.RESULT_STORE_MAX_AGE):
+        self.max_age = max_age
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def add(self, items: List[Dict], category: str, website: str, run_id: str) -> int:
+        """Stores a site run's items (in one transaction). Returns the number stored."""
+        now = time.time()
+        fallback = datetime.now().isoformat()
+        rows = [
+            (run_id, category, website, str(item.get("scraped_at") or fallback), now,
+             json.dumps(item, ensure_ascii=False, default=str))
+            for item in items
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO results (run_id, category, website, scraped_at, stored_at, item) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.execute("DELETE FROM results WHERE stored_at < ?", (now - self.max_age,))
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(rows)
+
+    def query(self, category: Optional[str] = None, website: Optional[str] = None, run_id: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None, cursor: Optional[str] = None,
+              limit: int = settings.RESULTS_PAGE_SIZE, fields: Optional[Sequence[str]] = None,
+              newest_first: bool = True) -> Tuple[List[Dict], Optional[str]]:
+        """
+        One page of stored items matching the filters (`since`/`until` are timestamps, see
+        parse_timestamp, bounding when the items were stored), ordered by id. Returns the
+        page and the cursor of the next one (None on the last page). `fields` limits each
+        item to those keys. Raises ValueError for an invalid cursor, limit or timestamp.
+        """
+        if not 1 <= limit <= settings.RESULTS_PAGE_MAX:
+            raise ValueError(f"limit must be between 1 and {settings.RESULTS_PAGE_MAX}")
+        clauses, params = [], []
+        for column, value in (("category", category), ("website", website), ("run_id", run_id)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        for name, value, clause in (("since", since, "stored_at >= ?"), ("until", until, "stored_at < ?")):
+            if value:
+                try:
+                    params.append(parse_timestamp(value))
+                except ValueError:
+                    raise ValueError(f"Invalid {name} timestamp: {value}")
+                clauses.append(clause)
+        if cursor:
+            if not cursor.isdigit():
+                raise ValueError("Invalid cursor")
+            clauses.append("id < ?" if newest_first else "id > ?")
+            params.append(int(cursor))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "DESC" if newest_first else "ASC"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, run_id, category, website, scraped_at, stored_at, item FROM results {where} "
+                f"ORDER BY id {order} LIMIT ?",
+                params + [limit + 1]  # One extra row tells whether another page exists
+            ).fetchall()
+
+        page = []
+        for row_id, row_run, row_category, row_website, scraped_at, stored_at, item in rows[:limit]:
+            item = json.loads(item)
+            if fields:
+                item = {field: item.get(field) for field in fields}
+            page.append({
+                "id": row_id,
+                "run_id": row_run,
+                "category": row_category,
+                "website": row_website,
+                "scraped_at": scraped_at,
+                "stored_at": datetime.fromtimestamp(stored_at, timezone.utc).isoformat(),
+                "item": item
+            })
+        next_cursor = str(page[-1]["id"]) if len(rows) > limit else None
+        return page, next_cursor
+
+    def run_items(self, run_id: str) -> List[Dict]:
+        """All items stored by a run, in the order they were returned."""
+        with self._lock:
+            rows = self._conn.execute("SELECT item FROM results WHERE run_id = ? ORDER BY id", (run_id,)).fetchall()
+        return [json.loads(item) for item, in rows]
+
+_store: Optional[ResultStore] = None
+
+def get_result_store() -> ResultStore:
+    """Returns the process-wide store at settings.RESULT_STORE_DB."""
+    global _store
+    if _store is None:
+        _store = ResultStore()
+    return _store
@@ -0,0 +1,176 @@
+import asyncio
+import atexit
+import fcntl
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class SeenStore:
+    """
+    Set of already-scraped URLs persisted as a snapshot plus an append-only journal.
+    The snapshot is the scraper's JSON state file ({"scraped_urls": [...]}); new URLs are
+    appended as one line each to `<state file>.journal`. add() only buffers the URL: every
+    SEEN_SYNC_EVERY additions (and on schedule_sync()) the buffer is written and fsynced in
+    a worker thread, and the journal is folded into the snapshot once it holds
+    SEEN_COMPACT_THRESHOLD lines. A torn last line from a crash is ignored on load.
+    Journal writes and compaction hold an exclusive lock on `<state file>.lock`, and
+    compaction merges what is on disk, so worker processes can share a state file.
+    """
+    def __init__(self, path: str,
+                 sync_every: int = settings.SEEN_SYNC_EVERY,
+                 compact_threshold: int = settings.SEEN_COMPACT_THRESHOLD):
+        self.path = Path(path)
+        self.journal_path = Path(f"{path}.journal")
+        self.lock_path = Path(f"{path}.lock")
+        self.sync_every = max(1, sync_every)
+        self.compact_threshold = compact_threshold
+        self._buffer: List[str] = []
+        self._buffer_lock = threading.Lock()  # Held only to swap the buffer, never during I/O
+        self._io_lock = threading.Lock()
+        self._journal_lines = 0
+        self._sync_task: Optional[asyncio.Task] = None
+        with self._file_lock():
+            self._urls = self._read()
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock shared with other processes using the same state file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, 'a') as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> set:
+        """Snapshot plus journal as currently on disk. Caller must hold the file lock."""
+        urls = set()
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    urls.update(json.load(f).get("scraped_urls", []))
+            except Exception as e:
+                logger.error(f"Error loading state {self.path}: {e}")
+        self._journal_lines = 0
+        if self.journal_path.exists():
+            good = 0
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Torn write
+                    urls.add(line[:-1].decode('utf-8', errors='replace'))
+                    self._journal_lines += 1
+                    good += len(line)
+            if good < self.journal_path.stat().st_size:
+                # Drop the torn tail so the next append starts on a fresh line
+                os.truncate(self.journal_path, good)
+        return urls
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._urls
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._urls)
+
+    def add(self, url: str):
+        if url in self._urls:
+            return
+        self._urls.add(url)
+        with self._buffer_lock:
+            self._buffer.append(url)
+            due = len(self._buffer) >= self.sync_every
+        if due:
+            self.schedule_sync()
+
+    def schedule_sync(self):
+        """
+        Runs sync() in a worker thread when called from an event loop (at most one at a
+        time; URLs added meanwhile go out with the next one), or right away otherwise.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.sync()
+            return
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = loop.create_task(self._background_sync())
+
+    async def _background_sync(self):
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"SeenStore: syncing {self.journal_path} failed: {e}")
+
+    async def flush(self):
+        """sync() off the event loop."""
+        await asyncio.to_thread(self.sync)
+
+    def sync(self):
+        """Makes every added URL durable, compacting the journal when it has grown large."""
+        with self._io_lock:
+            with self._buffer_lock:
+                urls, self._buffer = self._buffer, []
+            if not urls and self._journal_lines < self.compact_threshold:
+                return
+            with self._file_lock():
+                if urls:
+                    with open(self.journal_path, 'a', encoding='utf-8') as journal:
+                        journal.write("".join(url + "\n" for url in urls))
+                        journal.flush()
+                        os.fsync(journal.fileno())
+                    self._journal_lines += len(urls)
+                if self._journal_lines >= self.compact_threshold:
+                    self._compact()
+
+    def compact(self):
+        """Rewrites the snapshot with every URL and empties the journal."""
+        self.sync()
+        with self._io_lock, self._file_lock():
+            self._compact()
+
+    def _compact(self):
+        """Caller must hold both locks."""
+        # Other processes may have appended since this one loaded: merge from disk
+        urls = self._read() | set(self._urls)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, 'w') as f:
+            json.dump({"scraped_urls": list(urls)}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        # The snapshot now holds everything, so the journal can start over
+        open(self.journal_path, 'w').close()
+        self._journal_lines = 0
+        logger.info(f"SeenStore: compacted {self.path} ({len(urls)} URLs)")
+
+    def close(self):
+        self.sync()
+
+# One store per state file, shared by a scraper and its worker instances
+_stores: Dict[str, SeenStore] = {}
+
+def open_seen_store(path: str) -> SeenStore:
+    key = os.path.abspath(path)
+    if key not in _stores:
+        _stores[key] = SeenStore(path)
+    return _stores[key]
+
+@atexit.register
+def _close_stores():
+    # URLs still buffered when the event loop went away (e.g. a CLI run's asyncio.run)
+    for store in _stores.values():
+        try:
+            store.close()
+        except Exception as e:
+            logger.error(f"SeenStore: closing {store.path} failed: {e}")
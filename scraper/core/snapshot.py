@@ -0,0 +1,56 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Optional
+from playwright.async_api import Page
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Snapshot:
+    """Serialized DOM of a rendered page, detached from the page itself."""
+    url: str
+    html: str
+
+async def take_snapshot(page: Page) -> Snapshot:
+    """
+    Grabs the rendered HTML in one round trip. The page is free to navigate
+    again as soon as this returns; parsing happens on the snapshot.
+    """
+    return Snapshot(page.url, await page.content())
+
+_executor: Optional[Executor] = None
+
+def get_parse_executor() -> Executor:
+    """
+    Returns the shared parse pool: processes (settings.PARSE_POOL_KIND = "process")
+    so lxml/BeautifulSoup work runs truly in parallel, or threads as a lighter fallback.
+    """
+    global _executor
+    if _executor is None:
+        if settings.PARSE_POOL_KIND == "process":
+            # spawn: forking a process that runs an event-loop thread and the Playwright driver is unsafe
+            _executor = ProcessPoolExecutor(max_workers=settings.PARSE_POOL_WORKERS,
+                                            mp_context=multiprocessing.get_context("spawn"))
+        else:
+            _executor = ThreadPoolExecutor(max_workers=settings.PARSE_POOL_WORKERS, thread_name_prefix="parse")
+        logger.info(f"Started {settings.PARSE_POOL_KIND} parse pool ({settings.PARSE_POOL_WORKERS} workers)")
+    return _executor
+
+async def parse_off_loop(func: Callable, *args):
+    """
+    Runs `func(*args)` in the parse pool so the event loop keeps driving browser tabs.
+    With a process pool, `func` must be a module-level function and args/results picklable.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_parse_executor(), partial(func, *args))
+
+def shutdown_parse_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
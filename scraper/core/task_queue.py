@@ -0,0 +1,307 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Task states
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+@dataclass
+class LeasedTask:
+    id: str
+    payload: Dict
+    attempts: int
+
+class TaskQueue(ABC):
+    """
+    Work queue shared by scrape workers, possibly on several hosts.
+    A worker leases a task for `lease_seconds` and keeps it by heartbeating; a lease
+    that expires (the worker crashed or hung) puts the task back for another worker.
+    Failed tasks (and tasks whose lease expired) are retried until they have been
+    attempted `max_attempts` times, then marked failed.
+    """
+    @abstractmethod
+    def put(self, payload: Dict) -> str:
+        """Adds a task. Returns its id."""
+
+    @abstractmethod
+    def lease(self, worker_id: str, lease_seconds: float = settings.TASK_LEASE_SECONDS,
+              max_attempts: int = settings.TASK_MAX_ATTEMPTS) -> Optional[LeasedTask]:
+        """
+        Takes the oldest pending (or lease-expired) task, or None if there is none.
+        Lease-expired tasks already attempted `max_attempts` times are marked failed instead.
+        """
+
+    @abstractmethod
+    def heartbeat(self, task_id: str, worker_id: str, lease_seconds: float = settings.TASK_LEASE_SECONDS) -> bool:
+        """Extends the lease. False if the worker no longer holds it (it was reclaimed)."""
+
+    @abstractmethod
+    def complete(self, task_id: str, worker_id: str, result: Any = None):
+        pass
+
+    @abstractmethod
+    def fail(self, task_id: str, worker_id: str, error: str, max_attempts: int = settings.TASK_MAX_ATTEMPTS):
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Number of tasks per state."""
+
+    def unfinished(self) -> int:
+        stats = self.stats()
+        return stats[PENDING] + stats[LEASED]
+
+class SQLiteTaskQueue(TaskQueue):
+    """
+    Queue in a SQLite file: fine for any number of workers on one host, or on hosts
+    sharing a filesystem with working locks. Use the Redis backend across machines otherwise.
+    """
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id TEXT PRIMARY KEY,
+        payload TEXT NOT NULL,
+        state TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        worker TEXT NOT NULL DEFAULT '',
+        leased_until REAL NOT NULL DEFAULT 0,
+        result TEXT,
+        error TEXT NOT NULL DEFAULT '',
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state, created_at);
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def _transaction(self, fn):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self._conn)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def put(self, payload: Dict) -> str:
+        task_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO tasks (id, payload, state, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (task_id, json.dumps(payload), PENDING, now, now)
+            )
+        return task_id
+
+    def lease(self, worker_id: str, lease_seconds: float = settings.TASK_LEASE_SECONDS,
+              max_attempts: int = settings.TASK_MAX_ATTEMPTS) -> Optional[LeasedTask]:
+        def take(conn):
+            now = time.time()
+            cursor = conn.execute(
+                "UPDATE tasks SET state = ?, error = ?, leased_until = 0, updated_at = ? "
+                "WHERE state = ? AND leased_until < ? AND attempts >= ?",
+                (FAILED, "Lease expired on the last attempt", now, LEASED, now, max_attempts)
+            )
+            if cursor.rowcount:
+                logger.warning(f"TaskQueue: {cursor.rowcount} expired task(s) out of attempts, marked failed")
+            row = conn.execute(
+                "SELECT id, payload, attempts, state FROM tasks WHERE state = ? OR (state = ? AND leased_until < ?) "
+                "ORDER BY created_at LIMIT 1",
+                (PENDING, LEASED, now)
+            ).fetchone()
+            if not row:
+                return None
+            task_id, payload, attempts, state = row
+            if state == LEASED:
+                logger.warning(f"TaskQueue: reclaiming expired lease of task {task_id}")
+            conn.execute(
+                "UPDATE tasks SET state = ?, worker = ?, leased_until = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE id = ?",
+                (LEASED, worker_id, now + lease_seconds, now, task_id)
+            )
+            return LeasedTask(task_id, json.loads(payload), attempts + 1)
+        return self._transaction(take)
+
+    def heartbeat(self, task_id: str, worker_id: str, lease_seconds: float = settings.TASK_LEASE_SECONDS) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET leased_until = ?, updated_at = ? WHERE id = ? AND worker = ? AND state = ?",
+                (now + lease_seconds, now, task_id, worker_id, LEASED)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, task_id: str, worker_id: str, result: Any = None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE tasks SET state = ?, result = ?, updated_at = ? WHERE id = ? AND worker = ? AND state = ?",
+                (DONE, json.dumps(result), time.time(), task_id, worker_id, LEASED)
+            )
+
+    def fail(self, task_id: str, worker_id: str, error: str, max_attempts: int = settings.TASK_MAX_ATTEMPTS):
+        def record(conn):
+            row = conn.execute("SELECT attempts FROM tasks WHERE id = ? AND worker = ? AND state = ?",
+                               (task_id, worker_id, LEASED)).fetchone()
+            if not row:
+                return
+            conn.execute(
+                "UPDATE tasks SET state = ?, error = ?, leased_until = 0, updated_at = ? WHERE id = ?",
+                (PENDING if row[0] < max_attempts else FAILED, error, time.time(), task_id)
+            )
+        self._transaction(record)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state").fetchall()
+        stats = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        stats.update(dict(rows))
+        return stats
+
+class RedisTaskQueue(TaskQueue):
+    """
+    Queue on a Redis-compatible server (Redis, Valkey, KeyDB...), for workers on several hosts.
+    Pending ids are a list, leases a sorted set scored by expiry; leasing (including the
+    reclaim of expired leases) runs as one Lua script so two workers never get the same task,
+    and heartbeat/complete/fail check lease ownership in the script that updates the task.
+    Every state change also moves the task between per-state counters, so stats() is one call.
+    """
+    # KEYS: pending list, leases, task prefix, counters
+    LEASE_SCRIPT = """
+    local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+    for _, id in ipairs(expired) do
+        redis.call('ZREM', KEYS[2], id)
+        redis.call('HINCRBY', KEYS[4], 'leased', -1)
+        if tonumber(redis.call('HGET', KEYS[3] .. id, 'attempts') or 0) >= tonumber(ARGV[4]) then
+            redis.call('HSET', KEYS[3] .. id, 'state', 'failed', 'error', 'Lease expired on the last attempt')
+            redis.call('HINCRBY', KEYS[4], 'failed', 1)
+        else
+            redis.call('HSET', KEYS[3] .. id, 'state', 'pending')
+            redis.call('HINCRBY', KEYS[4], 'pending', 1)
+            redis.call('RPUSH', KEYS[1], id)
+        end
+    end
+    local id = redis.call('LPOP', KEYS[1])
+    if not id then return nil end
+    redis.call('ZADD', KEYS[2], ARGV[2], id)
+    redis.call('HSET', KEYS[3] .. id, 'worker', ARGV[3], 'state', 'leased')
+    redis.call('HINCRBY', KEYS[4], 'pending', -1)
+    redis.call('HINCRBY', KEYS[4], 'leased', 1)
+    local attempts = redis.call('HINCRBY', KEYS[3] .. id, 'attempts', 1)
+    return {id, redis.call('HGET', KEYS[3] .. id, 'payload'), attempts}
+    """
+    # The ownership check of heartbeat/complete/fail, in the same script as their update.
+    # KEYS: leases, task prefix; ARGV: task id, worker id
+    HOLDS = """
+    local task = KEYS[2] .. ARGV[1]
+    if redis.call('HGET', task, 'worker') ~= ARGV[2] or not redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+        return 0
+    end
+    """
+    HEARTBEAT_SCRIPT = HOLDS + """
+    redis.call('ZADD', KEYS[1], 'XX', ARGV[3], ARGV[1])
+    return 1
+    """
+    # KEYS[3]: counters
+    COMPLETE_SCRIPT = HOLDS + """
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    redis.call('HSET', task, 'state', 'done', 'result', ARGV[3])
+    redis.call('HINCRBY', KEYS[3], 'leased', -1)
+    redis.call('HINCRBY', KEYS[3], 'done', 1)
+    return 1
+    """
+    # KEYS[3]: pending list, KEYS[4]: counters
+    FAIL_SCRIPT = HOLDS + """
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    redis.call('HINCRBY', KEYS[4], 'leased', -1)
+    if tonumber(redis.call('HGET', task, 'attempts') or 0) < tonumber(ARGV[4]) then
+        redis.call('HSET', task, 'state', 'pending', 'error', ARGV[3])
+        redis.call('HINCRBY', KEYS[4], 'pending', 1)
+        redis.call('RPUSH', KEYS[3], ARGV[1])
+    else
+        redis.call('HSET', task, 'state', 'failed', 'error', ARGV[3])
+        redis.call('HINCRBY', KEYS[4], 'failed', 1)
+    end
+    return 1
+    """
+
+    def __init__(self, url: str, prefix: str = "scraper:tasks"):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("The redis package is required for a redis:// TASK_QUEUE_URL (pip install redis)")
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.pending_key = f"{prefix}:pending"
+        self.leases_key = f"{prefix}:leases"
+        self.task_prefix = f"{prefix}:task:"
+        self.counts_key = f"{prefix}:counts"
+        self._lease = self.client.register_script(self.LEASE_SCRIPT)
+        self._heartbeat = self.client.register_script(self.HEARTBEAT_SCRIPT)
+        self._complete = self.client.register_script(self.COMPLETE_SCRIPT)
+        self._fail = self.client.register_script(self.FAIL_SCRIPT)
+
+    def put(self, payload: Dict) -> str:
+        task_id = uuid.uuid4().hex
+        pipe = self.client.pipeline()
+        pipe.hset(self.task_prefix + task_id, mapping={"payload": json.dumps(payload), "state": PENDING, "attempts": 0})
+        pipe.hincrby(self.counts_key, PENDING, 1)
+        pipe.rpush(self.pending_key, task_id)
+        pipe.execute()
+        return task_id
+
+    def lease(self, worker_id: str, lease_seconds: float = settings.TASK_LEASE_SECONDS,
+              max_attempts: int = settings.TASK_MAX_ATTEMPTS) -> Optional[LeasedTask]:
+        now = time.time()
+        leased = self._lease(keys=[self.pending_key, self.leases_key, self.task_prefix, self.counts_key],
+                             args=[now, now + lease_seconds, worker_id, max_attempts])
+        if not leased:
+            return None
+        task_id, payload, attempts = leased
+        return LeasedTask(task_id, json.loads(payload), int(attempts))
+
+    def heartbeat(self, task_id: str, worker_id: str, lease_seconds: float = settings.TASK_LEASE_SECONDS) -> bool:
+        return bool(self._heartbeat(keys=[self.leases_key, self.task_prefix],
+                                    args=[task_id, worker_id, time.time() + lease_seconds]))
+
+    def complete(self, task_id: str, worker_id: str, result: Any = None):
+        self._complete(keys=[self.leases_key, self.task_prefix, self.counts_key],
+                       args=[task_id, worker_id, json.dumps(result)])
+
+    def fail(self, task_id: str, worker_id: str, error: str, max_attempts: int = settings.TASK_MAX_ATTEMPTS):
+        self._fail(keys=[self.leases_key, self.task_prefix, self.pending_key, self.counts_key],
+                   args=[task_id, worker_id, error, max_attempts])
+
+    def stats(self) -> Dict[str, int]:
+        stats = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        for state, count in self.client.hgetall(self.counts_key).items():
+            if state in stats:
+                stats[state] = int(count)
+        return stats
+
+def get_task_queue(url: str = settings.TASK_QUEUE_URL) -> TaskQueue:
+    """Opens the queue backend named by `url`: sqlite:///<path> or redis://host:port/db."""
+    if url.startswith("sqlite:///"):
+        return SQLiteTaskQueue(url[len("sqlite:///"):])
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisTaskQueue(url)
+    raise ValueError(f"Unsupported task queue URL: {url}")
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterator, List
+from playwright.async_api import Browser
+from config import settings
+from scraper.core.browser_manager import BrowserManager
+from scraper.core.exporter import Exporter
+from scraper.core.http_cache import get_cache
+from scraper.core.http_client import close_session
+from scraper.core.metrics import SITE_ITEMS, SITE_SECONDS
+from scraper.core.resource_blocker import ResourceBlocker
+from scraper.core.result_store import get_result_store
+from scraper.core.snapshot import shutdown_parse_executor
+from scraper.registry import SCRAPER_CLASSES, CATEGORY_WEBSITES
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class SiteTask:
+    """One website to scrape, saved to data/<category>/."""
+    category: str
+    website: str
+    output_format: str = "csv"
+    incremental: bool = False
+
+def site_tasks(category: str = "all", site: str = "all", output_format: str = "csv",
+               incremental: bool = False) -> List[SiteTask]:
+    """
+    Tasks for the websites of `category` ("all" for every category), limited to
+    `site` unless it is "all" (a comma-separated list of scraper keys is accepted).
+    """
+    categories = CATEGORY_WEBSITES if category == "all" else {category: CATEGORY_WEBSITES.get(category, [])}
+    wanted = None if site == "all" else {key.strip().lower() for key in site.split(",")}
+    return [SiteTask(name, entry["scraper"], output_format, incremental)
+            for name, entries in categories.items() for entry in entries
+            if wanted is None or entry["scraper"] in wanted]
+
+async def scrape_site(task: SiteTask, browser_factory, run_id: str = "") -> Dict:
+    """
+    Scrapes one website and saves its output, the same way the API server does:
+    static fast path first, otherwise a fresh context (with the scraper's blocking
+    profile) on the browser returned by `await browser_factory()`.
+    `run_id` (a new one by default) keys the scraper's frontier crawl and its stored items.
+    Returns the per-site result entry.
+    """
+    scraper_class = SCRAPER_CLASSES.get(task.website)
+    if not scraper_class:
+        return {"website": task.website, "error": "No scraper implementation"}
+
+    started = time.monotonic()
+    run_id = run_id or uuid.uuid4().hex
+    scraper = scraper_class(None)
+    scraper.incremental = scraper.INCREMENTAL and task.incremental
+    scraper.run_id = run_id
+
+    data = None
+    if scraper.FETCH_MODE == "static":
+        data = await scraper.scrape_static()
+
+    if data is None:
+        browser: Browser = await browser_factory()
+        context = await BrowserManager.new_context(browser)
+        try:
+            await ResourceBlocker(scraper_class.BLOCK_PROFILE, cache=get_cache()).attach(context)
+            scraper.page = await context.new_page()
+            data = await scraper.scrape()
+        finally:
+            await context.close()
+
+    output_dir = f"data/{task.category}"
+    await asyncio.to_thread(Exporter.save_results, data, output_dir, task.website, task.output_format,
+                            scraper.incremental)
+    await asyncio.to_thread(get_result_store().add, data, task.category, task.website, run_id)
+    SITE_ITEMS.observe(len(data), website=task.website)
+    SITE_SECONDS.observe(time.monotonic() - started, website=task.website)
+    return {
+        "website": task.website,
+        "category": task.category,
+        "items_scraped": len(data),
+        "saved_at": os.path.abspath(output_dir),
+        "run_id": run_id,
+        "results_url": f"/api/results?run_id={run_id}"
+    }
+
+def _worker_main(task_queue, result_queue, headless: bool, concurrency: int):
+    """Entry point of a worker process."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s')
+    # This process already has a core of its own; a nested parse process pool would oversubscribe
+    settings.PARSE_POOL_KIND = "thread"
+    asyncio.run(_worker_loop(task_queue, result_queue, headless, concurrency))
+
+async def _worker_loop(task_queue, result_queue, headless: bool, concurrency: int):
+    loop = asyncio.get_running_loop()
+    manager = BrowserManager(headless=headless)
+    launch_lock = asyncio.Lock()
+
+    async def get_browser() -> Browser:
+        # Chromium is only launched once a task actually needs it
+        async with launch_lock:
+            if manager.browser is None or not manager.browser.is_connected():
+                await manager.start()
+        return manager.browser
+
+    async def consume():
+        while True:
+            task = await loop.run_in_executor(None, task_queue.get)
+            if task is None:
+                return
+            try:
+                result = await scrape_site(task, get_browser)
+            except Exception as e:
+                logger.error(f"Error scraping {task.website}: {e}")
+                result = {"website": task.website, "category": task.category, "error": str(e)}
+            result_queue.put(result)
+
+    try:
+        await asyncio.gather(*(consume() for _ in range(concurrency)))
+    finally:
+        if manager.playwright:
+            await manager.stop()
+        await close_session()
+        shutdown_parse_executor()
+
+class ProcessCoordinator:
+    """
+    Spreads site tasks over `workers` processes, each owning its own Chromium and event
+    loop (and running up to `tasks_per_worker` sites at once), so CPU-side work such as
+    text cleaning, parsing and CSV export scales with cores. Results are yielded to the
+    parent as each site finishes; a worker that dies does not hang the run.
+    """
+    def __init__(self, workers: int = settings.PROCESS_WORKERS, headless: bool = True,
+                 tasks_per_worker: int = settings.PROCESS_WORKER_TASKS):
+        self.workers = max(1, workers)
+        self.headless = headless
+        self.tasks_per_worker = max(1, tasks_per_worker)
+
+    def run(self, tasks: List[SiteTask]) -> Iterator[Dict]:
+        if not tasks:
+            return
+        # spawn: Playwright's driver and event loops do not survive a fork
+        ctx = multiprocessing.get_context("spawn")
+        task_queue, result_queue = ctx.Queue(), ctx.Queue()
+        for task in tasks:
+            task_queue.put(task)
+        workers = min(self.workers, len(tasks))
+        for _ in range(workers * self.tasks_per_worker):
+            task_queue.put(None)  # One stop marker per consumer
+
+        processes = [
+            ctx.Process(target=_worker_main, name=f"scrape-worker-{i}",
+                        args=(task_queue, result_queue, self.headless, self.tasks_per_worker))
+            for i in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        logger.info(f"Started {workers} worker processes for {len(tasks)} sites")
+
+        pending = len(tasks)
+        try:
+            while pending:
+                try:
+                    result = result_queue.get(timeout=5)
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes):
+                        logger.error(f"All worker processes exited with {pending} sites unfinished")
+                        return
+                    continue
+                pending -= 1
+                yield result
+        finally:
+            for process in processes:
+                process.join(timeout=30)
+                if process.is_alive():
+                    process.terminate()
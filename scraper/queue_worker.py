@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import os
+import socket
+from typing import Optional
+from playwright.async_api import Browser
+from config import settings
+from scraper.core.browser_manager import BrowserManager
+from scraper.core.http_client import close_session
+from scraper.core.snapshot import shutdown_parse_executor
+from scraper.core.task_queue import TaskQueue, LeasedTask
+from scraper.process_pool import SiteTask, scrape_site, site_tasks
+
+logger = logging.getLogger(__name__)
+
+def enqueue_sites(queue: TaskQueue, category: str = "all", site: str = "all",
+                  output_format: str = "csv", incremental: bool = False) -> int:
+    """Queues one task per website of `category` ("all" for every category). Returns the count."""
+    tasks = site_tasks(category, site, output_format, incremental)
+    for task in tasks:
+        queue.put(vars(task))
+    return len(tasks)
+
+class QueueWorker:
+    """
+    Pulls site tasks from a shared TaskQueue and scrapes them with its own browser.
+    Identical workers can run on several hosts against one queue: each lease is kept
+    alive by a heartbeat while the site runs, so a crashed worker's tasks are reclaimed
+    by the others once the lease expires. With `drain`, the worker exits when no task
+    is pending or leased anywhere.
+    """
+    def __init__(self, queue: TaskQueue, worker_id: Optional[str] = None, headless: bool = True,
+                 concurrency: int = settings.PROCESS_WORKER_TASKS, drain: bool = True):
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.headless = headless
+        self.concurrency = max(1, concurrency)
+        self.drain = drain
+        self.manager = BrowserManager(headless=headless)
+        self._launch_lock = asyncio.Lock()
+
+    async def get_browser(self) -> Browser:
+        async with self._launch_lock:
+            if self.manager.browser is None or not self.manager.browser.is_connected():
+                await self.manager.start()
+        return self.manager.browser
+
+    async def run(self):
+        logger.info(f"Queue worker {self.worker_id} started ({self.concurrency} concurrent sites)")
+        try:
+            await asyncio.gather(*(self._consume() for _ in range(self.concurrency)))
+        finally:
+            if self.manager.playwright:
+                await self.manager.stop()
+            await close_session()
+            shutdown_parse_executor()
+        logger.info(f"Queue worker {self.worker_id} finished")
+
+    async def _consume(self):
+        while True:
+            task = await asyncio.to_thread(self.queue.lease, self.worker_id)
+            if task is None:
+                if self.drain and await asyncio.to_thread(self.queue.unfinished) == 0:
+                    return
+                # Other workers' leases may still expire and come back
+                await asyncio.sleep(settings.TASK_POLL_INTERVAL)
+                continue
+            await self._process(task)
+
+    async def _process(self, task: LeasedTask):
+        site = SiteTask(**task.payload)
+        logger.info(f"[{self.worker_id}] Leased {site.category}/{site.website} (attempt {task.attempts})")
+        heartbeat = asyncio.create_task(self._heartbeat(task))
+        try:
+            # The task id keys the crawl, so a retry after a lost lease resumes it
+            result = await scrape_site(site, self.get_browser, run_id=task.id)
+        except Exception as e:
+            logger.error(f"[{self.worker_id}] {site.website} failed: {e}")
+            await asyncio.to_thread(self.queue.fail, task.id, self.worker_id, str(e))
+            return
+        finally:
+            heartbeat.cancel()
+        if result.get("error"):
+            await asyncio.to_thread(self.queue.fail, task.id, self.worker_id, result["error"])
+        else:
+            await asyncio.to_thread(self.queue.complete, task.id, self.worker_id, result)
+
+    async def _heartbeat(self, task: LeasedTask):
+        while True:
+            await asyncio.sleep(settings.TASK_HEARTBEAT_INTERVAL)
+            if not await asyncio.to_thread(self.queue.heartbeat, task.id, self.worker_id):
+                logger.warning(f"[{self.worker_id}] Lost the lease of task {task.id}; another worker may redo it")
+                return
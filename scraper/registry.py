@@ -0,0 +1,95 @@
+"""
+Scraper registry shared by the API server and the worker processes.
+"""
+from scraper.categories.biography.wikipedia import WikipediaScraper
+from scraper.categories.politics.bbc import BBCScraper
+from scraper.categories.health.healthline import HealthlineScraper
+from scraper.categories.bollywood.filmibeat import FilmiBeatScraper
+from scraper.categories.bollywood.bollywoodhungama import BollywoodHungamaScraper
+from scraper.categories.bollywood.imdb import IMDbScraper
+from scraper.categories.health.who import WHOScraper
+from scraper.categories.health.nih import NIHScraper
+from scraper.categories.fitness.healthline_fitness import HealthlineFitnessScraper
+from scraper.categories.fitness.menshealth import MensHealthScraper
+from scraper.categories.technology.gadgets360 import Gadgets360Scraper
+from scraper.categories.sports.espncricinfo import ESPNCricinfoScraper
+from scraper.categories.sports.sportskeeda import SportskeedaScraper
+from scraper.categories.travel.lonelyplanet import LonelyPlanetScraper
+from scraper.categories.fashion.fashionunited import FashionUnitedScraper
+from scraper.categories.business.business_insider import BusinessInsiderScraper
+from scraper.categories.entertainment.people import PeopleScraper
+from scraper.categories.real_estate import DubizzleScraper, BayutScraper, PropertyFinderScraper, EmaarScraper
+
+# Scraper Class Mapping
+SCRAPER_CLASSES = {
+    "wikipedia": WikipediaScraper,
+    "bbc": BBCScraper,
+    "healthline": HealthlineScraper,
+    "filmibeat": FilmiBeatScraper,
+    "bollywoodhungama": BollywoodHungamaScraper,
+    "imdb": IMDbScraper,
+    "who": WHOScraper,
+    "nih": NIHScraper,
+    "healthline_fitness": HealthlineFitnessScraper,
+    "menshealth": MensHealthScraper,
+    "gadgets360": Gadgets360Scraper,
+    "espncricinfo": ESPNCricinfoScraper,
+    "sportskeeda": SportskeedaScraper,
+    "lonelyplanet": LonelyPlanetScraper,
+    "fashionunited": FashionUnitedScraper,
+    "business_insider": BusinessInsiderScraper,
+    "people": PeopleScraper,
+    "dubizzle": DubizzleScraper,
+    "bayut": BayutScraper,
+    "property_finder": PropertyFinderScraper,
+    "emaar": EmaarScraper
+}
+
+# Category to Website Mapping
+CATEGORY_WEBSITES = {
+    "biography": [
+        {"name": "Wikipedia", "url": "https://en.wikipedia.org/wiki/Main_Page", "scraper": "wikipedia"}
+    ],
+    "bollywood": [
+        {"name": "FilmiBeat", "url": "https://www.filmibeat.com/", "scraper": "filmibeat"},
+        {"name": "Bollywood Hungama", "url": "https://www.bollywoodhungama.com/", "scraper": "bollywoodhungama"},
+        {"name": "IMDb", "url": "https://www.imdb.com/", "scraper": "imdb"}
+    ],
+    "politics": [
+        {"name": "BBC", "url": "https://www.bbc.com/", "scraper": "bbc"}
+    ],
+    "health": [
+        {"name": "WHO", "url": "https://www.who.int/", "scraper": "who"},
+        {"name": "NIH", "url": "https://www.nih.gov/", "scraper": "nih"},
+        {"name": "Healthline", "url": "https://www.healthline.com/", "scraper": "healthline"}
+    ],
+    "fitness": [
+        {"name": "Healthline Fitness", "url": "https://www.healthline.com/fitness", "scraper": "healthline_fitness"},
+        {"name": "Men's Health", "url": "https://www.menshealth.com/", "scraper": "menshealth"}
+    ],
+    "technology": [
+        {"name": "Gadgets 360", "url": "https://www.gadgets360.com/", "scraper": "gadgets360"}
+    ],
+    "sports": [
+        {"name": "ESPN Cricinfo", "url": "https://www.espncricinfo.com/", "scraper": "espncricinfo"},
+        {"name": "Sportskeeda", "url": "https://www.sportskeeda.com/", "scraper": "sportskeeda"}
+    ],
+    "travel": [
+        {"name": "Lonely Planet", "url": "https://www.lonelyplanet.com/", "scraper": "lonelyplanet"}
+    ],
+    "fashion": [
+        {"name": "Fashion United", "url": "https://fashionunited.in/news/fashion", "scraper": "fashionunited"}
+    ],
+    "business": [
+        {"name": "Business Insider", "url": "https://www.businessinsider.com/", "scraper": "business_insider"}
+    ],
+    "entertainment": [
+        {"name": "People", "url": "https://people.com/", "scraper": "people"}
+    ],
+    "real_estate": [
+        {"name": "Dubizzle UAE", "url": "https://dubai.dubizzle.com/en/property-for-sale/residential/", "scraper": "dubizzle"},
+        {"name": "Bayut", "url": "https://www.bayut.com/for-sale/property/uae/", "scraper": "bayut"},
+        {"name": "Property Finder UAE", "url": "https://www.propertyfinder.ae/en/search?c=2&fu=0&rp=y&ob=mr", "scraper": "property_finder"},
+        {"name": "Emaar Properties", "url": "https://properties.emaar.com/en/our-communities/", "scraper": "emaar"}
+    ]
+}
@@ -7,8 +7,14 @@ from termcolor import colored
 # Ensure the current directory is in PYTHONPATH
 sys.path.append(".")
 
+from config import settings
 from scraper.core.browser_manager import BrowserManager
 from scraper.core.exporter import Exporter
+from scraper.core.resource_blocker import ResourceBlocker
+from scraper.core.http_client import close_session
+from scraper.core.http_cache import get_cache
+from scraper.core.snapshot import shutdown_parse_executor
+from scraper.core.politeness import politeness_stats
 
 # Import Scrapers
 from scraper.categories.biography.wikipedia import WikipediaScraper
@@ -23,7 +29,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ScraperRunner")
 
-async def run_scraper(category: str, site: str, headless: bool):
+async def run_scraper(category: str, site: str, headless: bool, incremental: bool = False):
     logger.info(colored(f"Initializing Scraper for Category: {category}, Site: {site}", "cyan"))
     
     async with BrowserManager(headless=headless) as bm:
@@ -40,31 +46,91 @@ async def run_scraper(category: str, site: str, headless: bool):
         if not scraper:
             logger.error(colored(f"No scraper found for site: {site}", "red"))
             return
+        scraper.incremental = scraper.INCREMENTAL and incremental
+
+        blocker = ResourceBlocker(scraper.BLOCK_PROFILE, cache=get_cache())
+        await blocker.attach(page.context)
 
         logger.info("Starting extraction...")
         data = await scraper.scrape()
+        logger.info(f"Resource blocking: {blocker.stats()}")
+        if get_cache():
+            logger.info(f"HTTP cache: {get_cache().stats()}")
+        logger.info(f"Politeness: {politeness_stats()}")
         
         if data:
             logger.info(colored(f"Extracted {len(data)} records.", "green"))
             
             # Export
             filename = f"data/{category}/{site}_data.csv"
-            Exporter.to_csv(data, filename)
+            # Incremental runs return only new items: add them to the existing export
+            Exporter.to_csv(data, filename, scraper.incremental)
             
             # Also generic dump
-            Exporter.to_json(data, f"data/{category}/{site}_data.json")
+            Exporter.to_json(data, f"data/{category}/{site}_data.json", scraper.incremental)
         else:
             logger.warning("No data extracted.")
 
+    await close_session()
+    shutdown_parse_executor()
+
+def run_parallel(category: str, site: str, processes: int, headless: bool, incremental: bool):
+    """
+    Scrapes many sites over worker processes, each with its own browser.
+    `category` and `site` may be "all"; `site` may also be a comma-separated list.
+    """
+    from scraper.process_pool import ProcessCoordinator, site_tasks
+
+    tasks = site_tasks(category, site, output_format="both", incremental=incremental)
+    if not tasks:
+        logger.error(colored(f"No scrapers found for category={category}, site={site}", "red"))
+        return
+
+    logger.info(colored(f"Scraping {len(tasks)} sites over {processes} worker processes", "cyan"))
+    for result in ProcessCoordinator(workers=processes, headless=headless).run(tasks):
+        if result.get("error"):
+            logger.error(colored(f"{result['website']}: {result['error']}", "red"))
+        else:
+            logger.info(colored(f"{result['website']}: extracted {result['items_scraped']} records.", "green"))
+
+def run_queue(enqueue: bool, worker: bool, category: str, site: str, headless: bool, incremental: bool):
+    """
+    Shared-queue mode: --enqueue adds site tasks to settings.TASK_QUEUE_URL,
+    --worker scrapes tasks from it until none are left (run one per host).
+    """
+    from scraper.core.task_queue import get_task_queue
+    from scraper.queue_worker import QueueWorker, enqueue_sites
+
+    queue = get_task_queue()
+    if enqueue:
+        count = enqueue_sites(queue, category, site, output_format="both", incremental=incremental)
+        logger.info(colored(f"Queued {count} sites ({queue.stats()})", "cyan"))
+    if worker:
+        asyncio.run(QueueWorker(queue, headless=headless).run())
+        logger.info(f"Queue: {queue.stats()}")
+
 def main():
     parser = argparse.ArgumentParser(description="Category-Based Web Scraper Runner")
     parser.add_argument("--category", type=str, default="biography", help="Category to scrape (e.g., biography, politics)")
-    parser.add_argument("--site", type=str, required=True, help="Site to scrape (e.g., wikipedia, bbc)")
+    parser.add_argument("--site", type=str, required=True, help="Site to scrape (e.g., wikipedia, bbc; with --processes/--enqueue also a list or 'all')")
     parser.add_argument("--headed", action="store_true", help="Run browser in headed mode (visible)")
+    parser.add_argument("--incremental", action="store_true", default=settings.INCREMENTAL_CRAWL,
+                        help="Stop feed-style scrapers at content earlier runs already saw")
+    
+    parser.add_argument("--processes", type=int, default=0,
+                        help="Scrape over this many worker processes, each with its own browser")
+    
+    parser.add_argument("--enqueue", action="store_true", help="Add the selected sites to the shared task queue")
+    parser.add_argument("--worker", action="store_true", help="Scrape tasks from the shared task queue until it is drained")
     
     args = parser.parse_args()
     
-    asyncio.run(run_scraper(args.category, args.site, not args.headed))
+    if args.enqueue or args.worker:
+        run_queue(args.enqueue, args.worker, args.category, args.site, not args.headed, args.incremental)
+    elif args.processes:
+        run_parallel(args.category, args.site, args.processes, not args.headed, args.incremental)
+    else:
+        asyncio.run(run_scraper(args.category, args.site, not args.headed, args.incremental))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,88 @@
+import sys
+import os
+import asyncio
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+from scraper.core.frontier import CrawlFrontier, DONE, FAILED, QUEUED, IN_FLIGHT
+
+def new_frontier(tmp, **kwargs):
+    return CrawlFrontier(os.path.join(tmp, "frontier.db"), **kwargs)
+
+def test_lease_and_complete():
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            crawl = await new_frontier(tmp).open("Site")
+            assert await crawl.enqueue(["https://a.com/1", "https://a.com/2"]) == ["https://a.com/1", "https://a.com/2"]
+            # URLs already in the crawl are not queued again
+            assert await crawl.enqueue(["https://a.com/1"]) == []
+
+            leased = await crawl.lease()
+            assert [entry.url for entry in leased] == ["https://a.com/1"]
+            await crawl.complete("https://a.com/1", {"title": "One"})
+            assert (await crawl.counts())[DONE] == 1
+            assert await crawl.pending() == 1
+            assert [entry.result for entry in await crawl.entries((DONE,))] == [{"title": "One"}]
+
+            # An expired lease is handed out again
+            first = await crawl.lease(lease_seconds=-1)
+            again = await crawl.lease()
+            assert first[0].url == again[0].url == "https://a.com/2"
+            assert await crawl.lease() == []
+    asyncio.run(run())
+
+def test_fail_retries_then_gives_up():
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            crawl = await new_frontier(tmp).open("Site")
+            await crawl.enqueue(["https://a.com/1"])
+            for _ in range(2):
+                await crawl.lease()
+                assert await crawl.fail("https://a.com/1", "timeout", max_retries=2)
+            await crawl.lease()
+            assert not await crawl.fail("https://a.com/1", "timeout", max_retries=2)
+            entries = await crawl.entries()
+            assert entries[0].state == FAILED and entries[0].attempts == 3 and entries[0].error == "timeout"
+            assert await crawl.lease() == []
+    asyncio.run(run())
+
+def test_resume_per_run():
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            frontier = new_frontier(tmp)
+            crawl = await frontier.open("Site", "run-1")
+            await crawl.enqueue(["https://a.com/1", "https://a.com/2"])
+            await crawl.mark_discovered()
+            await crawl.lease()
+
+            # Another run of the same scraper gets a crawl of its own
+            other = await frontier.open("Site", "run-2")
+            assert other.id != crawl.id and not other.discovered
+            await other.finish()
+
+            # The same run resumes its unfinished crawl
+            resumed = await frontier.open("Site", "run-1")
+            assert resumed.id == crawl.id and resumed.discovered
+            counts = await resumed.counts()
+            assert counts[QUEUED] == 1 and counts[IN_FLIGHT] == 1
+
+            await resumed.finish()
+            assert (await frontier.open("Site", "run-1")).id != crawl.id
+    asyncio.run(run())
+
+def test_stale_crawl_is_not_resumed():
+    async def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            frontier = new_frontier(tmp, resume_max_age=3600)
+            crawl = await frontier.open("Site")
+            await crawl.enqueue(["https://a.com/1"])
+            # Last activity two hours ago
+            frontier._write("UPDATE urls SET updated_at = ? WHERE crawl_id = ?", (time.time() - 7200, crawl.id))
+            frontier._write("UPDATE crawls SET started_at = ? WHERE id = ?", (time.time() - 7200, crawl.id))
+
+            fresh = await frontier.open("Site")
+            assert fresh.id != crawl.id and not fresh.discovered
+            # The abandoned crawl's URLs are dropped
+            assert sum((await crawl.counts()).values()) == 0
+    asyncio.run(run())
@@ -0,0 +1,80 @@
+import sys
+import os
+import asyncio
+import time
+from concurrent.futures import Future
+
+sys.path.append(os.getcwd())
+from scraper.core.jobs import JobManager, JobRejected, QUEUED, RUNNING, COMPLETED
+
+def idle_submit(coro):
+    """Never runs the job, so it stays queued."""
+    coro.close()
+    return Future()
+
+def new_manager(**kwargs):
+    manager = JobManager(idle_submit, **kwargs)
+    manager.avg_duration = 60.0
+    return manager
+
+def test_per_client_limit():
+    manager = new_manager(max_running=2, queue_size=10, max_per_client=2)
+    for _ in range(2):
+        manager.create({}, 1, client="10.0.0.1")
+    try:
+        manager.create({}, 1, client="10.0.0.1")
+        assert False, "third job of the client was admitted"
+    except JobRejected as e:
+        assert "client" in str(e)
+        # Its oldest job starts right away (idle slots) and takes avg_duration
+        assert e.retry_after == 60
+    # Other clients are not affected
+    manager.create({}, 1, client="10.0.0.2")
+
+def test_full_queue_retry_after_follows_running_jobs():
+    manager = new_manager(max_running=1, queue_size=2, max_per_client=10)
+    running = manager.create({}, 1)
+    running.status = RUNNING
+    running.started_at = time.time() - 45
+    manager.create({}, 1)
+    manager.create({}, 1)
+    try:
+        manager.create({}, 1)
+        assert False, "job admitted to a full queue"
+    except JobRejected as e:
+        assert "queue is full" in str(e)
+        assert 14 <= e.retry_after <= 16
+
+    # A finished job no longer counts as running
+    running.status = COMPLETED
+    assert manager.stats()["running"] == 0 and manager.stats()["queued"] == 2
+
+def test_queue_position_and_wait():
+    manager = new_manager(max_running=2, queue_size=10, max_per_client=10)
+    jobs = [manager.create({}, 1) for _ in range(3)]
+    for job in jobs[:2]:
+        job.status = RUNNING
+        job.started_at = time.time()
+    info = manager.describe(jobs[2], include_results=False)
+    assert info["status"] == QUEUED
+    assert info["queue_position"] == 1
+    assert 59 <= info["estimated_wait_seconds"] <= 60
+
+def test_jobs_run_at_most_max_running_at_once():
+    async def main():
+        loop = asyncio.get_running_loop()
+        manager = JobManager(lambda coro: asyncio.run_coroutine_threadsafe(coro, loop),
+                             max_running=1, queue_size=10, max_per_client=10)
+        running = []
+
+        async def work(job):
+            running.append(job.id)
+            assert len(running) == 1
+            await asyncio.sleep(0.01)
+            running.remove(job.id)
+            return []
+
+        jobs = [manager.submit({}, 1, work) for _ in range(3)]
+        await asyncio.gather(*(asyncio.wrap_future(job.future) for job in jobs))
+        assert all(job.status == COMPLETED for job in jobs)
+    asyncio.run(main())
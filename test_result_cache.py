@@ -0,0 +1,57 @@
+import sys
+import os
+import asyncio
+import time
+
+sys.path.append(os.getcwd())
+from scraper.core.result_cache import ResultCache
+
+def counting_run(calls, result=None, delay=0.05):
+    async def run():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return result if result is not None else {"website": "site", "items_scraped": len(calls)}
+    return run
+
+def test_concurrent_requests_share_one_run():
+    async def main():
+        cache = ResultCache()
+        calls = []
+        run = counting_run(calls)
+        first, second = await asyncio.gather(cache.get_or_run(("news", "site"), 60, run),
+                                             cache.get_or_run(("news", "site"), 60, run))
+        assert len(calls) == 1
+        assert first == {"website": "site", "items_scraped": 1}
+        assert second["shared"] and second["items_scraped"] == 1
+        assert cache.stats()["coalesced"] == 1 and cache.stats()["in_flight"] == 0
+    asyncio.run(main())
+
+def test_result_reused_until_ttl():
+    async def main():
+        cache = ResultCache()
+        calls = []
+        run = counting_run(calls, delay=0)
+        await cache.get_or_run("site", 60, run)
+        cached = await cache.get_or_run("site", 60, run)
+        assert len(calls) == 1 and cached["cached"] and "cached_at" in cached
+
+        # refresh bypasses the cached result
+        await cache.get_or_run("site", 60, run, refresh=True)
+        assert len(calls) == 2
+
+        # An expired entry is scraped again
+        expires_at, finished_at, result = cache._results["site"]
+        cache._results["site"] = (time.time() - 1, finished_at, result)
+        assert "cached" not in await cache.get_or_run("site", 60, run)
+        assert len(calls) == 3
+    asyncio.run(main())
+
+def test_failed_runs_are_not_cached():
+    async def main():
+        cache = ResultCache()
+        calls = []
+        run = counting_run(calls, result={"website": "site", "error": "blocked"}, delay=0)
+        await cache.get_or_run("site", 60, run)
+        await cache.get_or_run("site", 60, run)
+        assert len(calls) == 2 and cache.stats()["entries"] == 0
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+import sys
+import os
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+from scraper.core.result_store import ResultStore, parse_timestamp
+
+def new_store(tmp, **kwargs):
+    return ResultStore(os.path.join(tmp, "results.db"), **kwargs)
+
+def test_cursor_pagination():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = new_store(tmp)
+        store.add([{"title": f"item {i}"} for i in range(5)], "news", "bbc", "run-1")
+
+        titles, cursor = [], None
+        while True:
+            page, cursor = store.query(cursor=cursor, limit=2)
+            titles += [entry["item"]["title"] for entry in page]
+            if cursor is None:
+                break
+        assert titles == [f"item {i}" for i in reversed(range(5))]
+
+        page, cursor = store.query(limit=5, newest_first=False)
+        assert [entry["item"]["title"] for entry in page] == [f"item {i}" for i in range(5)]
+        assert cursor is None
+
+def test_filters_and_fields():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = new_store(tmp)
+        store.add([{"title": "a", "price": 1}], "real_estate", "bayut", "run-1")
+        store.add([{"title": "b", "price": 2}], "news", "bbc", "run-2")
+
+        page, _ = store.query(category="real_estate")
+        assert [entry["item"]["title"] for entry in page] == ["a"]
+        page, _ = store.query(website="bbc", fields=["title"])
+        assert page[0]["item"] == {"title": "b"} and page[0]["run_id"] == "run-2"
+        assert store.run_items("run-1") == [{"title": "a", "price": 1}]
+
+def test_time_filters_use_store_time():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = new_store(tmp)
+        before = time.time() - 1
+        # scraped_at as two scrapers set it: loop time and a space-separated datetime
+        store.add([{"title": "a", "scraped_at": "12345.6"}, {"title": "b", "scraped_at": "2020-01-01 10:00:00"}],
+                  "real_estate", "dubizzle", "run-1")
+
+        page, _ = store.query(since=str(before))
+        assert len(page) == 2
+        page, _ = store.query(until="2000-01-01T00:00:00Z")
+        assert page == []
+        page, _ = store.query(since="2000-01-01T00:00:00+02:00", until=str(time.time() + 60))
+        assert len(page) == 2
+
+def test_invalid_arguments():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = new_store(tmp)
+        for kwargs in ({"limit": 0}, {"cursor": "abc"}, {"since": "yesterday"}, {"until": "nan"}):
+            try:
+                store.query(**kwargs)
+                assert False, f"{kwargs} accepted"
+            except ValueError:
+                pass
+
+def test_parse_timestamp():
+    assert parse_timestamp("1700000000") == 1700000000.0
+    assert parse_timestamp("1970-01-01T00:01:00") == 60.0
+    assert parse_timestamp("1970-01-01T01:00:00+01:00") == 0.0
@@ -0,0 +1,42 @@
+import sys
+import os
+import asyncio
+import tempfile
+
+sys.path.append(os.getcwd())
+from scraper.core.seen_store import SeenStore
+
+def test_add_sync_and_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "state.json")
+        store = SeenStore(path, sync_every=100)
+        store.add("https://a.com/1")
+        # Only buffered until the next sync
+        assert "https://a.com/1" not in SeenStore(path)
+        store.sync()
+        assert "https://a.com/1" in SeenStore(path)
+
+def test_sync_runs_off_the_event_loop():
+    async def run(path):
+        store = SeenStore(path, sync_every=2)
+        store.add("https://a.com/1")
+        store.add("https://a.com/2")
+        await store._sync_task
+        return len(SeenStore(path))
+    with tempfile.TemporaryDirectory() as tmp:
+        assert asyncio.run(run(os.path.join(tmp, "state.json"))) == 2
+
+def test_compaction_keeps_other_writers_urls():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "state.json")
+        # Two processes' stores on the same state file
+        first = SeenStore(path, compact_threshold=3)
+        second = SeenStore(path, compact_threshold=3)
+        second.add("https://a.com/other")
+        second.sync()
+        for i in range(3):
+            first.add(f"https://a.com/{i}")
+        first.sync()
+        assert os.path.getsize(path + ".journal") == 0
+        reloaded = SeenStore(path)
+        assert len(reloaded) == 4 and "https://a.com/other" in reloaded
@@ -0,0 +1,80 @@
+import sys
+import os
+import tempfile
+
+sys.path.append(os.getcwd())
+from scraper.core.task_queue import SQLiteTaskQueue, PENDING, LEASED, DONE, FAILED
+
+def new_queue(tmp):
+    return SQLiteTaskQueue(os.path.join(tmp, "tasks.db"))
+
+def test_lease_and_complete():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = new_queue(tmp)
+        first = queue.put({"website": "a"})
+        queue.put({"website": "b"})
+
+        task = queue.lease("w1")
+        assert task.id == first and task.payload == {"website": "a"} and task.attempts == 1
+        assert queue.lease("w2").payload == {"website": "b"}
+        assert queue.lease("w3") is None
+
+        queue.complete(task.id, "w1", {"items_scraped": 3})
+        stats = queue.stats()
+        assert stats[DONE] == 1 and stats[LEASED] == 1
+        assert queue.unfinished() == 1
+
+def test_heartbeat_and_reclaim():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = new_queue(tmp)
+        queue.put({"website": "a"})
+        task = queue.lease("w1", lease_seconds=-1)
+        assert queue.heartbeat(task.id, "w1", lease_seconds=-1)
+
+        # The expired lease goes to another worker; the first one has lost it
+        reclaimed = queue.lease("w2")
+        assert reclaimed.id == task.id and reclaimed.attempts == 2
+        assert not queue.heartbeat(task.id, "w1")
+        assert queue.heartbeat(task.id, "w2")
+
+        # A stale worker cannot complete or fail a task it no longer holds
+        queue.fail(task.id, "w1", "late")
+        assert queue.stats()[LEASED] == 1
+
+def test_fail_retries_until_max_attempts():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = new_queue(tmp)
+        queue.put({"website": "a"})
+        task = queue.lease("w1")
+        queue.fail(task.id, "w1", "blocked", max_attempts=2)
+        assert queue.stats()[PENDING] == 1
+
+        task = queue.lease("w1")
+        assert task.attempts == 2
+        queue.fail(task.id, "w1", "blocked", max_attempts=2)
+        assert queue.stats()[FAILED] == 1
+        assert queue.lease("w1") is None
+
+def test_reclaim_stops_at_max_attempts():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = new_queue(tmp)
+        queue.put({"website": "a"})
+        # Every worker hangs until its lease expires
+        for attempt in (1, 2):
+            assert queue.lease(f"w{attempt}", lease_seconds=-1, max_attempts=2).attempts == attempt
+        assert queue.lease("w3", max_attempts=2) is None
+        stats = queue.stats()
+        assert stats[FAILED] == 1 and queue.unfinished() == 0
+
+def test_finished_task_is_not_reopened():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = new_queue(tmp)
+        queue.put({"website": "a"})
+        task = queue.lease("w1")
+        queue.complete(task.id, "w1", {"items_scraped": 1})
+        # A duplicate report from the same worker leaves the finished task alone
+        queue.fail(task.id, "w1", "late")
+        queue.complete(task.id, "w1", {"items_scraped": 0})
+        stats = queue.stats()
+        assert stats[DONE] == 1 and stats[PENDING] == 0
+        assert queue.lease("w2") is None
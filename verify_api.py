@@ -27,7 +27,8 @@ def test_scrape_filmibeat():
         "category": "bollywood",
         "websites": ["filmibeat"],
         "dataTypes": ["text"],
-        "outputFormat": "json"
+        "outputFormat": "json",
+        "wait": True
     }
     
     try:
@@ -45,8 +46,10 @@ def test_scrape_filmibeat():
                 print(f"Website: {res.get('website')}")
                 print(f"Items Scraped: {res.get('items_scraped')}")
                 # Print first item title if available
-                if res.get("data") and len(res.get("data")) > 0:
-                    print(f"First Item: {res.get('data')[0].get('title')}")
+                if res.get("run_id"):
+                    page = requests.get(f"{BASE_URL}/results", params={"run_id": res["run_id"], "limit": 1, "fields": "title"}).json()
+                    if page.get("items"):
+                        print(f"First Item: {page['items'][0]['item'].get('title')}")
         else:
             print(f"❌ Scraping Failed: {data.get('error')}")
             